@@ -0,0 +1,103 @@
+"""Benchmark sprint capacity math: day-by-day walk vs. day bitmaps.
+
+Run with ``uv run python benchmarks/bench_workdays.py``. Builds a synthetic
+team with several leave events per person over a long range and times the
+per-member off-day count both ways. Both must agree before timings print.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from datetime import date, timedelta
+
+from dateutil.parser import parse as parse_date
+
+from mcp_atlassian_extended.workdays import DayRange
+
+
+def _events(members: int, per_member: int, start: date, days: int) -> list[dict]:
+    events = []
+    for m in range(members):
+        for k in range(per_member):
+            first = start + timedelta((m * 7 + k * 23) % days)
+            last = first + timedelta((m + k) % 9)
+            events.append(
+                {
+                    "person_name": f"Member {m:03d}",
+                    "start_date": first.isoformat(),
+                    "end_date": last.isoformat(),
+                }
+            )
+    return events
+
+
+def _walk(start: str, end: str, members: list[str], events: list[dict], wdpw: int) -> list[int]:
+    """The original implementation: parse and walk every day of every event."""
+    start_dt, end_dt = parse_date(start), parse_date(end)
+    weekend_days = set(range(wdpw, 7))
+    total_days = 0
+    current = start_dt
+    while current <= end_dt:
+        if current.weekday() not in weekend_days:
+            total_days += 1
+        current += timedelta(days=1)
+    result = [total_days]
+    for member in members:
+        member_events = [e for e in events if e["person_name"] == member]
+        off_dates: set[str] = set()
+        for event in member_events:
+            d = max(parse_date(event["start_date"]), start_dt)
+            ev_end = min(parse_date(event["end_date"]), end_dt)
+            while d <= ev_end:
+                if d.weekday() not in weekend_days:
+                    off_dates.add(d.strftime("%Y-%m-%d"))
+                d += timedelta(days=1)
+        result.append(len(off_dates))
+    return result
+
+
+def _bitmap(start: str, end: str, members: list[str], events: list[dict], wdpw: int) -> list[int]:
+    sprint = DayRange(start, end, wdpw)
+    result = [sprint.working_days]
+    for member in members:
+        member_events = [e for e in events if e["person_name"] == member]
+        result.append(sprint.off_days((e["start_date"], e["end_date"]) for e in member_events))
+    return result
+
+
+def _time(fn, *args, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    start = date(2024, 1, 1)
+    header = ("members", "days", "events", "walk ms", "bitmap ms", "speedup")
+    print(" ".join(f"{h:>10}" for h in header))
+    for members, days, per_member in ((10, 14, 2), (30, 91, 6), (100, 365, 12), (300, 730, 20)):
+        names = [f"Member {m:03d}" for m in range(members)]
+        events = _events(members, per_member, start, days)
+        end = (start + timedelta(days - 1)).isoformat()
+        call = (start.isoformat(), end, names, events, 5)
+        if _walk(*call) != _bitmap(*call):
+            msg = "bitmap result differs from day-by-day walk"
+            raise SystemExit(msg)
+        walk = _time(_walk, *call, repeat=args.repeat)
+        bitmap = _time(_bitmap, *call, repeat=args.repeat)
+        print(
+            f"{members:>10} {days:>10} {len(events):>10} {walk * 1000:>10.2f} "
+            f"{bitmap * 1000:>10.2f} {walk / bitmap:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -32,6 +32,18 @@ from dotenv import load_dotenv
     "--confluence-api-token", envvar="CONFLUENCE_API_TOKEN", help="Confluence API token (Cloud)"
 )
 @click.option("--read-only", is_flag=True, help="Disable write operations")
+@click.option(
+    "--rate-limit",
+    envvar="ATLASSIAN_RATE_LIMIT",
+    type=float,
+    help="Client-side request rate limit per host, requests/second (0 disables)",
+)
+@click.option(
+    "--rate-burst",
+    envvar="ATLASSIAN_RATE_BURST",
+    type=float,
+    help="Requests allowed in a burst before rate limiting smooths them",
+)
 def main(
     transport: str,
     port: int,
@@ -45,6 +57,8 @@ def main(
     confluence_username: str | None,
     confluence_api_token: str | None,
     read_only: bool,
+    rate_limit: float | None,
+    rate_burst: float | None,
 ) -> None:
     """Run the Atlassian Extended MCP server."""
     load_dotenv()
@@ -67,6 +81,10 @@ def main(
         os.environ["CONFLUENCE_API_TOKEN"] = confluence_api_token
     if read_only:
         os.environ["ATLASSIAN_READ_ONLY"] = "true"
+    if rate_limit is not None:
+        os.environ["ATLASSIAN_RATE_LIMIT"] = str(rate_limit)
+    if rate_burst is not None:
+        os.environ["ATLASSIAN_RATE_BURST"] = str(rate_burst)
 
     logging.basicConfig(
         level=logging.INFO,
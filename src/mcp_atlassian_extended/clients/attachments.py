@@ -0,0 +1,155 @@
+"""Content-addressed on-disk cache of downloaded attachments."""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+# Bump when the schema changes; the index is a cache, so an old one is rebuilt.
+_SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS blobs (
+    sha256 TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS blobs_lru ON blobs (last_used);
+CREATE TABLE IF NOT EXISTS keys (
+    key TEXT PRIMARY KEY,
+    sha256 TEXT NOT NULL
+);
+"""
+
+
+class AttachmentCache:
+    """Attachment bodies stored once per SHA-256 under ``directory``, evicted LRU.
+
+    ``keys`` maps an attachment key (its ID — Jira attachments never change
+    content) to a blob; several keys may share one blob. Blobs live at
+    ``blobs/<sha[:2]>/<sha>`` and the index in ``index.db``. This class only
+    keeps the index: callers place and remove the files themselves (off the
+    event loop) using ``blob_path`` and the paths returned by ``record``.
+    Methods commit to SQLite, so async callers run them in a worker thread;
+    a lock serializes them. Index totals are recounted after each change, so
+    ``stats`` reads memory only and is safe to call on the event loop.
+    """
+
+    def __init__(self, directory: str | Path, max_bytes: int) -> None:
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._db = sqlite3.connect(self.directory / "index.db", check_same_thread=False)
+        self._lock = threading.RLock()
+        (version,) = self._db.execute("PRAGMA user_version").fetchone()
+        if version != _SCHEMA_VERSION:
+            self._db.executescript("DROP TABLE IF EXISTS blobs; DROP TABLE IF EXISTS keys;")
+            self._db.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+        self._db.executescript(_SCHEMA)
+        self._stats = {"hits": 0, "misses": 0, "stored": 0, "evictions": 0}
+        self._totals = (0, 0, 0)
+        self._count()
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def blob_path(self, sha256: str) -> Path:
+        return self.directory / "blobs" / sha256[:2] / sha256
+
+    def lookup(self, key: str, size: int | None = None) -> tuple[Path, str, int] | None:
+        """``(blob path, sha256, size)`` for ``key``, or ``None`` on a miss.
+
+        An entry whose size differs from ``size`` (when given) or whose blob
+        file is gone counts as a miss and is dropped.
+        """
+        with self._lock:
+            return self._lookup(key, size)
+
+    def _lookup(self, key: str, size: int | None) -> tuple[Path, str, int] | None:
+        row = self._db.execute(
+            "SELECT b.sha256, b.size FROM keys k JOIN blobs b ON b.sha256 = k.sha256"
+            " WHERE k.key = ?",
+            (key,),
+        ).fetchone()
+        if row is not None:
+            sha, blob_size = row
+            blob = self.blob_path(sha)
+            if (size is None or size == blob_size) and blob.is_file():
+                with self._db:
+                    self._db.execute(
+                        "UPDATE blobs SET last_used = ? WHERE sha256 = ?", (time.time(), sha)
+                    )
+                self._stats["hits"] += 1
+                return blob, sha, blob_size
+            self.forget(key)
+        self._stats["misses"] += 1
+        return None
+
+    def forget(self, key: str) -> None:
+        with self._lock:
+            with self._db:
+                self._db.execute("DELETE FROM keys WHERE key = ?", (key,))
+            self._count()
+
+    def record(self, key: str, sha256: str, size: int) -> list[Path]:
+        """Map ``key`` to a blob already written at ``blob_path(sha256)``.
+
+        Returns the blob files evicted to stay within ``max_bytes`` — least
+        recently used first, possibly including this one if it alone is over
+        the cap. The caller deletes them.
+        """
+        with self._lock:
+            return self._record(key, sha256, size)
+
+    def _record(self, key: str, sha256: str, size: int) -> list[Path]:
+        with self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO blobs (sha256, size, last_used) VALUES (?, ?, ?)",
+                (sha256, size, time.time()),
+            )
+            self._db.execute(
+                "INSERT OR REPLACE INTO keys (key, sha256) VALUES (?, ?)", (key, sha256)
+            )
+        self._stats["stored"] += 1
+        evicted = self._evict()
+        self._count()
+        return evicted
+
+    def _evict(self) -> list[Path]:
+        (total,) = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()
+        evicted: list[Path] = []
+        if total <= self.max_bytes:
+            return evicted
+        rows = self._db.execute("SELECT sha256, size FROM blobs ORDER BY last_used").fetchall()
+        with self._db:
+            for sha, size in rows:
+                if total <= self.max_bytes:
+                    break
+                self._db.execute("DELETE FROM keys WHERE sha256 = ?", (sha,))
+                self._db.execute("DELETE FROM blobs WHERE sha256 = ?", (sha,))
+                evicted.append(self.blob_path(sha))
+                total -= size
+        self._stats["evictions"] += len(evicted)
+        return evicted
+
+    def _count(self) -> None:
+        blobs, total = self._db.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM blobs"
+        ).fetchone()
+        (keys,) = self._db.execute("SELECT COUNT(*) FROM keys").fetchone()
+        self._totals = (blobs, keys, total)
+
+    def stats(self) -> dict[str, Any]:
+        blobs, keys, total = self._totals
+        return {
+            "directory": str(self.directory),
+            "blobs": blobs,
+            "keys": keys,
+            "size_mb": round(total / (1024 * 1024), 2),
+            "max_mb": round(self.max_bytes / (1024 * 1024), 2),
+            **self._stats,
+        }
@@ -0,0 +1,319 @@
+"""Shared HTTP transport for the Jira and Confluence clients."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from contextlib import AsyncExitStack
+from typing import Any
+
+import httpx
+
+from ..config import ConfluenceConfig, JiraConfig
+from ..exceptions import AtlassianApiError, AtlassianAuthError
+from .breaker import FAILURE_STATUSES, CircuitBreakers
+from .bulkhead import Bulkhead
+from .conditional import ConditionalStore
+from .ratelimit import TokenBucket
+from .retry import RetryPolicy
+from .singleflight import SingleFlight
+
+_log = logging.getLogger(__name__)
+
+# Indirection so tests can skip real backoff sleeps.
+_sleep = asyncio.sleep
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """Response body that exits ``slot`` (its bulkhead slot) when it is closed."""
+
+    def __init__(self, stream: Any, slot: AsyncExitStack) -> None:
+        self._stream = stream
+        self._slot = slot
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            await self._slot.aclose()
+
+
+class AtlassianHttpClient:
+    """Async HTTP client with the retry loop every Atlassian request goes through.
+
+    ``rate_limiter`` is the token bucket for the client's host; it is shared
+    with other clients on that host and comes from the server lifespan. The
+    bulkhead is per client and caps how many requests are in flight at once;
+    circuit breakers per endpoint family fail fast while the server is down.
+    GET responses carrying ``ETag``/``Last-Modified`` are remembered and
+    revalidated with conditional requests, so unchanged bodies are not
+    transferred again. Identical GETs issued concurrently share one request
+    through ``single_flight``.
+    """
+
+    product = "Atlassian"
+
+    def __init__(
+        self,
+        config: JiraConfig | ConfluenceConfig,
+        *,
+        rate_limiter: TokenBucket | None = None,
+    ) -> None:
+        self.config = config
+        self.rate_limiter = rate_limiter
+        self.bulkhead = (
+            Bulkhead(
+                self.product,
+                self.config.max_concurrency,
+                self.config.max_queue,
+                self.config.queue_timeout,
+            )
+            if self.config.max_concurrency > 0
+            else None
+        )
+        self.breakers = (
+            CircuitBreakers(
+                self.product,
+                self.config.breaker_threshold,
+                self.config.breaker_window,
+                self.config.breaker_min_calls,
+                self.config.breaker_cooldown,
+            )
+            if self.config.breaker_window > 0 and self.config.breaker_threshold > 0
+            else None
+        )
+        self.single_flight = SingleFlight()
+        self.conditional = (
+            ConditionalStore(int(self.config.etag_cache_mb * 1024 * 1024))
+            if self.config.etag_cache_mb > 0
+            else None
+        )
+        limits = (
+            httpx.Limits(
+                max_connections=self.config.max_concurrency,
+                max_keepalive_connections=self.config.max_concurrency,
+            )
+            if self.bulkhead is not None
+            else httpx.Limits()
+        )
+        headers = {"Content-Type": "application/json", **self.config.auth_header}
+        self._client = httpx.AsyncClient(
+            base_url=self.config.url,
+            headers=headers,
+            timeout=self.config.timeout,
+            verify=self.config.ssl_verify,
+            limits=limits,
+        )
+        self.retry_policy = RetryPolicy(
+            max_retries=self.config.max_retries,
+            backoff_base=self.config.retry_backoff,
+            max_wait=self.config.retry_max_wait,
+        )
+        self._stats = {
+            "requests": 0,
+            "retries": 0,
+            "retried_requests": 0,
+            "retries_exhausted": 0,
+        }
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+    def stats(self) -> dict[str, Any]:
+        """Snapshot of request counters for diagnostics."""
+        data: dict[str, Any] = {
+            "retry": dict(self._stats),
+            "single_flight": self.single_flight.stats(),
+        }
+        if self.rate_limiter is not None:
+            data["rate_limiter"] = self.rate_limiter.stats()
+        if self.bulkhead is not None:
+            data["bulkhead"] = self.bulkhead.stats()
+        if self.breakers is not None:
+            data["circuit_breakers"] = self.breakers.stats()
+        if self.conditional is not None:
+            data["conditional"] = self.conditional.stats()
+        return data
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        *,
+        idempotent: bool | None = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Send a request, retrying throttled and transient failures per the retry policy.
+
+        The final response is returned whatever its status; the number of
+        retries spent on it is recorded in ``response.extensions["retries"]``.
+        Pass ``idempotent=True`` to opt a POST into retries.
+
+        GETs are sent conditionally when a validated body for the same URL is
+        stored; a 304 answer is returned as the stored 200 response.
+
+        With ``stream=True`` the body is not read: the caller must read it
+        (``aiter_bytes``) and close the response. Streamed GETs bypass the
+        conditional store, which needs the whole body.
+        """
+        if method != "GET" or self.conditional is None or kwargs.get("stream"):
+            return await self._send_with_retries(method, url, idempotent=idempotent, **kwargs)
+        key = self._request_key(method, url, kwargs.get("params"))
+        entry = self.conditional.lookup(key)
+        if entry is not None:
+            kwargs["headers"] = {**entry.conditional_headers(), **(kwargs.get("headers") or {})}
+        resp = await self._send_with_retries(method, url, idempotent=idempotent, **kwargs)
+        return self.conditional.resolve(key, entry, resp)
+
+    def _request_key(self, method: str, url: str, params: Any = None) -> str:
+        """Identify a request by method and absolute URL including the query string."""
+        return f"{method} {self._client.build_request(method, url, params=params).url}"
+
+    async def _send_with_retries(
+        self,
+        method: str,
+        url: str,
+        *,
+        idempotent: bool | None = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        policy = self.retry_policy
+        retryable = policy.allows(method, idempotent)
+        attempt = 0
+        waited = 0.0
+        self._stats["requests"] += 1
+        while True:
+            resp: httpx.Response | None = None
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire()
+            try:
+                resp = await self._request_once(method, url, **kwargs)
+            except httpx.TransportError as e:
+                if not retryable or attempt >= policy.max_retries:
+                    self._record(attempt, exhausted=attempt > 0)
+                    raise
+                delay = policy.delay(attempt)
+                reason = type(e).__name__
+                if waited + delay > policy.max_wait:
+                    self._record(attempt, exhausted=True)
+                    raise
+            else:
+                if self.rate_limiter is not None:
+                    self.rate_limiter.observe(resp)
+                resp.extensions["retries"] = attempt
+                if (
+                    resp.status_code not in policy.statuses
+                    or not retryable
+                    or attempt >= policy.max_retries
+                ):
+                    self._record(attempt, exhausted=attempt > 0 and not resp.is_success)
+                    return resp
+                delay = policy.delay(attempt, resp)
+                reason = str(resp.status_code)
+                if waited + delay > policy.max_wait:
+                    _log.warning(
+                        "%s %s: server asked to wait %.1fs, over the remaining %.1fs retry budget",
+                        method,
+                        url,
+                        delay,
+                        policy.max_wait - waited,
+                    )
+                    self._record(attempt, exhausted=True)
+                    return resp
+
+            if resp is not None:
+                await resp.aclose()
+            attempt += 1
+            waited += delay
+            self._stats["retries"] += 1
+            _log.info(
+                "Retrying %s %s after %s (attempt %d/%d, sleeping %.2fs)",
+                method,
+                url,
+                reason,
+                attempt,
+                policy.max_retries,
+                delay,
+            )
+            await _sleep(delay)
+
+    async def _request_once(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Issue a single HTTP request through the circuit breaker for its endpoint family.
+
+        5xx responses and transport errors count as failures, 429 is neutral.
+        Failed responses carry the breaker state in ``extensions["circuit"]``.
+        """
+        if self.breakers is None:
+            return await self._dispatch(method, url, **kwargs)
+        breaker = self.breakers.for_url(url)
+        probe = breaker.before_request()
+        try:
+            resp = await self._dispatch(method, url, **kwargs)
+        except httpx.TransportError:
+            breaker.record(False, probe=probe)
+            raise
+        except BaseException:
+            breaker.record(None, probe=probe)
+            raise
+        healthy = resp.status_code not in FAILURE_STATUSES
+        breaker.record(None if resp.status_code == 429 else healthy, probe=probe)
+        if not healthy:
+            resp.extensions["circuit"] = breaker.snapshot()
+        return resp
+
+    async def _dispatch(
+        self, method: str, url: str, *, stream: bool = False, **kwargs: Any
+    ) -> httpx.Response:
+        """Send one HTTP request inside a bulkhead slot.
+
+        With ``stream=True`` the slot is held until the response is closed,
+        since the body keeps its pooled connection until then; the pool is
+        sized to the bulkhead, so a request that got a slot never waits on it.
+        """
+        if self.bulkhead is None:
+            return await self._open(method, url, stream, kwargs)
+        if not stream:
+            async with self.bulkhead.slot():
+                return await self._open(method, url, stream, kwargs)
+        slot = AsyncExitStack()
+        await slot.enter_async_context(self.bulkhead.slot())
+        try:
+            resp = await self._open(method, url, stream, kwargs)
+        except BaseException:
+            await slot.aclose()
+            raise
+        resp.stream = _ReleasingStream(resp.stream, slot)
+        return resp
+
+    async def _open(
+        self, method: str, url: str, stream: bool, kwargs: dict[str, Any]
+    ) -> httpx.Response:
+        if not stream:
+            return await self._client.request(method, url, **kwargs)
+        request = self._client.build_request(method, url, **kwargs)
+        return await self._client.send(request, stream=True)
+
+    def _record(self, retries: int, *, exhausted: bool) -> None:
+        if retries:
+            self._stats["retried_requests"] += 1
+        if exhausted:
+            self._stats["retries_exhausted"] += 1
+
+    @staticmethod
+    def _raise_for_status(resp: httpx.Response) -> None:
+        """Raise the matching Atlassian exception for a non-success response."""
+        if resp.is_success:
+            return
+        error: AtlassianApiError
+        if resp.status_code in (401, 403):
+            error = AtlassianAuthError(resp.status_code, resp.text)
+        else:
+            error = AtlassianApiError(resp.status_code, resp.reason_phrase or "", resp.text)
+        error.retries = resp.extensions.get("retries", 0)
+        error.circuit = resp.extensions.get("circuit")
+        raise error
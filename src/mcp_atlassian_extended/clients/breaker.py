@@ -0,0 +1,168 @@
+"""Circuit breakers per endpoint family — fail fast while an upstream is unhealthy."""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from typing import Any
+
+import httpx
+
+from ..exceptions import CircuitOpenError
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Responses that say the upstream itself is unhealthy. 4xx and 429 are the
+# caller's problem or plain throttling and never trip a breaker.
+FAILURE_STATUSES = frozenset({500, 502, 503, 504})
+
+
+def endpoint_family(url: str) -> str:
+    """Group a request URL by REST API, e.g. ``api/2``, ``agile/1.0``, ``calendar-services/1.0``.
+
+    Anything outside ``/rest/`` (attachment content under ``/secure/``) is ``web``.
+    """
+    parts = httpx.URL(url).path.strip("/").split("/")
+    if "rest" in parts:
+        i = parts.index("rest")
+        family = "/".join(parts[i + 1 : i + 3])
+        if family:
+            return family
+    return "web"
+
+
+class CircuitBreaker:
+    """Failure-rate breaker over a sliding window of the most recent outcomes.
+
+    Opens once at least ``min_calls`` outcomes are recorded and the failure
+    share reaches ``threshold``. While open every request fails fast with
+    ``CircuitOpenError``; after ``cooldown`` seconds one probe is let through
+    (half-open) — success closes the circuit, failure reopens it.
+    """
+
+    def __init__(
+        self,
+        upstream: str,
+        family: str,
+        threshold: float,
+        window: int,
+        min_calls: int,
+        cooldown: float,
+    ) -> None:
+        self.upstream = upstream
+        self.family = family
+        self.threshold = threshold
+        self.min_calls = min_calls
+        self.cooldown = cooldown
+        self._outcomes: deque[bool] = deque(maxlen=window)
+        self._opened_at = 0.0
+        self._open = False
+        self._probing = False
+        self._stats = {"opened": 0, "rejected": 0}
+
+    @property
+    def state(self) -> str:
+        if not self._open:
+            return CLOSED
+        if time.monotonic() - self._opened_at >= self.cooldown:
+            return HALF_OPEN
+        return OPEN
+
+    @property
+    def failure_rate(self) -> float:
+        if not self._outcomes:
+            return 0.0
+        return self._outcomes.count(False) / len(self._outcomes)
+
+    def retry_after(self) -> float:
+        return max(0.0, self._opened_at + self.cooldown - time.monotonic())
+
+    def before_request(self) -> bool:
+        """Admit a request or raise ``CircuitOpenError``. Returns True for a half-open probe."""
+        state = self.state
+        if state == CLOSED:
+            return False
+        if state == HALF_OPEN and not self._probing:
+            self._probing = True
+            return True
+        self._stats["rejected"] += 1
+        raise CircuitOpenError(
+            self.upstream,
+            self.family,
+            self.failure_rate,
+            self.retry_after() if state == OPEN else 0.0,
+        )
+
+    def record(self, success: bool | None, *, probe: bool = False) -> None:
+        """Record an outcome. ``None`` releases a probe without counting (e.g. cancelled)."""
+        if probe:
+            self._probing = False
+        if success is None:
+            return
+        if probe:
+            if success:
+                self._open = False
+                self._outcomes.clear()
+            else:
+                self._trip()
+            return
+        self._outcomes.append(success)
+        if (
+            not self._open
+            and len(self._outcomes) >= self.min_calls
+            and self.failure_rate >= self.threshold
+        ):
+            self._trip()
+
+    def _trip(self) -> None:
+        self._open = True
+        self._opened_at = time.monotonic()
+        self._stats["opened"] += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        """Compact state for error payloads."""
+        data: dict[str, Any] = {
+            "family": self.family,
+            "state": self.state,
+            "failure_rate": round(self.failure_rate, 2),
+        }
+        if data["state"] == OPEN:
+            data["retry_after_seconds"] = round(self.retry_after(), 1)
+        return data
+
+    def stats(self) -> dict[str, Any]:
+        return {**self.snapshot(), "window_calls": len(self._outcomes), **self._stats}
+
+
+class CircuitBreakers:
+    """Lazily created breakers, one per endpoint family of a single upstream."""
+
+    def __init__(
+        self, upstream: str, threshold: float, window: int, min_calls: int, cooldown: float
+    ) -> None:
+        self.upstream = upstream
+        self.threshold = threshold
+        self.window = window
+        self.min_calls = min_calls
+        self.cooldown = cooldown
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    def for_url(self, url: str) -> CircuitBreaker:
+        family = endpoint_family(url)
+        breaker = self._breakers.get(family)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                self.upstream,
+                family,
+                self.threshold,
+                self.window,
+                self.min_calls,
+                self.cooldown,
+            )
+            self._breakers[family] = breaker
+        return breaker
+
+    def stats(self) -> dict[str, Any]:
+        return {family: breaker.stats() for family, breaker in self._breakers.items()}
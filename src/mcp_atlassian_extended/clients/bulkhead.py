@@ -0,0 +1,97 @@
+"""Concurrency bulkhead — caps in-flight requests per upstream with a bounded wait queue."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+from ..exceptions import BulkheadFullError
+
+
+class Bulkhead:
+    """Semaphore-based limit on concurrent requests to one upstream.
+
+    At most ``max_concurrent`` requests run at once. Up to ``max_queue``
+    more may wait for a slot, each for at most ``queue_timeout`` seconds;
+    anything beyond that is rejected immediately with ``BulkheadFullError``
+    rather than piling up behind a slow node.
+    """
+
+    def __init__(
+        self, name: str, max_concurrent: int, max_queue: int, queue_timeout: float
+    ) -> None:
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._active = 0
+        self._waiting = 0
+        self._stats = {
+            "acquired": 0,
+            "rejected": 0,
+            "timeouts": 0,
+            "peak_active": 0,
+            "peak_waiting": 0,
+            "wait_seconds": 0.0,
+            "max_wait_seconds": 0.0,
+        }
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[float]:
+        """Hold one concurrency slot for the duration of the block. Yields seconds queued."""
+        start = time.monotonic()
+        if self._semaphore.locked():
+            await self._wait_for_slot()
+        else:
+            # Free slot: acquire() returns without suspending.
+            await self._semaphore.acquire()
+
+        waited = time.monotonic() - start
+        self._active += 1
+        self._stats["acquired"] += 1
+        self._stats["peak_active"] = max(self._stats["peak_active"], self._active)
+        self._stats["wait_seconds"] += waited
+        self._stats["max_wait_seconds"] = max(self._stats["max_wait_seconds"], waited)
+        try:
+            yield waited
+        finally:
+            self._active -= 1
+            self._semaphore.release()
+
+    async def _wait_for_slot(self) -> None:
+        if self._waiting >= self.max_queue:
+            self._stats["rejected"] += 1
+            raise BulkheadFullError(self.name, "queue full", self._active, self._waiting)
+        self._waiting += 1
+        self._stats["peak_waiting"] = max(self._stats["peak_waiting"], self._waiting)
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), self.queue_timeout)
+        except asyncio.TimeoutError:
+            self._stats["timeouts"] += 1
+            raise BulkheadFullError(
+                self.name,
+                f"no slot within {self.queue_timeout:g}s",
+                self._active,
+                self._waiting - 1,
+            ) from None
+        finally:
+            self._waiting -= 1
+
+    def stats(self) -> dict[str, Any]:
+        acquired = self._stats["acquired"]
+        return {
+            "max_concurrent": self.max_concurrent,
+            "max_queue": self.max_queue,
+            "active": self._active,
+            "waiting": self._waiting,
+            **self._stats,
+            "wait_seconds": round(self._stats["wait_seconds"], 3),
+            "max_wait_seconds": round(self._stats["max_wait_seconds"], 3),
+            "avg_wait_seconds": round(self._stats["wait_seconds"] / acquired, 4)
+            if acquired
+            else 0.0,
+        }
@@ -0,0 +1,133 @@
+"""Precomputed index over the Confluence calendar list."""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+LEAVE_KEYWORDS = ("vacation", "time off", "leaves", "time-off", "pto")
+
+
+def _is_leave_name(name: str) -> bool:
+    lower = name.lower()
+    return any(kw in lower for kw in LEAVE_KEYWORDS)
+
+
+@dataclass(frozen=True)
+class CalendarEntry:
+    """One top-level calendar wrapper with the lookups the calendar tools need."""
+
+    id: str
+    name: str
+    type: str
+    space_key: str
+    space_name: str
+    child_ids: tuple[str, ...]
+    # Sub-calendar IDs to query for leave events; empty for non-leave calendars.
+    leave_ids: tuple[str, ...]
+    is_leave: bool
+    wrapper: dict = field(repr=False, compare=False)
+    _name: str = field(repr=False, compare=False, default="")
+    _type: str = field(repr=False, compare=False, default="")
+    _space_key: str = field(repr=False, compare=False, default="")
+    _space_name: str = field(repr=False, compare=False, default="")
+
+    @classmethod
+    def from_wrapper(cls, wrapper: dict) -> CalendarEntry:
+        sub = wrapper.get("subCalendar", {})
+        children = [c.get("subCalendar", {}) for c in wrapper.get("childSubCalendars", [])]
+        name = sub.get("name", "") or ""
+        leave_children = tuple(c["id"] for c in children if _is_leave_name(c.get("name", "")))
+        is_leave = _is_leave_name(name) or bool(leave_children)
+        # Only leave children are queried when the wrapper has children;
+        # querying the parent as well makes the API return no events.
+        if not is_leave:
+            leave_ids: tuple[str, ...] = ()
+        elif children:
+            leave_ids = leave_children
+        else:
+            leave_ids = (sub["id"],)
+        return cls(
+            id=sub.get("id"),
+            name=name,
+            type=sub.get("typeKey", "") or "",
+            space_key=sub.get("spaceKey", "") or "",
+            space_name=sub.get("spaceName", "") or "",
+            child_ids=tuple(c.get("id") for c in children),
+            leave_ids=leave_ids,
+            is_leave=is_leave,
+            wrapper=wrapper,
+            _name=name.lower(),
+            _type=(sub.get("typeKey", "") or "").lower(),
+            _space_key=(sub.get("spaceKey", "") or "").lower(),
+            _space_name=(sub.get("spaceName", "") or "").lower(),
+        )
+
+    def matches_type(self, query: str) -> bool:
+        q = query.lower()
+        return q in self._type or q in self._name
+
+    def matches_search(self, query: str) -> bool:
+        q = query.lower()
+        return q in self._name or q in self._space_name or q in self._space_key
+
+    def matches_name(self, query: str) -> bool:
+        return query.lower() in self._name
+
+    def summary(self, *, children: bool = True) -> dict[str, Any]:
+        sub = self.wrapper.get("subCalendar", {})
+        data: dict[str, Any] = {
+            "id": sub.get("id"),
+            "name": sub.get("name"),
+            "type": sub.get("typeKey"),
+            "space_key": sub.get("spaceKey"),
+            "space_name": sub.get("spaceName"),
+        }
+        if children:
+            data["child_count"] = len(self.child_ids)
+            data["child_ids"] = list(self.child_ids)
+        return data
+
+
+class CalendarIndex:
+    """Calendar list scanned once: leave calendars, child IDs and name/space lookups.
+
+    Built from the ``subcalendars.json`` payload and refreshed by the client
+    after ``ttl`` seconds. Entries keep the listing order of the payload.
+    """
+
+    def __init__(self, wrappers: list[dict]) -> None:
+        self.built_at = time.monotonic()
+        self.entries = [CalendarEntry.from_wrapper(w) for w in wrappers]
+        self.leave = [e for e in self.entries if e.is_leave]
+        self.by_id: dict[str, CalendarEntry] = {}
+        for entry in self.entries:
+            self.by_id[entry.id] = entry
+            for child_id in entry.child_ids:
+                self.by_id.setdefault(child_id, entry)
+
+    @property
+    def wrappers(self) -> list[dict]:
+        return [e.wrapper for e in self.entries]
+
+    def age(self) -> float:
+        return time.monotonic() - self.built_at
+
+    def leave_calendars(self, name: str | None = None) -> list[CalendarEntry]:
+        if not name:
+            return self.leave
+        return [e for e in self.leave if e.matches_name(name)]
+
+    def search(self, query: str) -> list[CalendarEntry]:
+        return [e for e in self.entries if e.matches_search(query)]
+
+    def filter_type(self, query: str) -> list[CalendarEntry]:
+        return [e for e in self.entries if e.matches_type(query)]
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "calendars": len(self.entries),
+            "leave_calendars": len(self.leave),
+            "age_seconds": round(self.age(), 1),
+        }
@@ -0,0 +1,109 @@
+"""Conditional GET support — remember ETag/Last-Modified validators and replay bodies on 304."""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+from .cache import MISSING, TTLCache
+
+# Response headers kept with a stored body. Transfer headers such as
+# Content-Encoding and Content-Length no longer apply to the decoded content.
+_KEPT_HEADERS = ("content-type", "etag", "last-modified")
+
+
+@dataclass(frozen=True)
+class StoredResponse:
+    """Decoded body of a 200 response plus the validators needed to revalidate it."""
+
+    content: bytes
+    headers: dict[str, str]
+
+    @property
+    def etag(self) -> str | None:
+        return self.headers.get("etag")
+
+    @property
+    def last_modified(self) -> str | None:
+        return self.headers.get("last-modified")
+
+    def conditional_headers(self) -> dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ConditionalStore:
+    """Per-URL store of validated GET responses under an LRU byte budget.
+
+    Only responses that carry an ``ETag`` or ``Last-Modified`` header are
+    kept. Entries do not expire — the server decides freshness on every
+    revalidation — but the least recently used are evicted once the
+    budget is exceeded.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self._entries = TTLCache(max_bytes)
+        self._stats = {"revalidated": 0, "not_modified": 0, "modified": 0}
+
+    def lookup(self, key: str) -> StoredResponse | None:
+        entry = self._entries.get(key)
+        return None if entry is MISSING else entry
+
+    def store(self, key: str, resp: httpx.Response) -> None:
+        headers = {name: resp.headers[name] for name in _KEPT_HEADERS if name in resp.headers}
+        if "etag" not in headers and "last-modified" not in headers:
+            self._entries.invalidate(key)
+            return
+        content = resp.content
+        self._entries.set(key, StoredResponse(content, headers), math.inf, len(content))
+
+    def resolve(
+        self, key: str, entry: StoredResponse | None, resp: httpx.Response
+    ) -> httpx.Response:
+        """Turn a 304 into the stored 200 response and remember fresh 200 responses.
+
+        The replayed response keeps the request, retry count and other
+        extensions of the 304 and is marked with ``extensions["not_modified"]``.
+        """
+        if entry is not None:
+            self._stats["revalidated"] += 1
+        if resp.status_code == 304 and entry is not None:
+            self._stats["not_modified"] += 1
+            headers = dict(entry.headers)
+            for name in ("etag", "last-modified"):
+                if name in resp.headers:
+                    headers[name] = resp.headers[name]
+            replay = httpx.Response(
+                200,
+                headers=headers,
+                content=entry.content,
+                request=resp.request,
+                extensions={**resp.extensions, "not_modified": True},
+            )
+            if headers != entry.headers:
+                self._entries.set(
+                    key, StoredResponse(entry.content, headers), math.inf, len(entry.content)
+                )
+            return replay
+        if resp.status_code == 200:
+            if entry is not None:
+                self._stats["modified"] += 1
+            self.store(key, resp)
+        return resp
+
+    def stats(self) -> dict[str, Any]:
+        entries = self._entries.stats()
+        return {
+            "entries": entries["entries"],
+            "bytes": entries["bytes"],
+            "max_bytes": entries["max_bytes"],
+            "evictions": entries["evictions"],
+            **self._stats,
+        }
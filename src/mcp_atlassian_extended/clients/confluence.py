@@ -2,39 +2,61 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
+from collections.abc import Coroutine
+from datetime import timedelta
 from typing import Any
 
 import httpx
 
 from ..config import ConfluenceConfig
-from ..exceptions import AtlassianApiError, AtlassianAuthError
+from ..dates import to_date
+from ..exceptions import AtlassianApiError, AtlassianError
+from .base import AtlassianHttpClient
+from .calendars import CalendarEntry, CalendarIndex
+from .ratelimit import TokenBucket
+from .timeoff import TimeOffStore
 
-LEAVE_KEYWORDS = ("vacation", "time off", "leaves", "time-off", "pto")
 
-
-class ConfluenceExtendedClient:
+class ConfluenceExtendedClient(AtlassianHttpClient):
     """Async HTTP client for Confluence calendar services API."""
 
-    def __init__(self, config: ConfluenceConfig | None = None) -> None:
-        self.config = config or ConfluenceConfig.from_env()
-        headers = {"Content-Type": "application/json", **self.config.auth_header}
-        self._client = httpx.AsyncClient(
-            base_url=self.config.url,
-            headers=headers,
-            timeout=self.config.timeout,
-            verify=self.config.ssl_verify,
+    config: ConfluenceConfig
+    product = "Confluence"
+
+    def __init__(
+        self, config: ConfluenceConfig | None = None, *, rate_limiter: TokenBucket | None = None
+    ) -> None:
+        super().__init__(config or ConfluenceConfig.from_env(), rate_limiter=rate_limiter)
+        self._calendar_index: CalendarIndex | None = None
+        self.time_off = (
+            TimeOffStore(self.config.time_off_ttl, self.config.time_off_db)
+            if self.config.time_off_ttl > 0
+            else None
         )
 
+    def stats(self) -> dict[str, Any]:
+        data = super().stats()
+        if self._calendar_index is not None:
+            data["calendar_index"] = self._calendar_index.stats()
+        if self.time_off is not None:
+            data["time_off_store"] = self.time_off.stats()
+        return data
+
     async def close(self) -> None:
-        await self._client.aclose()
+        await super().close()
+        if self.time_off is not None:
+            self.time_off.close()
 
     async def _get(self, path: str, params: Any = None) -> Any:
-        resp = await self._client.get(path, params=params)
-        if resp.status_code in (401, 403):
-            raise AtlassianAuthError(resp.status_code, resp.text)
-        if not resp.is_success:
-            raise AtlassianApiError(resp.status_code, resp.reason_phrase or "", resp.text)
+        return await self.single_flight.do(
+            self._request_key("GET", path, params), lambda: self._fetch(path, params)
+        )
+
+    async def _fetch(self, path: str, params: Any = None) -> Any:
+        resp = await self._send("GET", path, params=params)
+        self._raise_for_status(resp)
         if not resp.content:
             return None
         content_type = resp.headers.get("content-type", "")
@@ -61,7 +83,33 @@ class ConfluenceExtendedClient:
         start: str,
         end: str,
     ) -> list[dict]:
-        """Get events from one or more sub-calendars."""
+        """Get events from one or more sub-calendars.
+
+        Ranges longer than ``config.event_window_days`` are split into windows
+        fetched with at most ``config.calendar_parallelism`` requests in flight.
+        Adjacent windows share their boundary day, so events on it are never
+        missed whether the server treats ``end`` as inclusive or not; the merged
+        result is in window order with duplicates removed.
+        """
+        windows = _date_windows(start, end, self.config.event_window_days)
+        if len(windows) == 1:
+            return await self._get_window(sub_calendar_ids, start, end)
+        results = await asyncio.gather(*self._window_fetches(sub_calendar_ids, windows))
+        seen: set[tuple[Any, ...]] = set()
+        return [event for events in results for event in _unseen(events, seen)]
+
+    def _window_fetches(
+        self, sub_calendar_ids: list[str], windows: list[tuple[str, str]]
+    ) -> list[Coroutine[Any, Any, list[dict]]]:
+        semaphore = asyncio.Semaphore(max(1, self.config.calendar_parallelism))
+
+        async def fetch(window: tuple[str, str]) -> list[dict]:
+            async with semaphore:
+                return await self._get_window(sub_calendar_ids, *window)
+
+        return [fetch(w) for w in windows]
+
+    async def _get_window(self, sub_calendar_ids: list[str], start: str, end: str) -> list[dict]:
         params: list[tuple[str, str]] = [("start", start), ("end", end)]
         for cal_id in sub_calendar_ids:
             params.append(("subCalendarId", cal_id))
@@ -72,25 +120,22 @@ class ConfluenceExtendedClient:
         events = data.get("events", []) if isinstance(data, dict) else data
         return events or []
 
+    async def calendar_index(self, *, refresh: bool = False) -> CalendarIndex:
+        """Return the calendar index, rebuilding it once it is older than the TTL."""
+        index = self._calendar_index
+        if index is not None and not refresh and index.age() < self.config.calendar_index_ttl:
+            return index
+
+        async def build() -> CalendarIndex:
+            self._calendar_index = CalendarIndex(await self.list_calendars())
+            return self._calendar_index
+
+        return await self.single_flight.do("calendar-index", build)
+
     async def get_all_leave_calendars(self) -> list[dict]:
         """Find all calendar wrappers that contain leave/time-off calendars."""
-        all_cals = await self.list_calendars()
-        result = []
-        for wrapper in all_cals:
-            sub = wrapper.get("subCalendar", {})
-            name_lower = sub.get("name", "").lower()
-            if any(kw in name_lower for kw in LEAVE_KEYWORDS):
-                result.append(wrapper)
-                continue
-            # Check child calendars
-            children = wrapper.get("childSubCalendars", [])
-            for child_wrapper in children:
-                child_sub = child_wrapper.get("subCalendar", {})
-                child_name = child_sub.get("name", "").lower()
-                if any(kw in child_name for kw in LEAVE_KEYWORDS):
-                    result.append(wrapper)
-                    break
-        return result
+        index = await self.calendar_index()
+        return [entry.wrapper for entry in index.leave]
 
     async def get_time_off_events(
         self,
@@ -98,52 +143,134 @@ class ConfluenceExtendedClient:
         end: str,
         calendar_name: str | None = None,
     ) -> list[dict]:
-        """Get time-off events across all leave calendars."""
-        leave_cals = await self.get_all_leave_calendars()
-        if calendar_name:
-            leave_cals = [
-                w
-                for w in leave_cals
-                if calendar_name.lower() in w.get("subCalendar", {}).get("name", "").lower()
-            ]
+        """Get time-off events across all leave calendars.
+
+        Raises if no leave calendar could be read; calendars that fail while
+        others succeed are skipped — use ``collect_time_off_events`` to see them.
+        """
+        events, _ = await self.collect_time_off_events(start, end, calendar_name)
+        return events
+
+    async def collect_time_off_events(
+        self,
+        start: str,
+        end: str,
+        calendar_name: str | None = None,
+    ) -> tuple[list[dict], list[dict]]:
+        """Fetch time-off events from all leave calendars concurrently.
+
+        At most ``config.calendar_parallelism`` calendars are fetched at once.
+        With the time-off store enabled only date windows not fetched within
+        its TTL are requested, and the events are then read back from the
+        store. Events are merged in calendar listing order, so the result does
+        not depend on which request finishes first. Returns
+        ``(events, failures)`` where each failure names the calendar and the
+        error; if every calendar fails the first error is raised instead.
+        """
+        index = await self.calendar_index()
+        targets = [e for e in index.leave_calendars(calendar_name) if e.leave_ids]
+        store = self.time_off
+        semaphore = asyncio.Semaphore(max(1, self.config.calendar_parallelism))
+
+        async def fetch(entry: CalendarEntry) -> list[dict] | Exception:
+            windows = (
+                await asyncio.to_thread(store.missing, entry.id, start, end)
+                if store
+                else [(start, end)]
+            )
+            events: list[dict] = []
+            for window_start, window_end in windows:
+                async with semaphore:
+                    try:
+                        raw = await self.get_events(list(entry.leave_ids), window_start, window_end)
+                    except (AtlassianError, httpx.HTTPError) as e:
+                        return e
+                fetched = [_time_off_entry(ev, entry.name) for ev in raw if _is_leave_event(ev)]
+                if store:
+                    await asyncio.to_thread(store.save, entry.id, window_start, window_end, fetched)
+                events.extend(fetched)
+            return events
+
+        results = await asyncio.gather(*(fetch(e) for e in targets))
 
         all_events: list[dict] = []
-        for wrapper in leave_cals:
-            # Collect child sub-calendar IDs (children-only to avoid API 0-result bug)
-            cal_ids: list[str] = []
-            children = wrapper.get("childSubCalendars", [])
-            if children:
-                for child in children:
-                    child_sub = child.get("subCalendar", {})
-                    child_name = child_sub.get("name", "").lower()
-                    if any(kw in child_name for kw in LEAVE_KEYWORDS):
-                        cal_ids.append(child_sub["id"])
+        failures: list[dict] = []
+        errors: list[Exception] = []
+        for entry, result in zip(targets, results, strict=True):
+            if isinstance(result, Exception):
+                errors.append(result)
+                failure: dict[str, Any] = {
+                    "calendar_id": entry.id,
+                    "calendar_name": entry.name,
+                    "error": str(result) or type(result).__name__,
+                }
+                if isinstance(result, AtlassianApiError):
+                    failure["status_code"] = result.status_code
+                failures.append(failure)
+            elif store:
+                all_events.extend(await asyncio.to_thread(store.events, [entry.id], start, end))
             else:
-                cal_ids.append(wrapper["subCalendar"]["id"])
-
-            if not cal_ids:
-                continue
-
-            events = await self.get_events(cal_ids, start, end)
-            cal_name = wrapper.get("subCalendar", {}).get("name", "")
-            for event in events:
-                event_type = event.get("eventType", "")
-                class_name = event.get("className", "")
-                if event_type == "leaves" or class_name == "leaves":
-                    invitees = event.get("invitees", [])
-                    person = invitees[0] if invitees else {}
-                    all_events.append(
-                        {
-                            "id": event.get("id"),
-                            "person_name": person.get("displayName", event.get("title", "")),
-                            "person_email": person.get("email"),
-                            "description": event.get("title", ""),
-                            "start_date": event.get("start", "")[:10],
-                            "end_date": event.get("end", "")[:10],
-                            "calendar_name": cal_name,
-                            "calendar_id": event.get("subCalendarId"),
-                            "all_day": event.get("allDay", True),
-                        }
-                    )
-
-        return all_events
+                all_events.extend(result)
+
+        if errors and len(errors) == len(targets):
+            raise errors[0]
+        return all_events, failures
+
+
+def _date_windows(start: str, end: str, days: int) -> list[tuple[str, str]]:
+    """Split ``start``..``end`` into windows of ``days`` days sharing boundary days.
+
+    ``days <= 0`` or an unparsable range keeps the range as one window.
+    """
+    try:
+        first, last = to_date(start), to_date(end)
+    except (ValueError, OverflowError):
+        return [(start, end)]
+    if days <= 0 or (last - first).days <= days:
+        return [(start, end)]
+    windows = []
+    while first < last:
+        window_end = min(first + timedelta(days), last)
+        windows.append((first.isoformat(), window_end.isoformat()))
+        first = window_end
+    return windows
+
+
+def _event_key(event: dict) -> tuple[Any, ...]:
+    """Identity of an event across windows: ID and start, or its content if it has no ID."""
+    if event.get("id") is not None:
+        return (event["id"], event.get("start"))
+    return (event.get("title"), event.get("start"), event.get("end"), event.get("subCalendarId"))
+
+
+def _unseen(events: list[dict], seen: set[tuple[Any, ...]]) -> list[dict]:
+    """Events not yet in ``seen`` (see ``_event_key``), recording them."""
+    fresh = []
+    for event in events:
+        key = _event_key(event)
+        if key in seen:
+            continue
+        seen.add(key)
+        fresh.append(event)
+    return fresh
+
+
+def _is_leave_event(event: dict) -> bool:
+    return event.get("eventType", "") == "leaves" or event.get("className", "") == "leaves"
+
+
+def _time_off_entry(event: dict, cal_name: str) -> dict:
+    invitees = event.get("invitees", [])
+    person = invitees[0] if invitees else {}
+    return {
+        "id": event.get("id"),
+        "person_name": person.get("displayName", event.get("title", "")),
+        "person_email": person.get("email"),
+        "person_id": person.get("accountId") or person.get("id"),
+        "description": event.get("title", ""),
+        "start_date": event.get("start", "")[:10],
+        "end_date": event.get("end", "")[:10],
+        "calendar_name": cal_name,
+        "calendar_id": event.get("subCalendarId"),
+        "all_day": event.get("allDay", True),
+    }
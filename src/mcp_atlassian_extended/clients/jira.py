@@ -2,15 +2,28 @@
 
 from __future__ import annotations
 
+import asyncio
+import base64
+import hashlib
 import json
 import mimetypes
+import os
+import re
+import secrets
+import shutil
+from collections.abc import AsyncIterator, Awaitable, Callable
 from pathlib import Path
 from typing import Any
 
 import httpx
 
 from ..config import JiraConfig
-from ..exceptions import AtlassianApiError, AtlassianAuthError
+from ..exceptions import AtlassianApiError, AtlassianError
+from .attachments import AttachmentCache
+from .base import AtlassianHttpClient
+from .cache import MISSING, TTLCache
+from .pagination import fetch_offset_pages, iter_pages
+from .ratelimit import TokenBucket
 
 MIME_OVERRIDES = {
     ".md": "text/markdown",
@@ -18,22 +31,87 @@ MIME_OVERRIDES = {
     ".json": "application/json",
 }
 
+# Seconds metadata responses stay cached. Fields and projects rarely change;
+# board configuration and versions are edited more often.
+CACHE_TTLS = {
+    "fields": 3600,
+    "projects": 600,
+    "board_config": 600,
+    "versions": 300,
+}
+
+# Named field projections for issue reads. "planning" also gets the board's
+# estimation field (story points) when the board configuration names one.
+FIELD_PROFILES = {
+    "minimal": ("summary", "status", "issuetype", "priority", "assignee"),
+    "planning": (
+        "summary",
+        "status",
+        "issuetype",
+        "priority",
+        "assignee",
+        "labels",
+        "components",
+        "fixVersions",
+        "parent",
+        "duedate",
+        "updated",
+    ),
+    "full": ("*all",),
+}
+
+# Keys dropped from projected issues: links back to the API and avatar/icon URLs.
+NOISE_KEYS = frozenset({"self", "avatarUrls", "iconUrl", "expand"})
+
+ISSUE_KEY = re.compile(r"[A-Z][A-Z0-9_]*-\d+")
 
-class JiraExtendedClient:
+# Issue keys per JQL "key in (...)" query when resolving attachments in bulk.
+SEARCH_KEY_BATCH = 50
+
+# Backlog page size requested; the server may apply a lower cap, which is honoured.
+BACKLOG_PAGE_SIZE = 100
+
+
+class JiraExtendedClient(AtlassianHttpClient):
     """Async HTTP client for Jira REST API v2 + Agile API."""
 
-    def __init__(self, config: JiraConfig | None = None) -> None:
-        self.config = config or JiraConfig.from_env()
-        headers = {"Content-Type": "application/json", **self.config.auth_header}
-        self._client = httpx.AsyncClient(
-            base_url=self.config.url,
-            headers=headers,
-            timeout=self.config.timeout,
-            verify=self.config.ssl_verify,
+    config: JiraConfig
+    product = "Jira"
+
+    def __init__(
+        self, config: JiraConfig | None = None, *, rate_limiter: TokenBucket | None = None
+    ) -> None:
+        super().__init__(config or JiraConfig.from_env(), rate_limiter=rate_limiter)
+        self.cache = (
+            TTLCache(int(self.config.cache_max_mb * 1024 * 1024))
+            if self.config.cache_max_mb > 0
+            else None
         )
+        self._download_locks: dict[Path, asyncio.Lock] = {}
+        self._download_users: dict[Path, int] = {}
+        self._search_jql = False
+        self._stats["resumed_downloads"] = 0
+        self.attachment_cache = (
+            AttachmentCache(
+                self.config.attachment_cache_dir,
+                int(self.config.attachment_cache_mb * 1024 * 1024),
+            )
+            if self.config.attachment_cache_dir and self.config.attachment_cache_mb > 0
+            else None
+        )
+
+    def stats(self) -> dict[str, Any]:
+        data = super().stats()
+        if self.cache is not None:
+            data["cache"] = self.cache.stats()
+        if self.attachment_cache is not None:
+            data["attachment_cache"] = self.attachment_cache.stats()
+        return data
 
     async def close(self) -> None:
-        await self._client.aclose()
+        await super().close()
+        if self.attachment_cache is not None:
+            self.attachment_cache.close()
 
     async def _request(
         self,
@@ -45,6 +123,7 @@ class JiraExtendedClient:
         content: bytes | None = None,
         extra_headers: dict[str, str] | None = None,
         raw: bool = False,
+        idempotent: bool | None = None,
     ) -> Any:
         headers = {}
         if extra_headers:
@@ -56,13 +135,18 @@ class JiraExtendedClient:
         if content is not None:
             kwargs["content"] = content
 
-        resp = await self._client.request(method, path, **kwargs)
+        async def call() -> Any:
+            resp = await self._send(method, path, idempotent=idempotent, **kwargs)
+            self._raise_for_status(resp)
+            return self._decode(resp, raw=raw)
 
-        if resp.status_code in (401, 403):
-            raise AtlassianAuthError(resp.status_code, resp.text)
-        if not resp.is_success:
-            raise AtlassianApiError(resp.status_code, resp.reason_phrase or "", resp.text)
+        if method != "GET" or extra_headers:
+            return await call()
+        key = self._request_key(method, path, params)
+        return await self.single_flight.do(f"raw:{key}" if raw else key, call)
 
+    @staticmethod
+    def _decode(resp: httpx.Response, *, raw: bool = False) -> Any:
         if resp.status_code == 204 or not resp.content:
             return None
 
@@ -85,19 +169,64 @@ class JiraExtendedClient:
     async def get(self, path: str, params: dict[str, Any] | None = None, **kw: Any) -> Any:
         return await self._request("GET", path, params=params, **kw)
 
+    async def _cached_get(
+        self,
+        key: str,
+        kind: str,
+        path: str,
+        params: dict[str, Any] | None = None,
+        *,
+        refresh: bool = False,
+    ) -> Any:
+        """GET a metadata endpoint through the TTL cache, using the TTL for ``kind``."""
+        if self.cache is None:
+            return await self.get(path, params)
+        if not refresh:
+            cached = self.cache.get(key)
+            if cached is not MISSING:
+                return cached
+        cache = self.cache
+
+        async def fetch() -> Any:
+            resp = await self._send("GET", path, params=params)
+            self._raise_for_status(resp)
+            data = self._decode(resp)
+            cache.set(key, data, CACHE_TTLS[kind], len(resp.content))
+            return data
+
+        return await self.single_flight.do(f"cache:{key}", fetch)
+
     async def post(self, path: str, json_data: Any = None, **kw: Any) -> Any:
         return await self._request("POST", path, json_data=json_data, **kw)
 
     async def put(self, path: str, json_data: Any = None, **kw: Any) -> Any:
         return await self._request("PUT", path, json_data=json_data, **kw)
 
+    def paginate(
+        self,
+        path: str,
+        *,
+        items_key: str | None = None,
+        params: dict[str, Any] | None = None,
+        page_size: int = 50,
+        limit: int | None = None,
+    ) -> AsyncIterator[Any]:
+        """Iterate the items of a paginated GET endpoint (see ``iter_pages``)."""
+        return iter_pages(
+            lambda page_params: self.get(path, params=page_params),
+            items_key=items_key,
+            params=params,
+            page_size=page_size,
+            limit=limit,
+        )
+
     async def delete(self, path: str, **kw: Any) -> Any:
         return await self._request("DELETE", path, **kw)
 
     # ── Path Validation ─────────────────────────────────────────────
 
     @staticmethod
-    def _validate_file_path(path: str) -> Path:
+    def _validate_file_path(path: str, max_mb: float = 100.0) -> Path:
         """Validate file path is safe — no traversal, reasonable size."""
         resolved = Path(path).resolve()
         if ".." in Path(path).parts:
@@ -107,8 +236,8 @@ class JiraExtendedClient:
             msg = f"File not found: {resolved}"
             raise FileNotFoundError(msg)
         size_mb = resolved.stat().st_size / (1024 * 1024)
-        if size_mb > 100:
-            msg = f"File too large ({size_mb:.1f}MB). Max 100MB."
+        if size_mb > max_mb:
+            msg = f"File too large ({size_mb:.1f}MB). Max {max_mb:g}MB."
             raise ValueError(msg)
         return resolved
 
@@ -133,41 +262,353 @@ class JiraExtendedClient:
         data = await self.get(f"/rest/api/2/issue/{issue_key}", params={"fields": "attachment"})
         return data.get("fields", {}).get("attachment", [])
 
+    async def get_attachments_bulk(self, issue_keys: list[str]) -> dict[str, list[dict]]:
+        """Attachment metadata for many issues through JQL search, in as few requests as possible.
+
+        Keys are queried ``SEARCH_KEY_BATCH`` at a time with ``fields=attachment``
+        and the result is keyed by the requested key. Search answers with each
+        issue's current key, so when it returns keys that were not asked for
+        (issues moved or renamed since), the requested keys left unmatched are
+        looked up one by one, which Jira redirects to the current issue. Keys
+        that match no issue are absent from the result.
+        """
+        keys = list(dict.fromkeys(k.strip().upper() for k in issue_keys if k.strip()))
+        invalid = [k for k in keys if not ISSUE_KEY.fullmatch(k)]
+        if invalid:
+            msg = f"Invalid issue keys: {', '.join(invalid)}"
+            raise ValueError(msg)
+        found: dict[str, list[dict]] = {}
+        for i in range(0, len(keys), SEARCH_KEY_BATCH):
+            batch = keys[i : i + SEARCH_KEY_BATCH]
+            issues = self._search(f"key in ({','.join(batch)})", "attachment", len(batch))
+            async for issue in issues:
+                found[issue["key"]] = issue.get("fields", {}).get("attachment") or []
+        result = {key: found[key] for key in keys if key in found}
+        unmatched = [key for key in keys if key not in found]
+        if unmatched and len(result) < len(found):
+            lookups = await asyncio.gather(*(self._attachments_if_found(k) for k in unmatched))
+            for key, attachments in zip(unmatched, lookups, strict=True):
+                if attachments is not None:
+                    result[key] = attachments
+        return result
+
+    async def _attachments_if_found(self, issue_key: str) -> list[dict] | None:
+        try:
+            return await self.get_attachments(issue_key)
+        except AtlassianApiError as e:
+            if e.status_code == 404:
+                return None
+            raise
+
+    async def _search(self, jql: str, fields: str, page_size: int) -> AsyncIterator[dict]:
+        """Issues matching ``jql`` from ``/search``, or ``/search/jql`` where that is gone.
+
+        Jira Cloud answers the classic search endpoint with 404 or 410; the
+        first such answer switches this client to the token-paged replacement.
+        """
+        if not self._search_jql:
+            yielded = False
+            try:
+                pages = self.paginate(
+                    "/rest/api/2/search",
+                    items_key="issues",
+                    params={"jql": jql, "fields": fields, "validateQuery": "warn"},
+                    page_size=page_size,
+                )
+                async for issue in pages:
+                    yielded = True
+                    yield issue
+                return
+            except AtlassianApiError as e:
+                if yielded or e.status_code not in (404, 410):
+                    raise
+                self._search_jql = True
+        pages = self.paginate(
+            "/rest/api/2/search/jql",
+            items_key="issues",
+            params={"jql": jql, "fields": fields},
+            page_size=page_size,
+        )
+        async for issue in pages:
+            yield issue
+
     async def upload_attachment(
-        self, issue_key: str, file_path: str, filename: str | None = None
+        self,
+        issue_key: str,
+        file_path: str,
+        filename: str | None = None,
+        *,
+        progress: Progress | None = None,
     ) -> list[dict]:
-        p = self._validate_file_path(file_path)
+        """Upload a file, streaming it from disk in chunks.
+
+        Path checks and file reads run in a worker thread; memory use is one
+        chunk per upload whatever the file size. ``progress(sent, total)`` is
+        awaited after each chunk.
+        """
+        p = await asyncio.to_thread(
+            self._validate_file_path, file_path, self.config.max_attachment_mb
+        )
         fname = filename or p.name
         content_type = (
             MIME_OVERRIDES.get(p.suffix.lower())
             or mimetypes.guess_type(fname)[0]
             or "application/octet-stream"
         )
+        size = (await asyncio.to_thread(p.stat)).st_size
+        boundary = secrets.token_hex(16)
+        head = (
+            f"--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="file"; filename="{_quote(fname)}"\r\n'
+            f"Content-Type: {content_type}\r\n\r\n"
+        ).encode()
+        tail = f"\r\n--{boundary}--\r\n".encode()
 
-        files = {"file": (fname, p.read_bytes(), content_type)}
-        resp = await self._client.post(
+        resp = await self._send(
+            "POST",
             f"/rest/api/2/issue/{issue_key}/attachments",
-            files=files,
+            content=_multipart_chunks(p, size, head, tail, progress),
             headers={
+                "Content-Type": f"multipart/form-data; boundary={boundary}",
+                "Content-Length": str(len(head) + size + len(tail)),
                 "X-Atlassian-Token": "no-check",
                 **self.config.auth_header,
             },
         )
-        if not resp.is_success:
-            raise AtlassianApiError(resp.status_code, resp.reason_phrase or "", resp.text)
+        self._raise_for_status(resp)
         return resp.json()
 
-    async def download_attachment(self, content_url: str) -> bytes:
-        """Download attachment content. Handles both absolute and relative URLs."""
+    async def upload_attachments(
+        self,
+        issue_key: str,
+        file_paths: list[str],
+        *,
+        parallelism: int = 3,
+        progress: Progress | None = None,
+    ) -> dict:
+        """Upload several files, skipping any the issue already has.
+
+        The issue's attachments are listed once; a file whose name and size
+        match an existing attachment, or an earlier file in the same batch
+        (including the same file listed twice), is skipped. The rest are
+        uploaded at most ``parallelism`` at a time. A file that fails
+        validation or upload goes to ``failed`` without stopping the others.
+        ``progress(sent, total)`` covers the bytes of all uploads together.
+        """
+        existing = {
+            (a.get("filename"), a.get("size")): a.get("id")
+            for a in await self.get_attachments(issue_key)
+        }
+        queued: dict[tuple[str, int], str] = {}
+        jobs: list[tuple[str, Path, int]] = []
+        skipped: list[dict] = []
+        failed: list[dict] = []
+        seen: dict[Path, str] = {}
+        for file_path in file_paths:
+            try:
+                p = await asyncio.to_thread(
+                    self._validate_file_path, file_path, self.config.max_attachment_mb
+                )
+                size = (await asyncio.to_thread(p.stat)).st_size
+            except Exception as e:
+                failed.append({"file": file_path, "error": str(e) or type(e).__name__})
+                continue
+            key = (p.name, size)
+            entry = {"file": file_path, "filename": p.name, "size": size}
+            if p in seen:
+                skipped.append({**entry, "reason": "duplicate", "duplicate_of": seen[p]})
+                continue
+            seen[p] = file_path
+            if key in existing:
+                skipped.append({**entry, "reason": "exists", "attachment_id": existing[key]})
+            elif key in queued:
+                skipped.append({**entry, "reason": "duplicate", "duplicate_of": queued[key]})
+            else:
+                queued[key] = file_path
+                jobs.append((file_path, p, size))
+
+        semaphore = asyncio.Semaphore(max(1, parallelism))
+        total = sum(size for _, _, size in jobs)
+        sent: dict[str, int] = {}
+
+        async def upload(file_path: str, p: Path, size: int) -> dict:
+            async def report(done: int, _: int) -> None:
+                sent[file_path] = done
+                if progress is not None:
+                    await progress(sum(sent.values()), total)
+
+            entry: dict[str, Any] = {"file": file_path, "filename": p.name, "size": size}
+            try:
+                async with semaphore:
+                    created = await self.upload_attachment(issue_key, str(p), progress=report)
+                entry["attachment_id"] = created[0].get("id") if created else None
+            except Exception as e:
+                entry["error"] = str(e) or type(e).__name__
+            return entry
+
+        entries = await asyncio.gather(*(upload(*job) for job in jobs))
+        uploaded = [e for e in entries if "error" not in e]
+        return {
+            "issue_key": issue_key,
+            "uploaded": uploaded,
+            "skipped": skipped,
+            "failed": failed + [e for e in entries if "error" in e],
+            "total_bytes": sum(e["size"] for e in uploaded),
+        }
+
+    async def download_attachment_to(
+        self, content_url: str, dest: Path, *, size: int | None = None
+    ) -> dict:
+        """Stream an attachment to ``dest`` without holding it in memory.
+
+        Chunks go to a temporary file next to ``dest`` that is renamed over it
+        once complete, so ``dest`` is never left half-written. The SHA-256 is
+        computed while streaming, and the download stops with ``ValueError``
+        as soon as it exceeds ``config.max_attachment_mb``. File operations
+        run in a worker thread to keep the event loop free.
+
+        With the attachment cache enabled, an attachment already cached under
+        its ID (and ``size``, when known) is copied to ``dest`` after its hash
+        is checked, without any request; ``cache_hit`` in the result says which
+        path was taken. Downloads are always copies, never links to the blob,
+        so editing one cannot change the cache or another download.
+        """
         content_url = self._validate_download_url(content_url)
-        if content_url.startswith(("http://", "https://")):
-            resp = await self._client.request("GET", content_url, headers=self.config.auth_header)
-            if resp.status_code in (401, 403):
-                raise AtlassianAuthError(resp.status_code, resp.text)
+        cache = self.attachment_cache
+        key = _attachment_key(content_url) if cache is not None else None
+        if cache is not None and key is not None:
+            hit = await asyncio.to_thread(cache.lookup, key, size)
+            if hit is not None:
+                blob, sha, blob_size = hit
+                if await asyncio.to_thread(_place_blob, blob, sha, dest):
+                    return {"path": str(dest), "size": blob_size, "sha256": sha, "cache_hit": True}
+                await asyncio.to_thread(cache.forget, key)
+        result = await self._download(content_url, dest)
+        if cache is not None and key is not None:
+            blob = cache.blob_path(result["sha256"])
+            await asyncio.to_thread(_copy_file, dest, blob)
+            evicted = await asyncio.to_thread(cache.record, key, result["sha256"], result["size"])
+            await asyncio.to_thread(_remove_files, evicted)
+        return {**result, "cache_hit": False}
+
+    async def _download(self, content_url: str, dest: Path) -> dict:
+        """Download into a part file beside ``dest``, resuming it with a Range request.
+
+        The part file is named after the attachment (``.<name>.<id>.part``)
+        and has a ``.json`` sidecar with its URL, expected size and the
+        server's ETag or Last-Modified, so a part left by a different
+        attachment saved to the same path is never continued. A part left by
+        an interrupted download — a dropped connection or read timeout here,
+        or an earlier call that was cancelled — is resumed with ``Range`` and
+        ``If-Range``. Only a ``206`` starting at the part's size, for the same
+        total size, is appended; anything else restarts from zero.
+        Interrupted bodies are resumed up to ``config.max_retries`` times
+        within one call. Downloads to the same ``dest`` are serialized.
+        """
+        tag = _attachment_key(content_url) or hashlib.sha256(content_url.encode()).hexdigest()[:16]
+        part = dest.with_name(f".{dest.name}.{tag}.part")
+        lock = self._download_locks.setdefault(dest, asyncio.Lock())
+        self._download_users[dest] = self._download_users.get(dest, 0) + 1
+        try:
+            async with lock:
+                await asyncio.to_thread(dest.parent.mkdir, parents=True, exist_ok=True)
+                attempt = 0
+                while True:
+                    try:
+                        return await self._download_part(content_url, dest, part)
+                    except _InterruptedDownloadError as e:
+                        if attempt >= self.config.max_retries:
+                            raise e.__cause__ from None
+                        attempt += 1
+                        self._stats["resumed_downloads"] += 1
+        finally:
+            # A released lock may still have waiters, so count users instead of locked().
+            self._download_users[dest] -= 1
+            if not self._download_users[dest]:
+                del self._download_users[dest]
+                del self._download_locks[dest]
+
+    async def _download_part(self, content_url: str, dest: Path, part: Path) -> dict:
+        limit = int(self.config.max_attachment_mb * 1024 * 1024)
+        meta_path = part.with_name(part.name + ".json")
+        meta = await asyncio.to_thread(_read_part_meta, part, meta_path, content_url)
+        offset = await asyncio.to_thread(_file_size, part) if meta is not None else 0
+        headers = dict(
+            self.config.auth_header if content_url.startswith(("http://", "https://")) else {}
+        )
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+            validator = meta.get("etag") or meta.get("last_modified")
+            if validator:
+                headers["If-Range"] = validator
+        resp = await self._send("GET", content_url, headers=headers or None, stream=True)
+        try:
+            if offset and (
+                resp.status_code == 416
+                or (resp.status_code == 206 and not _continues(resp, offset, meta.get("size")))
+            ):
+                # The part is not a prefix of this attachment (or already whole): start over.
+                await asyncio.to_thread(_remove_files, [part, meta_path])
+                await resp.aclose()
+                return await self._download_part(content_url, dest, part)
             if not resp.is_success:
-                raise AtlassianApiError(resp.status_code, resp.reason_phrase or "", resp.text)
-            return resp.content
-        return await self.get(content_url, raw=True)
+                await resp.aread()
+                self._raise_for_status(resp)
+            length = int(resp.headers.get("content-length") or 0)
+            if resp.status_code != 206:
+                offset = 0
+                meta = _part_meta(resp, content_url, length or None)
+                await asyncio.to_thread(_write_part_meta, meta_path, meta)
+            if offset + length > limit:
+                await asyncio.to_thread(_remove_files, [part, meta_path])
+                raise _too_large(offset + length, limit)
+            result = await _stream_to_file(resp, dest, part, offset, limit)
+        except ValueError:
+            await asyncio.to_thread(_remove_files, [meta_path])
+            raise
+        finally:
+            await resp.aclose()
+        await asyncio.to_thread(_remove_files, [meta_path])
+        return result
+
+    async def preview_attachment(self, content_url: str, max_bytes: int = 4096) -> dict:
+        """The first ``max_bytes`` of an attachment, decoded as text when it is text.
+
+        Sends ``Range: bytes=0-<max_bytes-1>``; if the server ignores it, the
+        body is read only up to ``max_bytes`` and the connection dropped. A
+        cached copy is read locally instead.
+        """
+        content_url = self._validate_download_url(content_url)
+        cache = self.attachment_cache
+        key = _attachment_key(content_url) if cache is not None else None
+        if cache is not None and key is not None:
+            hit = await asyncio.to_thread(cache.lookup, key)
+            if hit is not None:
+                blob, _, size = hit
+                data = await asyncio.to_thread(_read_head, blob, max_bytes)
+                return _preview(data, size, None, cache_hit=True)
+        headers = dict(
+            self.config.auth_header if content_url.startswith(("http://", "https://")) else {}
+        )
+        headers["Range"] = f"bytes=0-{max_bytes - 1}"
+        resp = await self._send("GET", content_url, headers=headers, stream=True)
+        try:
+            if not resp.is_success:
+                await resp.aread()
+                self._raise_for_status(resp)
+            data = bytearray()
+            async for chunk in resp.aiter_bytes():
+                data += chunk
+                if len(data) >= max_bytes:
+                    break
+        finally:
+            await resp.aclose()
+        total = _range_total(resp.headers.get("content-range"))
+        if total is None and resp.status_code == 200 and resp.headers.get("content-length"):
+            total = int(resp.headers["content-length"])
+        return _preview(
+            bytes(data[:max_bytes]), total, resp.headers.get("content-type"), cache_hit=False
+        )
 
     async def delete_attachment(self, attachment_id: str) -> None:
         await self.delete(f"/rest/api/2/attachment/{attachment_id}")
@@ -175,32 +616,117 @@ class JiraExtendedClient:
     # ── Users ─────────────────────────────────────────────────────
 
     async def search_users(self, query: str, max_results: int = 10) -> list[dict]:
-        return await self.get(
+        pages = self.iter_users(query, page_size=min(max_results, 1000), limit=max_results)
+        return [user async for user in pages]
+
+    def iter_users(
+        self, query: str, *, page_size: int = 100, limit: int | None = None
+    ) -> AsyncIterator[dict]:
+        return self.paginate(
             "/rest/api/2/user/search",
-            params={"username": query, "maxResults": max_results},
+            params={"username": query},
+            page_size=page_size,
+            limit=limit,
         )
 
     # ── Metadata ──────────────────────────────────────────────────
 
-    async def list_projects(self) -> list[dict]:
-        return await self.get("/rest/api/2/project")
+    async def list_projects(self, *, refresh: bool = False) -> list[dict]:
+        return await self._cached_get(
+            "projects", "projects", "/rest/api/2/project", refresh=refresh
+        )
 
-    async def list_fields(self) -> list[dict]:
-        return await self.get("/rest/api/2/field")
+    async def list_fields(self, *, refresh: bool = False) -> list[dict]:
+        return await self._cached_get("fields", "fields", "/rest/api/2/field", refresh=refresh)
 
     # ── Agile: Boards ─────────────────────────────────────────────
 
     async def get_board(self, board_id: int) -> dict:
         return await self.get(f"/rest/agile/1.0/board/{board_id}")
 
-    async def get_board_config(self, board_id: int) -> dict:
-        return await self.get(f"/rest/agile/1.0/board/{board_id}/configuration")
+    async def get_board_config(self, board_id: int, *, refresh: bool = False) -> dict:
+        return await self._cached_get(
+            f"board_config:{board_id}",
+            "board_config",
+            f"/rest/agile/1.0/board/{board_id}/configuration",
+            refresh=refresh,
+        )
 
-    async def get_backlog(self, board_id: int, max_results: int = 50) -> dict:
-        return await self.get(
+    async def get_backlog(
+        self, board_id: int, max_results: int = 50, *, fields: str = "minimal"
+    ) -> dict:
+        """Backlog issues in rank order, up to ``max_results`` across as many pages as needed.
+
+        ``fields`` is a profile name from ``FIELD_PROFILES`` or a comma-separated
+        list of field IDs. Anything but ``full`` also drops ``NOISE_KEYS``. When
+        the first page reports no ``total`` the remaining pages cannot be
+        requested concurrently, so the backlog is walked with ``iter_backlog``.
+        """
+        fields = _profile_name(fields)
+        field_list = await self._issue_fields(fields, board_id)
+
+        async def page(start_at: int, size: int) -> dict:
+            return await self.get(
+                f"/rest/agile/1.0/board/{board_id}/backlog",
+                params={"fields": field_list, "startAt": start_at, "maxResults": size},
+            )
+
+        issues, total = await fetch_offset_pages(
+            page,
+            items_key="issues",
+            limit=max_results,
+            page_size=BACKLOG_PAGE_SIZE,
+            parallelism=self.config.page_parallelism,
+        )
+        if total is None and issues and len(issues) < max_results:
+            pages = self.iter_backlog(
+                board_id, fields=fields, page_size=BACKLOG_PAGE_SIZE, limit=max_results
+            )
+            issues = [issue async for issue in pages]
+        elif fields != "full":
+            issues = [_strip_noise(issue) for issue in issues]
+        return {"startAt": 0, "maxResults": len(issues), "total": total, "issues": issues}
+
+    async def iter_backlog(
+        self,
+        board_id: int,
+        *,
+        fields: str = "minimal",
+        page_size: int = 50,
+        limit: int | None = None,
+    ) -> AsyncIterator[dict]:
+        """Backlog issues in rank order, one page in memory at a time."""
+        fields = _profile_name(fields)
+        pages = self.paginate(
             f"/rest/agile/1.0/board/{board_id}/backlog",
-            params={"fields": "*all", "maxResults": max_results},
+            items_key="issues",
+            params={"fields": await self._issue_fields(fields, board_id)},
+            page_size=page_size,
+            limit=limit,
         )
+        async for issue in pages:
+            yield issue if fields == "full" else _strip_noise(issue)
+
+    async def _issue_fields(self, fields: str, board_id: int | None = None) -> str:
+        """Resolve a field profile or explicit field list to the ``fields`` query value."""
+        fields = _profile_name(fields)
+        profile = FIELD_PROFILES.get(fields)
+        if profile is None:
+            names = [f.strip() for f in fields.split(",") if f.strip()]
+            if not names:
+                msg = f"Unknown field profile {fields!r}; use {', '.join(FIELD_PROFILES)}."
+                raise ValueError(msg)
+            return ",".join(names)
+        names = list(profile)
+        if fields == "planning" and board_id is not None:
+            try:
+                config = await self.get_board_config(board_id)
+            except AtlassianError:
+                config = {}
+            estimate = config.get("estimation", {}).get("field", {}).get("fieldId")
+            if estimate:
+                names.append(estimate)
+        return ",".join(names)
 
     # ── Agile: Sprints ────────────────────────────────────────────
 
@@ -286,9 +812,14 @@ class JiraExtendedClient:
 
     # ── Versions ──────────────────────────────────────────────────
 
-    async def get_project_versions(self, project_key: str) -> list[dict]:
+    async def get_project_versions(self, project_key: str, *, refresh: bool = False) -> list[dict]:
         """Get all versions for a project."""
-        return await self.get(f"/rest/api/2/project/{project_key}/versions")
+        return await self._cached_get(
+            f"versions:{project_key.upper()}",
+            "versions",
+            f"/rest/api/2/project/{project_key}/versions",
+            refresh=refresh,
+        )
 
     async def create_version(
         self,
@@ -318,7 +849,11 @@ class JiraExtendedClient:
             payload["released"] = released
         if archived is not None:
             payload["archived"] = archived
-        return await self.post("/rest/api/2/version", payload)
+        data = await self.post("/rest/api/2/version", payload)
+        if self.cache is not None:
+            # The project may also be cached under its ID (or key), so drop every version list.
+            self.cache.invalidate_prefix("versions:")
+        return data
 
     async def update_version(
         self,
@@ -347,4 +882,239 @@ class JiraExtendedClient:
             payload["archived"] = archived
         if not payload:
             return await self.get(f"/rest/api/2/version/{version_id}")
-        return await self.put(f"/rest/api/2/version/{version_id}", payload)
+        data = await self.put(f"/rest/api/2/version/{version_id}", payload)
+        if self.cache is not None:
+            # The version's project key is not known here, so drop every version list.
+            self.cache.invalidate_prefix("versions:")
+        return data
+
+
+def _profile_name(fields: str) -> str:
+    """``fields`` lower-cased when it names a profile in ``FIELD_PROFILES``, else as given."""
+    name = fields.strip().lower()
+    return name if name in FIELD_PROFILES else fields
+
+
+def _strip_noise(value: Any) -> Any:
+    """Copy of ``value`` without ``NOISE_KEYS`` at any depth."""
+    if isinstance(value, dict):
+        return {k: _strip_noise(v) for k, v in value.items() if k not in NOISE_KEYS}
+    if isinstance(value, list):
+        return [_strip_noise(v) for v in value]
+    return value
+
+
+# Bytes per read while streaming attachments to and from disk.
+DOWNLOAD_CHUNK = 1024 * 1024
+UPLOAD_CHUNK = 1024 * 1024
+
+# progress(bytes_done, bytes_total), awaited as a transfer advances.
+Progress = Callable[[int, int], Awaitable[None]]
+
+
+def _quote(filename: str) -> str:
+    """Escape a filename for a Content-Disposition parameter (as browsers do)."""
+    return (
+        filename.replace("\\", "\\\\").replace('"', "%22").replace("\r", "%0D").replace("\n", "%0A")
+    )
+
+
+async def _multipart_chunks(
+    path: Path, size: int, head: bytes, tail: bytes, progress: Progress | None
+) -> AsyncIterator[bytes]:
+    """Yield a single-file multipart body, reading the file in a worker thread."""
+    yield head
+    fh = await asyncio.to_thread(path.open, "rb")
+    try:
+        sent = 0
+        while chunk := await asyncio.to_thread(fh.read, UPLOAD_CHUNK):
+            yield chunk
+            sent += len(chunk)
+            if progress is not None:
+                await progress(sent, size)
+    finally:
+        await asyncio.to_thread(fh.close)
+    yield tail
+
+
+_ATTACHMENT_ID = re.compile(r"/attachment/(?:content/)?(\d+)")
+
+
+def _attachment_key(content_url: str) -> str | None:
+    """Cache key for a content URL — the attachment ID, since attachments never change."""
+    match = _ATTACHMENT_ID.search(content_url)
+    return match.group(1) if match else None
+
+
+def _copy_file(src: Path, dest: Path) -> None:
+    """Copy ``src`` to ``dest`` atomically (the kernel may share blocks, never the file)."""
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    tmp = dest.with_name(f".{dest.name}.{secrets.token_hex(4)}.part")
+    try:
+        shutil.copyfile(src, tmp)
+        os.replace(tmp, dest)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _place_blob(blob: Path, sha256: str, dest: Path) -> bool:
+    """Copy a cached blob to ``dest`` if its content still hashes to ``sha256``.
+
+    A blob that no longer matches (changed or damaged on disk) is deleted and
+    ``False`` returned.
+    """
+    try:
+        digest = _hash_file(blob)
+    except OSError:
+        return False
+    if digest.hexdigest() != sha256:
+        blob.unlink(missing_ok=True)
+        return False
+    _copy_file(blob, dest)
+    return True
+
+
+def _remove_files(paths: list[Path]) -> None:
+    for path in paths:
+        path.unlink(missing_ok=True)
+
+
+def _too_large(size: int, limit: int) -> ValueError:
+    msg = f"Attachment too large ({size / 1048576:.1f}MB). Max {limit / 1048576:.0f}MB."
+    return ValueError(msg)
+
+
+class _InterruptedDownloadError(Exception):
+    """The connection failed while a download body was streaming; the part file is kept."""
+
+
+def _file_size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except FileNotFoundError:
+        return 0
+
+
+def _hash_file(path: Path) -> Any:
+    digest = hashlib.sha256()
+    with path.open("rb") as fh:
+        while chunk := fh.read(DOWNLOAD_CHUNK):
+            digest.update(chunk)
+    return digest
+
+
+async def _stream_to_file(
+    resp: httpx.Response, dest: Path, part: Path, offset: int, limit: int
+) -> dict:
+    """Append ``resp``'s body to ``part`` from ``offset``, then rename it to ``dest``.
+
+    The SHA-256 covers the bytes already in ``part``. The part file is kept
+    when the transfer is interrupted or cancelled, so it can be resumed, and
+    removed when the attachment turns out to be over ``limit``.
+    """
+    digest = await asyncio.to_thread(_hash_file, part) if offset else hashlib.sha256()
+    size = offset
+    fh = await asyncio.to_thread(part.open, "ab" if offset else "wb")
+    try:
+        try:
+            async for chunk in resp.aiter_bytes(DOWNLOAD_CHUNK):
+                size += len(chunk)
+                if size > limit:
+                    raise _too_large(size, limit)
+                digest.update(chunk)
+                await asyncio.to_thread(fh.write, chunk)
+        finally:
+            await asyncio.to_thread(fh.close)
+    except httpx.TransportError as e:
+        raise _InterruptedDownloadError from e
+    except ValueError:
+        await asyncio.to_thread(part.unlink, missing_ok=True)
+        raise
+    await asyncio.to_thread(os.replace, part, dest)
+    return {"path": str(dest), "size": size, "sha256": digest.hexdigest()}
+
+
+def _read_head(path: Path, n: int) -> bytes:
+    with path.open("rb") as fh:
+        return fh.read(n)
+
+
+def _part_meta(resp: httpx.Response, content_url: str, size: int | None) -> dict:
+    """What a part file was downloaded from, to check a later resume against."""
+    etag = resp.headers.get("etag")
+    return {
+        "url": content_url,
+        "size": size,
+        # If-Range only accepts strong validators.
+        "etag": etag if etag and not etag.startswith("W/") else None,
+        "last_modified": resp.headers.get("last-modified"),
+    }
+
+
+def _write_part_meta(path: Path, meta: dict) -> None:
+    path.write_text(json.dumps(meta), encoding="utf-8")
+
+
+def _read_part_meta(part: Path, path: Path, content_url: str) -> dict | None:
+    """The sidecar of ``part`` if it belongs to ``content_url``; otherwise both are removed."""
+    try:
+        meta = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        meta = None
+    if isinstance(meta, dict) and meta.get("url") == content_url and part.is_file():
+        return meta
+    _remove_files([part, path])
+    return None
+
+
+def _continues(resp: httpx.Response, offset: int, size: int | None) -> bool:
+    """Whether a ``206`` resumes exactly at ``offset`` of an attachment of ``size`` bytes."""
+    match = _CONTENT_RANGE.fullmatch(resp.headers.get("content-range", "").strip())
+    if match is None or int(match.group(1)) != offset:
+        return False
+    total = match.group(2)
+    return size is None or total == "*" or int(total) == size
+
+
+_CONTENT_RANGE = re.compile(r"bytes (\d+)-\d+/(\d+|\*)")
+
+
+def _range_total(content_range: str | None) -> int | None:
+    """Total size from a ``Content-Range: bytes 0-99/1234`` header, if known."""
+    if not content_range or "/" not in content_range:
+        return None
+    total = content_range.rsplit("/", 1)[1].strip()
+    return int(total) if total.isdigit() else None
+
+
+def _preview(data: bytes, total: int | None, content_type: str | None, *, cache_hit: bool) -> dict:
+    """Preview payload: UTF-8 text when the bytes decode as text, base64 otherwise."""
+    result: dict[str, Any] = {
+        "bytes": len(data),
+        "total_size": total,
+        "truncated": total is None or len(data) < total,
+        "content_type": content_type,
+        "cache_hit": cache_hit,
+    }
+    text = _as_text(data)
+    if text is None:
+        result["encoding"] = "base64"
+        result["content"] = base64.b64encode(data).decode("ascii")
+    else:
+        result["encoding"] = "utf-8"
+        result["content"] = text
+    return result
+
+
+def _as_text(data: bytes) -> str | None:
+    """Decode ``data`` as UTF-8, allowing a character cut off at the end; ``None`` if binary."""
+    if b"\x00" in data:
+        return None
+    try:
+        return data.decode("utf-8")
+    except UnicodeDecodeError as e:
+        # A multi-byte character split by the byte limit is fine; anything else is binary.
+        if e.start < len(data) - 3:
+            return None
+        return data[: e.start].decode("utf-8")
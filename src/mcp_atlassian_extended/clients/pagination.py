@@ -0,0 +1,145 @@
+"""Pagination over Jira list endpoints.
+
+``iter_pages`` walks any of the Jira paging styles one page at a time with
+the next page prefetched; ``fetch_offset_pages`` reads ``total`` from the
+first page and fetches the rest concurrently.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any
+
+# fetch(params) -> decoded response for one page; params hold the paging parameters.
+ParamFetcher = Callable[[dict[str, Any]], Awaitable[Any]]
+
+# fetch_page(start_at, max_results) -> page dict with ``total``, ``maxResults`` and items.
+PageFetcher = Callable[[int, int], Awaitable[dict]]
+
+
+async def fetch_offset_pages(
+    fetch_page: PageFetcher,
+    *,
+    items_key: str,
+    limit: int | None = None,
+    page_size: int = 50,
+    parallelism: int = 4,
+) -> tuple[list[Any], int | None]:
+    """Fetch up to ``limit`` items from a ``startAt``/``maxResults`` endpoint.
+
+    The first page is fetched alone to learn ``total`` and the page size the
+    server actually applied (it may cap ``maxResults`` below what was asked).
+    The remaining pages are then requested concurrently, at most
+    ``parallelism`` at a time, and only as many as ``limit`` needs. Pages are
+    merged in offset order, so the server's ordering (rank, for backlogs) is
+    kept; an empty page ends the merge early in case items were removed
+    between requests. Returns ``(items, total)``; ``total`` is ``None`` when
+    the endpoint does not report it, in which case only the first page is read.
+    """
+    first_size = page_size if limit is None else min(page_size, limit)
+    first = await fetch_page(0, first_size)
+    items = list(first.get(items_key) or [])
+    total = first.get("total")
+    if not isinstance(total, int):
+        return items[:limit], None
+
+    wanted = total if limit is None else min(total, limit)
+    step = first.get("maxResults") or len(items)
+    if step <= 0 or len(items) >= wanted:
+        return items[:wanted], total
+
+    semaphore = asyncio.Semaphore(max(1, parallelism))
+
+    async def fetch(start_at: int) -> list[Any]:
+        async with semaphore:
+            page = await fetch_page(start_at, min(step, wanted - start_at))
+        return list(page.get(items_key) or [])
+
+    pages = await asyncio.gather(*(fetch(s) for s in range(step, wanted, step)))
+    for page in pages:
+        if not page:
+            break
+        items.extend(page)
+    return items[:wanted], total
+
+
+def _next_params(
+    page: Any, params: dict[str, Any], items: list[Any], page_size: int
+) -> dict[str, Any] | None:
+    """Paging parameters for the page after ``page``, or ``None`` if it was the last.
+
+    Handles Cloud ``nextPageToken``, Agile ``isLast``, REST v2 ``total`` and
+    bare lists. An empty page always ends, and is how a bare list ends: servers
+    may cap a page below ``page_size``, so a short page is not the last.
+    """
+    if not items:
+        return None
+    if isinstance(page, dict) and "nextPageToken" in page:
+        token = page.get("nextPageToken")
+        if not token or page.get("isLast"):
+            return None
+        return {**params, "nextPageToken": token}
+    start = params.get("startAt", 0)
+    if isinstance(page, dict):
+        step = page.get("maxResults") or len(items)
+        if page.get("isLast") is True:
+            return None
+        total = page.get("total")
+        if "isLast" not in page and isinstance(total, int) and start + len(items) >= total:
+            return None
+    else:
+        # Endpoints that ignore paging return everything at once.
+        if len(items) > page_size:
+            return None
+        step = len(items)
+    return {**params, "startAt": start + step}
+
+
+async def iter_pages(
+    fetch: ParamFetcher,
+    *,
+    items_key: str | None = None,
+    params: dict[str, Any] | None = None,
+    page_size: int = 50,
+    limit: int | None = None,
+    prefetch: bool = True,
+) -> AsyncIterator[Any]:
+    """Yield items from a paginated endpoint, holding at most two pages in memory.
+
+    ``items_key`` names the list in each response (``issues``, ``values``);
+    ``None`` means the response is the list itself. With ``prefetch`` the
+    request for the next page is started before the current page's items are
+    yielded, so network time overlaps the caller's processing. Iteration
+    stops after ``limit`` items without requesting pages beyond them; closing
+    the iterator early cancels the prefetched request.
+    """
+    current: dict[str, Any] | None = {"maxResults": page_size, **(params or {})}
+    pending: asyncio.Future[Any] | None = None
+    remaining = limit
+    try:
+        while current is not None:
+            page = await (pending if pending is not None else fetch(current))
+            pending = None
+            items = list((page.get(items_key) if items_key else page) or [])
+            if remaining is not None:
+                items = items[:remaining]
+                remaining -= len(items)
+            following = _next_params(page, current, items, page_size)
+            if remaining == 0:
+                following = None
+            if following is not None and prefetch:
+                pending = asyncio.ensure_future(fetch(following))
+            current = following
+            for item in items:
+                yield item
+    finally:
+        if pending is not None:
+            pending.cancel()
+            pending.add_done_callback(_retrieve)
+
+
+def _retrieve(task: asyncio.Future[Any]) -> None:
+    # A prefetch that failed before it was cancelled must not log "never retrieved".
+    if not task.cancelled():
+        task.exception()
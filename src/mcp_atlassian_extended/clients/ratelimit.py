@@ -0,0 +1,145 @@
+"""Client-side token-bucket rate limiting, shared per Atlassian host."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+from urllib.parse import urlparse
+
+import httpx
+
+from ..config import RateLimitConfig
+from .retry import parse_retry_after
+
+# Never throttle below this many requests per second, however hard the server pushes back.
+MIN_RATE = 0.2
+# Fraction of the ceiling recovered per successful response after a slowdown.
+RECOVERY_STEP = 0.05
+
+
+def _header_float(headers: httpx.Headers, name: str) -> float | None:
+    raw = headers.get(name)
+    if raw is None:
+        return None
+    try:
+        return float(raw)
+    except ValueError:
+        return None
+
+
+class TokenBucket:
+    """Async token bucket that smooths requests to a target rate.
+
+    Waiters queue on a lock, so bursts beyond ``burst`` are released in FIFO
+    order at ``rate`` per second instead of all at once. The rate adapts to
+    the ``X-RateLimit-*`` headers Atlassian sends: Data Center advertises its
+    own bucket (``Limit``/``FillRate``/``Interval-Seconds``), Cloud reports
+    ``Remaining``/``Reset``/``NearLimit``. A 429 halves the rate; successful
+    responses recover it gradually.
+    """
+
+    def __init__(self, rate: float, burst: float) -> None:
+        self.max_rate = rate
+        self.max_burst = burst
+        self.rate = rate
+        self.burst = burst
+        self._ceiling = rate
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+        self._stats = {"acquired": 0, "throttled": 0, "wait_seconds": 0.0, "slowdowns": 0}
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> float:
+        """Take one token, sleeping until it is available. Returns seconds waited."""
+        waited = 0.0
+        async with self._lock:
+            while True:
+                self._refill()
+                delay = max(0.0, self._blocked_until - time.monotonic())
+                if not delay and self._tokens >= 1:
+                    self._tokens -= 1
+                    break
+                delay = max(delay, (1 - self._tokens) / self.rate)
+                waited += delay
+                await asyncio.sleep(delay)
+        self._stats["acquired"] += 1
+        if waited:
+            self._stats["throttled"] += 1
+            self._stats["wait_seconds"] += waited
+        return waited
+
+    def observe(self, response: httpx.Response) -> None:
+        """Adapt rate, burst and available tokens from a response's rate-limit headers."""
+        headers = response.headers
+        limit = _header_float(headers, "X-RateLimit-Limit")
+        remaining = _header_float(headers, "X-RateLimit-Remaining")
+        fill_rate = _header_float(headers, "X-RateLimit-FillRate")
+        interval = _header_float(headers, "X-RateLimit-Interval-Seconds")
+        near_limit = headers.get("X-RateLimit-NearLimit", "").lower() == "true"
+
+        if fill_rate and interval:
+            self._ceiling = min(self.max_rate, fill_rate / interval)
+            self.rate = min(self.rate, self._ceiling)
+        if limit:
+            self.burst = min(self.max_burst, limit)
+        self._refill()
+        if remaining is not None:
+            self._tokens = min(self._tokens, remaining)
+
+        if response.status_code == 429 or remaining == 0:
+            wait = parse_retry_after(headers)
+            if wait:
+                self._blocked_until = max(self._blocked_until, time.monotonic() + wait)
+        if response.status_code == 429:
+            self._slow_down(0.5)
+        elif near_limit:
+            self._slow_down(0.75)
+        elif self.rate < self._ceiling:
+            self.rate = min(self._ceiling, self.rate + self._ceiling * RECOVERY_STEP)
+
+    def _slow_down(self, factor: float) -> None:
+        self.rate = max(MIN_RATE, self.rate * factor)
+        self._stats["slowdowns"] += 1
+
+    def stats(self) -> dict[str, Any]:
+        self._refill()
+        return {
+            "rate": round(self.rate, 3),
+            "burst": self.burst,
+            "tokens": round(self._tokens, 3),
+            **self._stats,
+            "wait_seconds": round(self._stats["wait_seconds"], 3),
+        }
+
+
+class RateLimiterRegistry:
+    """One token bucket per upstream host, shared by every client talking to it.
+
+    Jira and Confluence Cloud live on the same ``*.atlassian.net`` host and
+    share its rate limit, so they must draw from the same bucket.
+    """
+
+    def __init__(self, config: RateLimitConfig) -> None:
+        self.config = config
+        self._buckets: dict[str, TokenBucket] = {}
+
+    def for_url(self, url: str) -> TokenBucket | None:
+        """Return the bucket for the URL's host, or None when rate limiting is disabled."""
+        if not self.config.enabled:
+            return None
+        host = (urlparse(url).hostname or url).lower()
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = TokenBucket(self.config.rate, self.config.burst)
+            self._buckets[host] = bucket
+        return bucket
+
+    def stats(self) -> dict[str, Any]:
+        return {host: bucket.stats() for host, bucket in self._buckets.items()}
@@ -0,0 +1,96 @@
+"""Retry policy for Atlassian API requests — jittered backoff and server wait hints."""
+
+from __future__ import annotations
+
+import random
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import httpx
+
+RETRYABLE_STATUSES = frozenset({429, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Numeric X-RateLimit-Reset values above this are epoch seconds, below are a delta.
+_EPOCH_THRESHOLD = 1_000_000_000
+
+
+def _parse_timestamp(value: str) -> float | None:
+    """Parse an epoch, delta-seconds, ISO 8601 or HTTP-date value into epoch seconds."""
+    value = value.strip()
+    if not value:
+        return None
+    try:
+        number = float(value)
+    except ValueError:
+        pass
+    else:
+        return number if number > _EPOCH_THRESHOLD else time.time() + number
+    try:
+        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        try:
+            dt = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+def parse_retry_after(headers: httpx.Headers) -> float | None:
+    """Return the server-requested wait in seconds, or None if the response gives no hint.
+
+    ``Retry-After`` (delta-seconds or HTTP-date) takes precedence over
+    ``X-RateLimit-Reset`` (epoch seconds or ISO 8601, as sent by Jira Cloud).
+    """
+    for name in ("Retry-After", "X-RateLimit-Reset"):
+        raw = headers.get(name)
+        if raw is None:
+            continue
+        if name == "Retry-After" and raw.strip().isdigit():
+            return float(raw.strip())
+        reset_at = _parse_timestamp(raw)
+        if reset_at is not None:
+            return max(0.0, reset_at - time.time())
+    return None
+
+
+@dataclass
+class RetryPolicy:
+    """When and how long to wait before re-sending a failed request.
+
+    Only idempotent methods are retried unless the caller opts in per request.
+    ``max_wait`` is the total sleep budget for one logical request — a server
+    asking us to wait longer than what remains ends the retry loop early.
+    """
+
+    max_retries: int = 3
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+    max_wait: float = 60.0
+    statuses: frozenset[int] = field(default=RETRYABLE_STATUSES)
+    methods: frozenset[str] = field(default=IDEMPOTENT_METHODS)
+
+    def allows(self, method: str, idempotent: bool | None = None) -> bool:
+        """Whether requests with this method may be retried at all."""
+        if self.max_retries <= 0:
+            return False
+        if idempotent is not None:
+            return idempotent
+        return method.upper() in self.methods
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff for the given zero-based attempt."""
+        ceiling = min(self.backoff_max, self.backoff_base * (2**attempt))
+        return random.uniform(0, ceiling)  # noqa: S311 — jitter, not crypto
+
+    def delay(self, attempt: int, response: httpx.Response | None = None) -> float:
+        """Delay before the next attempt, preferring the server's own hint."""
+        if response is not None:
+            hinted = parse_retry_after(response.headers)
+            if hinted is not None:
+                return hinted
+        return self.backoff(attempt)
@@ -0,0 +1,41 @@
+"""Single-flight coalescing — concurrent identical calls share one in-flight request."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+
+class SingleFlight:
+    """Run at most one call per key at a time; concurrent callers await the same result.
+
+    The shared call runs as its own task, so a caller that is cancelled does
+    not cancel the request for the others. Results are shared objects and
+    must not be mutated. Exceptions propagate to every waiting caller.
+    """
+
+    def __init__(self) -> None:
+        self._in_flight: dict[str, asyncio.Task[Any]] = {}
+        self._stats = {"calls": 0, "coalesced": 0}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        self._stats["calls"] += 1
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda t: self._finish(key, t))
+        else:
+            self._stats["coalesced"] += 1
+        return await asyncio.shield(task)
+
+    def _finish(self, key: str, task: asyncio.Task[Any]) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # Mark the exception as retrieved in case every caller was cancelled.
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> dict[str, Any]:
+        return {"in_flight": len(self._in_flight), **self._stats}
@@ -0,0 +1,195 @@
+"""Local SQLite store of time-off events with the date windows already fetched per calendar."""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from datetime import date, timedelta
+from typing import Any
+
+# Bump when the schema changes; the store is a cache, so an old file is rebuilt.
+_SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    calendar_id TEXT NOT NULL,
+    event_key TEXT NOT NULL,
+    id TEXT,
+    person_name TEXT NOT NULL,
+    person_email TEXT,
+    person_id TEXT,
+    description TEXT NOT NULL,
+    start_date TEXT NOT NULL,
+    end_date TEXT NOT NULL,
+    calendar_name TEXT NOT NULL,
+    sub_calendar_id TEXT,
+    all_day INTEGER NOT NULL,
+    PRIMARY KEY (calendar_id, event_key)
+);
+CREATE INDEX IF NOT EXISTS events_interval ON events (calendar_id, start_date, end_date);
+CREATE TABLE IF NOT EXISTS windows (
+    calendar_id TEXT NOT NULL,
+    start_date TEXT NOT NULL,
+    end_date TEXT NOT NULL,
+    fetched_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS windows_calendar ON windows (calendar_id, start_date);
+"""
+
+# Keys of a normalized time-off entry, in the order the tools return them.
+_FIELDS = (
+    "id",
+    "person_name",
+    "person_email",
+    "person_id",
+    "description",
+    "start_date",
+    "end_date",
+    "calendar_name",
+    "calendar_id",
+    "all_day",
+)
+
+_INSERT_EVENT = (
+    "INSERT OR REPLACE INTO events (calendar_id, event_key, id, person_name, person_email,"
+    " person_id, description, start_date, end_date, calendar_name, sub_calendar_id, all_day)"
+    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+_SELECT_EVENTS = (
+    "SELECT id, person_name, person_email, person_id, description, start_date, end_date,"
+    " calendar_name, sub_calendar_id, all_day FROM events"
+    " WHERE calendar_id = ? AND start_date <= ? AND end_date >= ?"
+    " ORDER BY start_date, end_date, event_key"
+)
+
+
+def _day(value: str) -> date:
+    return date.fromisoformat(value[:10])
+
+
+class TimeOffStore:
+    """Normalized time-off events plus the (calendar, date window) ranges they cover.
+
+    ``missing`` reports the parts of a requested range that have not been
+    fetched within ``ttl`` seconds; only those need a calendar-services
+    call. ``events`` answers date-overlap queries from the interval index.
+    Dates are inclusive ISO ``YYYY-MM-DD`` strings. ``path`` defaults to an
+    in-memory database; pass a file path to keep the store across restarts.
+    Methods commit to SQLite, so async callers run them in a worker thread;
+    a lock serializes them.
+    """
+
+    def __init__(self, ttl: float, path: str = ":memory:") -> None:
+        self.ttl = ttl
+        self.path = path
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.RLock()
+        (version,) = self._db.execute("PRAGMA user_version").fetchone()
+        if version != _SCHEMA_VERSION:
+            self._db.executescript("DROP TABLE IF EXISTS events; DROP TABLE IF EXISTS windows;")
+            self._db.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+        self._db.executescript(_SCHEMA)
+        self._stats = {"windows_fetched": 0, "windows_reused": 0, "queries": 0}
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def missing(self, calendar_id: str, start: str, end: str) -> list[tuple[str, str]]:
+        """Sub-ranges of ``start``..``end`` with no fresh fetch recorded for the calendar."""
+        with self._lock:
+            self._expire(calendar_id)
+            rows = self._db.execute(
+                "SELECT start_date, end_date FROM windows"
+                " WHERE calendar_id = ? AND start_date <= ? AND end_date >= ?"
+                " ORDER BY start_date",
+                (calendar_id, end, start),
+            ).fetchall()
+        gaps: list[tuple[str, str]] = []
+        cursor, last = _day(start), _day(end)
+        for w_start, w_end in rows:
+            covered_from = _day(w_start)
+            if covered_from > cursor:
+                gap_end = min(covered_from - timedelta(1), last)
+                gaps.append((cursor.isoformat(), gap_end.isoformat()))
+            cursor = max(cursor, _day(w_end) + timedelta(1))
+            if cursor > last:
+                break
+        if cursor <= last:
+            gaps.append((cursor.isoformat(), last.isoformat()))
+        if not gaps:
+            self._stats["windows_reused"] += 1
+        return gaps
+
+    def save(self, calendar_id: str, start: str, end: str, events: Iterable[dict]) -> None:
+        """Replace the calendar's events overlapping the window and record it as fetched."""
+        with self._lock, self._db:
+            self._db.execute(
+                "DELETE FROM events WHERE calendar_id = ? AND start_date <= ? AND end_date >= ?",
+                (calendar_id, end, start),
+            )
+            self._db.executemany(
+                _INSERT_EVENT,
+                [
+                    (
+                        calendar_id,
+                        f"{e.get('id')}|{e['start_date']}|{e['end_date']}",
+                        e.get("id"),
+                        e["person_name"],
+                        e.get("person_email"),
+                        e.get("person_id"),
+                        e["description"],
+                        e["start_date"],
+                        e["end_date"],
+                        e["calendar_name"],
+                        e.get("calendar_id"),
+                        int(bool(e.get("all_day", True))),
+                    )
+                    for e in events
+                ],
+            )
+            self._db.execute(
+                "INSERT INTO windows (calendar_id, start_date, end_date, fetched_at)"
+                " VALUES (?, ?, ?, ?)",
+                (calendar_id, start, end, time.time()),
+            )
+        self._stats["windows_fetched"] += 1
+
+    def events(self, calendar_ids: list[str], start: str, end: str) -> list[dict]:
+        """Events overlapping ``start``..``end``, grouped in ``calendar_ids`` order."""
+        self._stats["queries"] += 1
+        result: list[dict] = []
+        for calendar_id in calendar_ids:
+            with self._lock:
+                rows = self._db.execute(_SELECT_EVENTS, (calendar_id, end, start)).fetchall()
+            for row in rows:
+                entry = dict(zip(_FIELDS, row, strict=True))
+                entry["all_day"] = bool(entry["all_day"])
+                result.append(entry)
+        return result
+
+    def clear(self) -> None:
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM events")
+            self._db.execute("DELETE FROM windows")
+
+    def _expire(self, calendar_id: str) -> None:
+        cutoff = time.time() - self.ttl
+        deleted = self._db.execute(
+            "DELETE FROM windows WHERE calendar_id = ? AND fetched_at < ?",
+            (calendar_id, cutoff),
+        ).rowcount
+        # Only pay for a commit (an fsync on a file database) when a window expired.
+        if deleted > 0:
+            self._db.commit()
+        else:
+            self._db.rollback()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            (events,) = self._db.execute("SELECT COUNT(*) FROM events").fetchone()
+            (windows,) = self._db.execute("SELECT COUNT(*) FROM windows").fetchone()
+        return {"events": events, "windows": windows, **self._stats}
@@ -23,6 +23,22 @@ class JiraConfig:
     read_only: bool = False
     timeout: int = 30
     ssl_verify: bool = True
+    max_retries: int = 3
+    retry_backoff: float = 0.5
+    retry_max_wait: float = 60.0
+    max_concurrency: int = 10
+    max_queue: int = 100
+    queue_timeout: float = 30.0
+    breaker_threshold: float = 0.5
+    breaker_window: int = 20
+    breaker_min_calls: int = 5
+    breaker_cooldown: float = 30.0
+    etag_cache_mb: float = 32.0
+    cache_max_mb: float = 64.0
+    page_parallelism: int = 4
+    max_attachment_mb: float = 100.0
+    attachment_cache_dir: str = ""
+    attachment_cache_mb: float = 1024.0
 
     @classmethod
     def from_env(cls) -> JiraConfig:
@@ -43,6 +59,22 @@ class JiraConfig:
             "0",
             "no",
         )
+        max_retries = int(os.getenv("JIRA_MAX_RETRIES", "3"))
+        retry_backoff = float(os.getenv("JIRA_RETRY_BACKOFF", "0.5"))
+        retry_max_wait = float(os.getenv("JIRA_RETRY_MAX_WAIT", "60"))
+        max_concurrency = int(os.getenv("JIRA_MAX_CONCURRENCY", "10"))
+        max_queue = int(os.getenv("JIRA_MAX_QUEUE", "100"))
+        queue_timeout = float(os.getenv("JIRA_QUEUE_TIMEOUT", "30"))
+        breaker_threshold = float(os.getenv("JIRA_BREAKER_THRESHOLD", "0.5"))
+        breaker_window = int(os.getenv("JIRA_BREAKER_WINDOW", "20"))
+        breaker_min_calls = int(os.getenv("JIRA_BREAKER_MIN_CALLS", "5"))
+        breaker_cooldown = float(os.getenv("JIRA_BREAKER_COOLDOWN", "30"))
+        etag_cache_mb = float(os.getenv("JIRA_ETAG_CACHE_MB", "32"))
+        cache_max_mb = float(os.getenv("JIRA_CACHE_MAX_MB", "64"))
+        page_parallelism = int(os.getenv("JIRA_PAGE_PARALLELISM", "4"))
+        max_attachment_mb = float(os.getenv("JIRA_MAX_ATTACHMENT_MB", "100"))
+        attachment_cache_dir = os.getenv("JIRA_ATTACHMENT_CACHE_DIR", "")
+        attachment_cache_mb = float(os.getenv("JIRA_ATTACHMENT_CACHE_MB", "1024"))
         return cls(
             url=url,
             token=token,
@@ -51,6 +83,22 @@ class JiraConfig:
             read_only=read_only,
             timeout=timeout,
             ssl_verify=ssl_verify,
+            max_retries=max_retries,
+            retry_backoff=retry_backoff,
+            retry_max_wait=retry_max_wait,
+            max_concurrency=max_concurrency,
+            max_queue=max_queue,
+            queue_timeout=queue_timeout,
+            breaker_threshold=breaker_threshold,
+            breaker_window=breaker_window,
+            breaker_min_calls=breaker_min_calls,
+            breaker_cooldown=breaker_cooldown,
+            etag_cache_mb=etag_cache_mb,
+            cache_max_mb=cache_max_mb,
+            page_parallelism=page_parallelism,
+            max_attachment_mb=max_attachment_mb,
+            attachment_cache_dir=attachment_cache_dir,
+            attachment_cache_mb=attachment_cache_mb,
         )
 
     @property
@@ -86,6 +134,22 @@ class ConfluenceConfig:
     read_only: bool = False
     timeout: int = 30
     ssl_verify: bool = True
+    max_retries: int = 3
+    retry_backoff: float = 0.5
+    retry_max_wait: float = 60.0
+    max_concurrency: int = 10
+    max_queue: int = 100
+    queue_timeout: float = 30.0
+    breaker_threshold: float = 0.5
+    breaker_window: int = 20
+    breaker_min_calls: int = 5
+    breaker_cooldown: float = 30.0
+    etag_cache_mb: float = 32.0
+    calendar_parallelism: int = 8
+    event_window_days: int = 31
+    calendar_index_ttl: float = 300.0
+    time_off_ttl: float = 300.0
+    time_off_db: str = ":memory:"
 
     @classmethod
     def from_env(cls) -> ConfluenceConfig:
@@ -108,6 +172,22 @@ class ConfluenceConfig:
             "0",
             "no",
         )
+        max_retries = int(os.getenv("CONFLUENCE_MAX_RETRIES", "3"))
+        retry_backoff = float(os.getenv("CONFLUENCE_RETRY_BACKOFF", "0.5"))
+        retry_max_wait = float(os.getenv("CONFLUENCE_RETRY_MAX_WAIT", "60"))
+        max_concurrency = int(os.getenv("CONFLUENCE_MAX_CONCURRENCY", "10"))
+        max_queue = int(os.getenv("CONFLUENCE_MAX_QUEUE", "100"))
+        queue_timeout = float(os.getenv("CONFLUENCE_QUEUE_TIMEOUT", "30"))
+        breaker_threshold = float(os.getenv("CONFLUENCE_BREAKER_THRESHOLD", "0.5"))
+        breaker_window = int(os.getenv("CONFLUENCE_BREAKER_WINDOW", "20"))
+        breaker_min_calls = int(os.getenv("CONFLUENCE_BREAKER_MIN_CALLS", "5"))
+        breaker_cooldown = float(os.getenv("CONFLUENCE_BREAKER_COOLDOWN", "30"))
+        etag_cache_mb = float(os.getenv("CONFLUENCE_ETAG_CACHE_MB", "32"))
+        calendar_parallelism = int(os.getenv("CONFLUENCE_CALENDAR_PARALLELISM", "8"))
+        event_window_days = int(os.getenv("CONFLUENCE_EVENT_WINDOW_DAYS", "31"))
+        calendar_index_ttl = float(os.getenv("CONFLUENCE_CALENDAR_INDEX_TTL", "300"))
+        time_off_ttl = float(os.getenv("CONFLUENCE_TIME_OFF_TTL", "300"))
+        time_off_db = os.getenv("CONFLUENCE_TIME_OFF_DB", ":memory:")
         return cls(
             url=url,
             token=token,
@@ -116,6 +196,22 @@ class ConfluenceConfig:
             read_only=read_only,
             timeout=timeout,
             ssl_verify=ssl_verify,
+            max_retries=max_retries,
+            retry_backoff=retry_backoff,
+            retry_max_wait=retry_max_wait,
+            max_concurrency=max_concurrency,
+            max_queue=max_queue,
+            queue_timeout=queue_timeout,
+            breaker_threshold=breaker_threshold,
+            breaker_window=breaker_window,
+            breaker_min_calls=breaker_min_calls,
+            breaker_cooldown=breaker_cooldown,
+            etag_cache_mb=etag_cache_mb,
+            calendar_parallelism=calendar_parallelism,
+            event_window_days=event_window_days,
+            calendar_index_ttl=calendar_index_ttl,
+            time_off_ttl=time_off_ttl,
+            time_off_db=time_off_db,
         )
 
     @property
@@ -133,3 +229,25 @@ class ConfluenceConfig:
             creds = base64.b64encode(f"{self.username}:{self.api_token}".encode()).decode()
             return {"Authorization": f"Basic {creds}"}
         return {}
+
+
+@dataclass
+class RateLimitConfig:
+    """Client-side rate limiting shared by all clients talking to the same host.
+
+    - ATLASSIAN_RATE_LIMIT: target requests per second per host (0 disables)
+    - ATLASSIAN_RATE_BURST: requests allowed back-to-back before smoothing kicks in
+    """
+
+    rate: float = 10.0
+    burst: float = 20.0
+
+    @classmethod
+    def from_env(cls) -> RateLimitConfig:
+        rate = float(os.getenv("ATLASSIAN_RATE_LIMIT", "10"))
+        burst = float(os.getenv("ATLASSIAN_RATE_BURST", "20"))
+        return cls(rate=rate, burst=burst)
+
+    @property
+    def enabled(self) -> bool:
+        return self.rate > 0 and self.burst >= 1
@@ -0,0 +1,89 @@
+"""Resolve user-supplied dates ("2025-03-03", "today", "+2w", "end of month") to dates.
+
+Plain ``YYYY-MM-DD`` strings take a fast path that only validates the value
+and returns it unchanged. Relative expressions are memoized per
+``(expression, today)``, so repeated calls within a day reuse the result and
+the cache never serves a stale "today". dateutil is imported only when a
+value is neither ISO nor a known expression.
+"""
+
+from __future__ import annotations
+
+import calendar
+import re
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+
+_OFFSET = re.compile(r"([+-])\s*(\d+)\s*([dwm])")
+
+# Sprint boundaries depend on the board; without one a sprint starts on Monday.
+_KEYWORDS = {
+    "today": lambda today: today,
+    "tomorrow": lambda today: today + timedelta(1),
+    "yesterday": lambda today: today - timedelta(1),
+    "start of week": lambda today: today - timedelta(today.weekday()),
+    "end of week": lambda today: today + timedelta(6 - today.weekday()),
+    "next week": lambda today: today + timedelta(7 - today.weekday()),
+    "next sprint": lambda today: today + timedelta(7 - today.weekday()),
+    "start of month": lambda today: today.replace(day=1),
+    "end of month": lambda today: _month_end(today),
+    "next month": lambda today: _add_months(today.replace(day=1), 1),
+    "end of next month": lambda today: _month_end(_add_months(today.replace(day=1), 1)),
+}
+
+
+def _month_end(day: date) -> date:
+    return day.replace(day=calendar.monthrange(day.year, day.month)[1])
+
+
+def _add_months(day: date, months: int) -> date:
+    year, month = divmod(day.month - 1 + months, 12)
+    first = date(day.year + year, month + 1, 1)
+    return first.replace(day=min(day.day, _month_end(first).day))
+
+
+def _is_iso(value: str) -> bool:
+    return len(value) == 10 and value[4] == "-" and value[7] == "-"
+
+
+def to_date(value: str | date) -> date:
+    """Parse an ISO ``YYYY-MM-DD`` string (fast path) or any dateutil-parsable date."""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    try:
+        return date.fromisoformat(value[:10])
+    except ValueError:
+        from dateutil.parser import parse as parse_date
+
+        return parse_date(value).date()
+
+
+def resolve_date(value: str, today: date | None = None) -> str:
+    """Resolve an absolute or relative date expression to ``YYYY-MM-DD``.
+
+    Accepts ISO dates, anything dateutil parses, the keywords in
+    ``_KEYWORDS`` ("today", "next sprint", "end of month", ...) and offsets
+    from today in days, weeks or months ("+14d", "-3d", "+2w", "+1m").
+    Raises ``ValueError`` for anything else.
+    """
+    if _is_iso(value):
+        date.fromisoformat(value)
+        return value
+    return _resolve(value.strip().lower(), today or date.today())
+
+
+@lru_cache(maxsize=256)
+def _resolve(expr: str, today: date) -> str:
+    keyword = _KEYWORDS.get(expr)
+    if keyword is not None:
+        return keyword(today).isoformat()
+    offset = _OFFSET.fullmatch(expr)
+    if offset:
+        sign, amount, unit = offset.groups()
+        n = int(amount) if sign == "+" else -int(amount)
+        if unit == "m":
+            return _add_months(today, n).isoformat()
+        return (today + timedelta(n * 7 if unit == "w" else n)).isoformat()
+    return to_date(expr).isoformat()
@@ -13,6 +13,8 @@ class AtlassianApiError(AtlassianError):
     def __init__(self, status_code: int, message: str, body: str = "") -> None:
         self.status_code = status_code
         self.body = body
+        self.retries = 0
+        self.circuit: dict | None = None
         super().__init__(f"Atlassian API Error {status_code}: {message}")
 
 
@@ -23,6 +25,33 @@ class AtlassianAuthError(AtlassianApiError):
         super().__init__(status_code, "Authentication failed", body)
 
 
+class BulkheadFullError(AtlassianError):
+    """Raised when too many requests to one upstream are already in flight or queued."""
+
+    def __init__(self, upstream: str, reason: str, active: int, waiting: int) -> None:
+        self.upstream = upstream
+        self.active = active
+        self.waiting = waiting
+        super().__init__(
+            f"Too many concurrent {upstream} requests ({reason}; "
+            f"{active} in flight, {waiting} queued)"
+        )
+
+
+class CircuitOpenError(AtlassianError):
+    """Raised without contacting the server while an endpoint family's circuit is open."""
+
+    def __init__(self, upstream: str, family: str, failure_rate: float, retry_after: float) -> None:
+        self.upstream = upstream
+        self.family = family
+        self.failure_rate = failure_rate
+        self.retry_after = retry_after
+        super().__init__(
+            f"{upstream} {family} is unavailable — circuit open after "
+            f"{failure_rate:.0%} of recent requests failed"
+        )
+
+
 class WriteDisabledError(AtlassianError):
     """Raised when a write operation is attempted in read-only mode."""
 
@@ -0,0 +1,117 @@
+"""Person index over time-off events — match team members by email, account ID or name."""
+
+from __future__ import annotations
+
+import bisect
+import re
+from collections import Counter
+from collections.abc import Iterable
+
+_TOKEN = re.compile(r"\w+")
+
+# Shorter tokens ("Al", "Ann") are too ambiguous to match as prefixes.
+MIN_PREFIX = 4
+
+
+def _tokens(value: str) -> list[str]:
+    return _TOKEN.findall(value.casefold())
+
+
+def group_by_person(events: Iterable[dict]) -> dict[str, list[dict]]:
+    """Events grouped per person, keyed by display name.
+
+    People are told apart by ``person_id``, then email, then exact display
+    name, so "John Smith" and "John Smith Jr" stay separate. Two people
+    sharing a display name get their email or account ID appended.
+    """
+    groups: dict[tuple[str, str], list[dict]] = {}
+    names: dict[tuple[str, str], str] = {}
+    for event in events:
+        name = event.get("person_name") or ""
+        if event.get("person_id"):
+            identity = ("id", str(event["person_id"]))
+        elif event.get("person_email"):
+            identity = ("email", event["person_email"].casefold())
+        else:
+            identity = ("name", name)
+        groups.setdefault(identity, []).append(event)
+        names.setdefault(identity, name)
+    shared = Counter(names.values())
+    result: dict[str, list[dict]] = {}
+    for identity, group in groups.items():
+        name = names[identity]
+        result[name if shared[name] == 1 else f"{name} ({identity[1]})"] = group
+    return result
+
+
+class PersonIndex:
+    """Hash lookups from email, account ID and display-name tokens to events.
+
+    Built once per event list. ``match`` resolves a team member to their
+    events with dictionary probes instead of scanning every event:
+
+    - a value containing ``@`` matches ``person_email`` case-insensitively;
+    - a value equal to an invitee account ID matches that person;
+    - anything else is split into name tokens and matches events whose
+      display name contains every token ("Alice", "alice smith").
+
+    With ``prefix=True``, a name with no whole-token match is retried with
+    its tokens of ``MIN_PREFIX`` or more characters matched as prefixes
+    ("Alic"); shorter tokens must still match whole. This suits a search for
+    one person, not a roster: a member with no events would otherwise pick
+    up someone else's. With ``exact_email=True`` only the email rule applies.
+    """
+
+    def __init__(self, events: Iterable[dict]) -> None:
+        self.events = list(events)
+        self.by_email: dict[str, list[int]] = {}
+        self.by_id: dict[str, list[int]] = {}
+        self.by_token: dict[str, set[int]] = {}
+        for i, event in enumerate(self.events):
+            email = event.get("person_email")
+            if email:
+                self.by_email.setdefault(email.casefold(), []).append(i)
+            person_id = event.get("person_id")
+            if person_id:
+                self.by_id.setdefault(str(person_id), []).append(i)
+            for token in _tokens(event.get("person_name") or ""):
+                self.by_token.setdefault(token, set()).add(i)
+        self._sorted_tokens = sorted(self.by_token)
+
+    def match(self, member: str, *, exact_email: bool = False, prefix: bool = False) -> list[dict]:
+        """Events belonging to ``member``, in their original order."""
+        ids = self._match_ids(member.strip(), exact_email, prefix)
+        return [self.events[i] for i in sorted(ids)]
+
+    def _match_ids(self, member: str, exact_email: bool, prefix: bool) -> set[int]:
+        if "@" in member or exact_email:
+            return set(self.by_email.get(member.casefold(), ()))
+        if member in self.by_id:
+            return set(self.by_id[member])
+        tokens = _tokens(member)
+        if not tokens:
+            return set()
+        exact = self._intersect(self.by_token.get(t, set()) for t in tokens)
+        if exact or not prefix:
+            return exact
+        return self._intersect(
+            self._prefixed(t) if len(t) >= MIN_PREFIX else self.by_token.get(t, set())
+            for t in tokens
+        )
+
+    def _prefixed(self, prefix: str) -> set[int]:
+        ids: set[int] = set()
+        i = bisect.bisect_left(self._sorted_tokens, prefix)
+        while i < len(self._sorted_tokens) and self._sorted_tokens[i].startswith(prefix):
+            ids |= self.by_token[self._sorted_tokens[i]]
+            i += 1
+        return ids
+
+    @staticmethod
+    def _intersect(groups: Iterable[set[int]]) -> set[int]:
+        result: set[int] | None = None
+        for group in groups:
+            result = set(group) if result is None else result & group
+            if not result:
+                return set()
+        return result or set()
@@ -13,7 +13,8 @@ from fastmcp import FastMCP
 
 from ..clients.confluence import ConfluenceExtendedClient
 from ..clients.jira import JiraExtendedClient
-from ..config import ConfluenceConfig, JiraConfig
+from ..clients.ratelimit import RateLimiterRegistry
+from ..config import ConfluenceConfig, JiraConfig, RateLimitConfig
 
 _log = logging.getLogger(__name__)
 
@@ -22,6 +23,7 @@ _log = logging.getLogger(__name__)
 async def lifespan(server: FastMCP) -> AsyncIterator[dict[str, Any]]:
     jira_config = JiraConfig.from_env()
     confluence_config = ConfluenceConfig.from_env()
+    rate_limit_config = RateLimitConfig.from_env()
 
     pkg_version = version("mcp-atlassian-extended")
     _log.info("mcp-atlassian-extended %s starting", pkg_version)
@@ -37,10 +39,25 @@ async def lifespan(server: FastMCP) -> AsyncIterator[dict[str, Any]]:
         confluence_config.is_configured,
         confluence_config.read_only,
     )
+    _log.info(
+        "Rate limit: %s",
+        f"{rate_limit_config.rate:g} req/s per host, burst {rate_limit_config.burst:g}"
+        if rate_limit_config.enabled
+        else "disabled",
+    )
 
-    jira_client = JiraExtendedClient(jira_config) if jira_config.is_configured else None
+    rate_limiters = RateLimiterRegistry(rate_limit_config)
+    jira_client = (
+        JiraExtendedClient(jira_config, rate_limiter=rate_limiters.for_url(jira_config.url))
+        if jira_config.is_configured
+        else None
+    )
     confluence_client = (
-        ConfluenceExtendedClient(confluence_config) if confluence_config.is_configured else None
+        ConfluenceExtendedClient(
+            confluence_config, rate_limiter=rate_limiters.for_url(confluence_config.url)
+        )
+        if confluence_config.is_configured
+        else None
     )
 
     try:
@@ -49,6 +66,7 @@ async def lifespan(server: FastMCP) -> AsyncIterator[dict[str, Any]]:
             "jira_config": jira_config,
             "confluence_client": confluence_client,
             "confluence_config": confluence_config,
+            "rate_limiters": rate_limiters,
         }
     finally:
         if jira_client:
@@ -75,6 +93,7 @@ def _register_tools() -> None:
     importlib.import_module(".jira_agile", __package__)
     importlib.import_module(".jira_issues", __package__)
     importlib.import_module(".confluence_extended", __package__)
+    importlib.import_module(".diagnostics", __package__)
     importlib.import_module(".resources", __package__)
     importlib.import_module(".prompts", __package__)
 
@@ -8,6 +8,7 @@ import re
 from pathlib import Path
 from typing import Any
 
+import httpx
 from fastmcp import Context
 
 from ..clients.confluence import ConfluenceExtendedClient
@@ -56,6 +57,22 @@ def _check_write(ctx: Context) -> None:
         raise WriteDisabledError
 
 
+def _local_path(save_path: str) -> Path:
+    """Resolve a relative path inside the working directory, rejecting escapes."""
+    save = Path(save_path)
+    if save.is_absolute():
+        msg = "Absolute paths are not allowed. Use a relative path from the working directory."
+        raise ValueError(msg)
+    if ".." in save.parts:
+        msg = f"Path traversal detected in save_path: {save_path}"
+        raise ValueError(msg)
+    resolved = (Path.cwd() / save).resolve()
+    if not resolved.is_relative_to(Path.cwd().resolve()):
+        msg = f"Path traversal detected in save_path: {save_path}"
+        raise ValueError(msg)
+    return resolved
+
+
 def _ok(data: Any) -> str:
     return json.dumps(data, indent=2, ensure_ascii=False)
 
@@ -74,7 +91,13 @@ def _paginated(items: list) -> str:
 
 def _err(error: Exception) -> str:
     """Format error as JSON with actionable hints."""
-    from ..exceptions import AtlassianApiError, AtlassianAuthError, WriteDisabledError
+    from ..exceptions import (
+        AtlassianApiError,
+        AtlassianAuthError,
+        BulkheadFullError,
+        CircuitOpenError,
+        WriteDisabledError,
+    )
 
     detail: dict[str, Any] = {"error": str(error)}
 
@@ -85,6 +108,25 @@ def _err(error: Exception) -> str:
             "Check authentication. For Jira Data Center use JIRA_PAT; "
             "for Jira Cloud use JIRA_USERNAME + JIRA_API_TOKEN."
         )
+    elif isinstance(error, CircuitOpenError):
+        detail["circuit"] = {
+            "family": error.family,
+            "state": "open" if error.retry_after else "half_open",
+            "failure_rate": round(error.failure_rate, 2),
+            "retry_after_seconds": round(error.retry_after, 1),
+        }
+        detail["hint"] = (
+            f"{error.upstream} is failing — requests to {error.family} are short-circuited "
+            f"without contacting the server. Do not retry for {error.retry_after:.0f}s; "
+            "the circuit closes automatically once a probe request succeeds."
+        )
+    elif isinstance(error, BulkheadFullError):
+        detail["active"] = error.active
+        detail["waiting"] = error.waiting
+        detail["hint"] = (
+            f"{error.upstream} is saturated with concurrent requests. Retry shortly, "
+            "issue fewer parallel calls, or raise the *_MAX_CONCURRENCY / *_MAX_QUEUE limits."
+        )
     elif isinstance(error, WriteDisabledError):
         detail["hint"] = (
             "Server is in read-only mode. Set ATLASSIAN_READ_ONLY=false to enable writes."
@@ -92,6 +134,10 @@ def _err(error: Exception) -> str:
     elif isinstance(error, AtlassianApiError):
         detail["status_code"] = error.status_code
         detail["body"] = error.body
+        if error.retries:
+            detail["retries"] = error.retries
+        if error.circuit:
+            detail["circuit"] = error.circuit
         if error.status_code == 404:
             detail["hint"] = (
                 "Resource not found. Verify the issue key format (PROJ-123) "
@@ -104,7 +150,31 @@ def _err(error: Exception) -> str:
         elif error.status_code == 422:
             detail["hint"] = "Validation failed — check required fields and formats."
         elif error.status_code == 429:
-            detail["hint"] = "Rate limited. Wait before retrying."
+            if error.retries:
+                detail["hint"] = (
+                    f"Rate limited — still throttled after {error.retries} automatic retries. "
+                    "Wait before retrying."
+                )
+            else:
+                detail["hint"] = "Rate limited. Wait before retrying."
+        elif error.circuit and error.circuit["state"] == "open":
+            detail["hint"] = (
+                "Server errors tripped the circuit breaker — further requests to this "
+                f"API fail fast for {error.circuit.get('retry_after_seconds', 0):.0f}s. "
+                "Do not retry until then."
+            )
+        elif error.status_code >= 500 and error.retries:
+            detail["hint"] = (
+                f"Server error persisted after {error.retries} automatic retries. "
+                "The instance may be degraded — try again later."
+            )
+    elif isinstance(error, httpx.TimeoutException):
+        detail["hint"] = (
+            "Request timed out. The instance may be slow or down; repeated failures open "
+            "a circuit breaker so later calls fail fast instead of waiting."
+        )
+    elif isinstance(error, httpx.TransportError):
+        detail["hint"] = "Could not reach the server. Check the instance URL and network access."
     elif isinstance(error, ValueError):
         msg = str(error).lower()
         if "not configured" in msg:
@@ -115,7 +185,9 @@ def _err(error: Exception) -> str:
         elif "traversal" in msg:
             detail["hint"] = "Path traversal is not allowed for security reasons."
         elif "too large" in msg:
-            detail["hint"] = "File exceeds the 100MB size limit."
+            detail["hint"] = (
+                "File exceeds the attachment size limit; raise JIRA_MAX_ATTACHMENT_MB to allow it."
+            )
     elif isinstance(error, FileNotFoundError):
         detail["hint"] = "File not found. Check the file path exists and is accessible."
 
@@ -2,38 +2,30 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
-from typing import Annotated
+from datetime import timedelta
+from typing import Annotated, Literal
 
-from dateutil.parser import parse as parse_date
 from fastmcp import Context
 from pydantic import Field
 
+from ..dates import resolve_date as _resolve_date
+from ..dates import to_date
+from ..people import PersonIndex
+from ..people import group_by_person as _group_by_person
+from ..workdays import DayRange, run_length
 from . import mcp
 from ._helpers import _err, _get_confluence, _ok, _paginated
 
 
-def _resolve_date(value: str) -> str:
-    """Resolve relative dates like 'today', '+14d', 'next week' to ISO format."""
-    v = value.strip().lower()
-    now = datetime.now()
-
-    if v == "today":
-        return now.strftime("%Y-%m-%d")
-    if v == "tomorrow":
-        return (now + timedelta(days=1)).strftime("%Y-%m-%d")
-    if v == "next week":
-        days_until_monday = (7 - now.weekday()) % 7 or 7
-        return (now + timedelta(days=days_until_monday)).strftime("%Y-%m-%d")
-    if v.startswith("+") and v.endswith("d"):
-        days = int(v[1:-1])
-        return (now + timedelta(days=days)).strftime("%Y-%m-%d")
-    if v.startswith("-") and v.endswith("d"):
-        days = int(v[1:-1])
-        return (now - timedelta(days=days)).strftime("%Y-%m-%d")
-
-    # Try ISO parse
-    return parse_date(value).strftime("%Y-%m-%d")
+def _with_failures(data: dict, failures: list[dict]) -> dict:
+    """Report leave calendars that could not be read alongside partial results."""
+    if failures:
+        data["failed_calendars"] = failures
+        data["hint"] = (
+            "Some leave calendars could not be read; results may be incomplete. "
+            "Retry later or check access to the listed calendars."
+        )
+    return data
 
 
 @mcp.tool(
@@ -48,32 +40,9 @@ async def confluence_list_calendars(
 ) -> str:
     """List all Confluence calendars."""
     try:
-        data = await _get_confluence(ctx).list_calendars()
-        if filter_type:
-            ft = filter_type.lower()
-            data = [
-                w
-                for w in data
-                if ft in w.get("subCalendar", {}).get("typeKey", "").lower()
-                or ft in w.get("subCalendar", {}).get("name", "").lower()
-            ]
-        # Simplify output
-        result = []
-        for wrapper in data:
-            sub = wrapper.get("subCalendar", {})
-            children = wrapper.get("childSubCalendars", [])
-            result.append(
-                {
-                    "id": sub.get("id"),
-                    "name": sub.get("name"),
-                    "type": sub.get("typeKey"),
-                    "space_key": sub.get("spaceKey"),
-                    "space_name": sub.get("spaceName"),
-                    "child_count": len(children),
-                    "child_ids": [c.get("subCalendar", {}).get("id") for c in children],
-                }
-            )
-        return _paginated(result)
+        index = await _get_confluence(ctx).calendar_index()
+        entries = index.filter_type(filter_type) if filter_type else index.entries
+        return _paginated([entry.summary() for entry in entries])
     except Exception as e:
         return _err(e)
 
@@ -90,26 +59,8 @@ async def confluence_search_calendars(
 ) -> str:
     """Search Confluence calendars by name or space."""
     try:
-        data = await _get_confluence(ctx).list_calendars()
-        q = query.lower()
-        matched = []
-        for wrapper in data:
-            sub = wrapper.get("subCalendar", {})
-            if (
-                q in sub.get("name", "").lower()
-                or q in sub.get("spaceName", "").lower()
-                or q in sub.get("spaceKey", "").lower()
-            ):
-                matched.append(
-                    {
-                        "id": sub.get("id"),
-                        "name": sub.get("name"),
-                        "type": sub.get("typeKey"),
-                        "space_key": sub.get("spaceKey"),
-                        "space_name": sub.get("spaceName"),
-                    }
-                )
-        return _paginated(matched)
+        index = await _get_confluence(ctx).calendar_index()
+        return _paginated([entry.summary(children=False) for entry in index.search(query)])
     except Exception as e:
         return _err(e)
 
@@ -129,16 +80,15 @@ async def confluence_get_time_off(
     try:
         start = _resolve_date(start_date)
         end = _resolve_date(end_date)
-        events = await _get_confluence(ctx).get_time_off_events(start, end, calendar_name)
+        events, failures = await _get_confluence(ctx).collect_time_off_events(
+            start, end, calendar_name
+        )
 
         if group_by_person:
-            grouped: dict[str, list[dict]] = {}
-            for e in events:
-                name = e["person_name"]
-                grouped.setdefault(name, []).append(e)
-            return _ok({"start": start, "end": end, "people": grouped})
+            grouped = _group_by_person(events)
+            return _ok(_with_failures({"start": start, "end": end, "people": grouped}, failures))
 
-        return _ok({"start": start, "end": end, "events": events})
+        return _ok(_with_failures({"start": start, "end": end, "events": events}, failures))
     except Exception as e:
         return _err(e)
 
@@ -154,9 +104,11 @@ async def confluence_who_is_out(
     """Check who is out on a specific date."""
     try:
         d = _resolve_date(date)
-        events = await _get_confluence(ctx).get_time_off_events(d, d)
-        people = list({e["person_name"] for e in events})
-        return _ok({"date": d, "people_out": people, "count": len(people)})
+        events, failures = await _get_confluence(ctx).collect_time_off_events(d, d)
+        people = list(_group_by_person(events))
+        return _ok(
+            _with_failures({"date": d, "people_out": people, "count": len(people)}, failures)
+        )
     except Exception as e:
         return _err(e)
 
@@ -167,19 +119,29 @@ async def confluence_who_is_out(
 )
 async def confluence_get_person_time_off(
     ctx: Context,
-    person: Annotated[str, Field(description="Person name to search for", min_length=1)],
+    person: Annotated[
+        str, Field(description="Person name, email, or account ID to search for", min_length=1)
+    ],
     calendar_name: Annotated[str, Field(description="Calendar name to search in", min_length=1)],
     start_date: Annotated[str, Field(description="Start date")],
     end_date: Annotated[str, Field(description="End date")],
+    exact_email: Annotated[
+        bool, Field(description="Match `person` only as an exact email address")
+    ] = False,
 ) -> str:
     """Get a specific person's time-off events."""
     try:
         start = _resolve_date(start_date)
         end = _resolve_date(end_date)
-        all_events = await _get_confluence(ctx).get_time_off_events(start, end, calendar_name)
-        person_lower = person.lower()
-        matched = [e for e in all_events if person_lower in e["person_name"].lower()]
-        return _ok({"person": person, "start": start, "end": end, "events": matched})
+        all_events, failures = await _get_confluence(ctx).collect_time_off_events(
+            start, end, calendar_name
+        )
+        matched = PersonIndex(all_events).match(person, exact_email=exact_email, prefix=True)
+        return _ok(
+            _with_failures(
+                {"person": person, "start": start, "end": end, "events": matched}, failures
+            )
+        )
     except Exception as e:
         return _err(e)
 
@@ -190,53 +152,38 @@ async def confluence_get_person_time_off(
 )
 async def confluence_sprint_capacity(
     ctx: Context,
-    team_members: Annotated[list[str], Field(description="List of team member names")],
+    team_members: Annotated[
+        list[str], Field(description="Team member names, emails, or account IDs")
+    ],
     sprint_start: Annotated[str, Field(description="Sprint start date")],
     sprint_end: Annotated[str, Field(description="Sprint end date")],
     working_days_per_week: Annotated[
         int, Field(description="Working days per week", ge=1, le=7)
     ] = 5,
+    exact_email: Annotated[
+        bool, Field(description="Match team members only as exact email addresses")
+    ] = False,
 ) -> str:
     """Calculate sprint capacity considering team time-off."""
     try:
         start = _resolve_date(sprint_start)
         end = _resolve_date(sprint_end)
 
-        # Calculate working days
-        start_dt = parse_date(start)
-        end_dt = parse_date(end)
-        total_days = 0
-        current = start_dt
-        # Map working_days_per_week to non-working weekdays.
-        # 7=all days, 6=skip Sun, 5=skip Sat+Sun, 4=skip Fri+Sat+Sun, etc.
-        weekend_days = set(range(working_days_per_week, 7))
-        while current <= end_dt:
-            if current.weekday() not in weekend_days:
-                total_days += 1
-            current += timedelta(days=1)
+        sprint = DayRange(start, end, working_days_per_week)
+        total_days = sprint.working_days
 
         # Get time-off events
-        all_events = await _get_confluence(ctx).get_time_off_events(start, end)
+        all_events, failures = await _get_confluence(ctx).collect_time_off_events(start, end)
 
+        people = PersonIndex(all_events)
         member_breakdown = []
         total_days_off = 0
 
         for member in team_members:
-            member_lower = member.lower()
-            member_events = [e for e in all_events if member_lower in e["person_name"].lower()]
-
-            # Count unique off-days (within sprint working days)
-            off_dates: set[str] = set()
-            for event in member_events:
-                ev_start = max(parse_date(event["start_date"]), start_dt)
-                ev_end = min(parse_date(event["end_date"]), end_dt)
-                d = ev_start
-                while d <= ev_end:
-                    if d.weekday() not in weekend_days:
-                        off_dates.add(d.strftime("%Y-%m-%d"))
-                    d += timedelta(days=1)
-
-            days_off = len(off_dates)
+            member_events = people.match(member, exact_email=exact_email)
+
+            # Unique off-days within the sprint's working days
+            days_off = sprint.off_days((e["start_date"], e["end_date"]) for e in member_events)
             total_days_off += days_off
             member_breakdown.append(
                 {
@@ -253,22 +200,247 @@ async def confluence_sprint_capacity(
                 }
             )
 
-        max_capacity = total_days * len(team_members)
-        available = max_capacity - total_days_off
-        pct = round((available / max_capacity * 100), 1) if max_capacity > 0 else 0
+        return _ok(
+            _with_failures(
+                {
+                    "sprint": {"start": start, "end": end, "working_days": total_days},
+                    "team": _team_capacity(total_days, len(team_members), total_days_off),
+                    "member_breakdown": member_breakdown,
+                },
+                failures,
+            )
+        )
+    except Exception as e:
+        return _err(e)
+
+
+def _team_capacity(working_days: int, members: int, days_off: int) -> dict:
+    max_capacity = working_days * members
+    available = max_capacity - days_off
+    pct = round((available / max_capacity * 100), 1) if max_capacity > 0 else 0
+    return {
+        "members": members,
+        "max_capacity_days": max_capacity,
+        "total_days_off": days_off,
+        "available_capacity_days": available,
+        "capacity_percentage": pct,
+    }
+
+
+def _sprint_windows(
+    first_sprint_start: str | None,
+    sprint_length_days: int,
+    sprint_count: int | None,
+    sprints: list[str] | None,
+) -> list[tuple[str, str]]:
+    """Resolve explicit ``START/END`` windows or a cadence into ISO date pairs.
+
+    The two modes are exclusive: ``sprints`` with ``first_sprint_start`` or
+    ``sprint_count`` is rejected rather than one of them being ignored.
+    """
+    if sprints:
+        if first_sprint_start or sprint_count:
+            msg = "Provide either sprints or first_sprint_start with sprint_count, not both."
+            raise ValueError(msg)
+        windows = []
+        for window in sprints:
+            start, sep, end = window.partition("/")
+            if not sep:
+                msg = f"Sprint window must be 'START/END', got: {window}"
+                raise ValueError(msg)
+            start, end = _resolve_date(start), _resolve_date(end)
+            if end < start:
+                msg = f"Sprint window ends before it starts: {window}"
+                raise ValueError(msg)
+            windows.append((start, end))
+        return windows
+    if first_sprint_start and sprint_count:
+        first = to_date(_resolve_date(first_sprint_start))
+        return [
+            (
+                (first + timedelta(days=i * sprint_length_days)).isoformat(),
+                (first + timedelta(days=(i + 1) * sprint_length_days - 1)).isoformat(),
+            )
+            for i in range(sprint_count)
+        ]
+    msg = "Provide either sprints or first_sprint_start with sprint_count."
+    raise ValueError(msg)
+
+
+@mcp.tool(
+    tags={"confluence", "time_off", "read"},
+    annotations={"readOnlyHint": True, "idempotentHint": True, "openWorldHint": True},
+)
+async def confluence_capacity_forecast(
+    ctx: Context,
+    team_members: Annotated[
+        list[str], Field(description="Team member names, emails, or account IDs")
+    ],
+    first_sprint_start: Annotated[
+        str | None, Field(description="Start date of the first sprint (cadence mode)")
+    ] = None,
+    sprint_length_days: Annotated[
+        int, Field(description="Calendar days per sprint (cadence mode)", ge=1, le=90)
+    ] = 14,
+    sprint_count: Annotated[
+        int | None, Field(description="Number of sprints to forecast (cadence mode)", ge=1, le=26)
+    ] = None,
+    sprints: Annotated[
+        list[str] | None,
+        Field(
+            description="Explicit sprint windows as 'START/END' (e.g. '2025-03-03/2025-03-14'); "
+            "replaces the cadence arguments"
+        ),
+    ] = None,
+    working_days_per_week: Annotated[
+        int, Field(description="Working days per week", ge=1, le=7)
+    ] = 5,
+    exact_email: Annotated[
+        bool, Field(description="Match team members only as exact email addresses")
+    ] = False,
+) -> str:
+    """Forecast team capacity for several sprints with one time-off fetch."""
+    try:
+        windows = _sprint_windows(first_sprint_start, sprint_length_days, sprint_count, sprints)
+        start = min(w[0] for w in windows)
+        end = max(w[1] for w in windows)
+        all_events, failures = await _get_confluence(ctx).collect_time_off_events(start, end)
+
+        people = PersonIndex(all_events)
+        spans = {
+            member: [
+                (e["start_date"], e["end_date"])
+                for e in people.match(member, exact_email=exact_email)
+            ]
+            for member in team_members
+        }
+
+        forecast = []
+        working_days = 0
+        days_off_total = 0
+        for number, (sprint_start, sprint_end) in enumerate(windows, start=1):
+            sprint = DayRange(sprint_start, sprint_end, working_days_per_week)
+            members = []
+            for member in team_members:
+                days_off = sprint.off_days(spans[member])
+                members.append(
+                    {
+                        "member": member,
+                        "days_off": days_off,
+                        "available_days": sprint.working_days - days_off,
+                    }
+                )
+            sprint_days_off = sum(m["days_off"] for m in members)
+            working_days += sprint.working_days
+            days_off_total += sprint_days_off
+            forecast.append(
+                {
+                    "sprint": number,
+                    "start": sprint_start,
+                    "end": sprint_end,
+                    "working_days": sprint.working_days,
+                    "team": _team_capacity(sprint.working_days, len(team_members), sprint_days_off),
+                    "members": members,
+                }
+            )
 
+        totals = {
+            "working_days": working_days,
+            **_team_capacity(working_days, len(team_members), days_off_total),
+        }
         return _ok(
-            {
-                "sprint": {"start": start, "end": end, "working_days": total_days},
-                "team": {
-                    "members": len(team_members),
-                    "max_capacity_days": max_capacity,
-                    "total_days_off": total_days_off,
-                    "available_capacity_days": available,
-                    "capacity_percentage": pct,
+            _with_failures(
+                {
+                    "range": {"start": start, "end": end},
+                    "sprints": forecast,
+                    "totals": totals,
                 },
-                "member_breakdown": member_breakdown,
+                failures,
+            )
+        )
+    except Exception as e:
+        return _err(e)
+
+
+# Longest range the availability grid covers in one call.
+MAX_AVAILABILITY_DAYS = 366
+
+
+@mcp.tool(
+    tags={"confluence", "time_off", "read"},
+    annotations={"readOnlyHint": True, "idempotentHint": True, "openWorldHint": True},
+)
+async def confluence_team_availability(
+    ctx: Context,
+    start_date: Annotated[str, Field(description="Start date (YYYY-MM-DD, 'today', '+14d', etc.)")],
+    end_date: Annotated[str, Field(description="End date (YYYY-MM-DD, 'today', '+14d', etc.)")],
+    team_members: Annotated[
+        list[str] | None,
+        Field(description="Team member names, emails, or account IDs (default: everyone on leave)"),
+    ] = None,
+    calendar_name: Annotated[str | None, Field(description="Filter by calendar name")] = None,
+    working_days_per_week: Annotated[
+        int, Field(description="Working days per week", ge=1, le=7)
+    ] = 5,
+    encoding: Annotated[
+        Literal["grid", "rle"],
+        Field(description="'grid': one character per day; 'rle': run-length encoded grid"),
+    ] = "grid",
+    exact_email: Annotated[
+        bool, Field(description="Match team members only as exact email addresses")
+    ] = False,
+) -> str:
+    """Day-by-member availability matrix for a date range.
+
+    Each member row has one character per day from start to end:
+    '.' available, 'x' out, '-' non-working day. 'rle' encodes runs as
+    count + character ('5.2-3x'). Also returns the number of members
+    available on each day.
+    """
+    try:
+        start = _resolve_date(start_date)
+        end = _resolve_date(end_date)
+        days = DayRange(start, end, working_days_per_week)
+        if days.days > MAX_AVAILABILITY_DAYS:
+            msg = f"Date range too long ({days.days} days); limit is {MAX_AVAILABILITY_DAYS}."
+            raise ValueError(msg)
+
+        all_events, failures = await _get_confluence(ctx).collect_time_off_events(
+            start, end, calendar_name
+        )
+        if team_members is None:
+            members = _group_by_person(all_events)
+        else:
+            people = PersonIndex(all_events)
+            members = {m: people.match(m, exact_email=exact_email) for m in team_members}
+
+        rows = {}
+        available_per_day = [0] * days.days
+        for member, events in members.items():
+            out = days.spans((e["start_date"], e["end_date"]) for e in events) & days.working
+            grid = days.grid(out)
+            for i, char in enumerate(grid):
+                if char == ".":
+                    available_per_day[i] += 1
+            rows[member] = {
+                "days": run_length(grid) if encoding == "rle" else grid,
+                "days_off": out.bit_count(),
+                "available_days": days.working_days - out.bit_count(),
             }
+
+        return _ok(
+            _with_failures(
+                {
+                    "start": start,
+                    "end": end,
+                    "working_days": days.working_days,
+                    "encoding": encoding,
+                    "legend": {".": "available", "x": "out", "-": "non-working day"},
+                    "members": rows,
+                    "available_per_day": available_per_day,
+                },
+                failures,
+            )
         )
     except Exception as e:
         return _err(e)
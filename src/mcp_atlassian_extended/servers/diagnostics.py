@@ -0,0 +1,27 @@
+"""Diagnostics tools — client-side request counters for tuning."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from fastmcp import Context
+
+from . import mcp
+from ._helpers import _err, _ok
+
+
+@mcp.tool(
+    tags={"diagnostics", "read"},
+    annotations={"readOnlyHint": True, "idempotentHint": True, "openWorldHint": False},
+)
+async def atlassian_client_stats(ctx: Context) -> str:
+    """Show client-side request counters (retries, etc.) for the Jira and Confluence clients."""
+    try:
+        lifespan_context = ctx.request_context.lifespan_context
+        data: dict[str, Any] = {}
+        for product in ("jira", "confluence"):
+            client = lifespan_context[f"{product}_client"]
+            data[product] = client.stats() if client is not None else None
+        return _ok(data)
+    except Exception as e:
+        return _err(e)
@@ -34,10 +34,11 @@ async def jira_get_board(
 async def jira_board_config(
     ctx: Context,
     board_id: Annotated[int, Field(description="Board ID", ge=1)],
+    refresh: Annotated[bool, Field(description="Bypass the metadata cache and refetch")] = False,
 ) -> str:
     """Get board column/status configuration."""
     try:
-        data = await _get_jira(ctx).get_board_config(board_id)
+        data = await _get_jira(ctx).get_board_config(board_id, refresh=refresh)
         return _ok(data)
     except Exception as e:
         return _err(e)
@@ -2,13 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections import Counter
+from fnmatch import fnmatch
+from glob import iglob
+from itertools import islice
+from pathlib import Path
 from typing import Annotated
 
 from fastmcp import Context
 from pydantic import Field
 
 from . import mcp
-from ._helpers import _check_write, _err, _get_jira, _ok, _paginated
+from ._helpers import _check_write, _err, _get_jira, _local_path, _ok, _paginated
+
+MAX_BULK_UPLOADS = 200
 
 # ── Attachments ───────────────────────────────────────────────────
 
@@ -39,15 +47,78 @@ async def jira_upload_attachment(
     file_path: Annotated[str, Field(description="Local file path to upload", min_length=1)],
     filename: Annotated[str | None, Field(description="Override filename")] = None,
 ) -> str:
-    """Upload a file as an attachment to a Jira issue."""
+    """Upload a file as an attachment to a Jira issue.
+
+    The file is streamed from disk; upload progress is reported to clients
+    that send a progress token.
+    """
+    try:
+        _check_write(ctx)
+
+        async def progress(sent: int, total: int) -> None:
+            await ctx.report_progress(sent, total)
+
+        data = await _get_jira(ctx).upload_attachment(
+            issue_key, file_path, filename, progress=progress
+        )
+        return _ok(data)
+    except Exception as e:
+        return _err(e)
+
+
+@mcp.tool(
+    tags={"jira", "attachments", "write"},
+    annotations={"readOnlyHint": False, "openWorldHint": True},
+)
+async def jira_upload_attachments(
+    ctx: Context,
+    issue_key: Annotated[str, Field(description="Jira issue key", min_length=1)],
+    file_paths: Annotated[
+        list[str] | None, Field(description="Local file paths to upload", max_length=200)
+    ] = None,
+    pattern: Annotated[
+        str | None, Field(description="Glob of files to upload, e.g. 'build/**/*.log'")
+    ] = None,
+    max_concurrency: Annotated[int, Field(description="Uploads in flight at once", ge=1, le=8)] = 3,
+) -> str:
+    """Upload several files to a Jira issue, skipping ones it already has.
+
+    Files come from file_paths, pattern (recursive glob) or both. The issue's
+    attachment list is read once; a file whose name and size match an
+    existing attachment is skipped. The rest are streamed concurrently and
+    reported under 'uploaded', 'skipped' and 'failed'.
+    """
     try:
         _check_write(ctx)
-        data = await _get_jira(ctx).upload_attachment(issue_key, file_path, filename)
+        if not file_paths and not pattern:
+            msg = "Provide file_paths, pattern, or both."
+            raise ValueError(msg)
+        paths = list(file_paths or [])
+        if pattern:
+            paths += await asyncio.to_thread(
+                _glob_files, pattern, MAX_BULK_UPLOADS + 1 - len(paths)
+            )
+        if len(paths) > MAX_BULK_UPLOADS:
+            msg = f"More than {MAX_BULK_UPLOADS} files selected; narrow file_paths or pattern."
+            raise ValueError(msg)
+
+        async def progress(sent: int, total: int) -> None:
+            await ctx.report_progress(sent, total)
+
+        data = await _get_jira(ctx).upload_attachments(
+            issue_key, paths, parallelism=max_concurrency, progress=progress
+        )
         return _ok(data)
     except Exception as e:
         return _err(e)
 
 
+def _glob_files(pattern: str, limit: int) -> list[str]:
+    """Files matching ``pattern``, sorted; the walk stops once ``limit`` are found."""
+    files = list(islice((m for m in iglob(pattern, recursive=True) if Path(m).is_file()), limit))
+    return sorted(files)
+
+
 @mcp.tool(
     tags={"jira", "attachments", "write"},
     annotations={"readOnlyHint": False, "openWorldHint": True},
@@ -57,27 +128,140 @@ async def jira_download_attachment(
     content_url: Annotated[str, Field(description="Attachment content URL", min_length=1)],
     save_path: Annotated[str, Field(description="Local path to save the file", min_length=1)],
 ) -> str:
-    """Download a Jira attachment to a local file. Writes to current working directory only."""
+    """Download a Jira attachment to a local file. Writes to current working directory only.
+
+    The file is streamed to disk (never held in memory), replaced atomically,
+    and returned with its size and SHA-256.
+    """
     try:
         _check_write(ctx)
-        from pathlib import Path
+        resolved = _local_path(save_path)
+        result = await _get_jira(ctx).download_attachment_to(content_url, resolved)
+        return _ok({"status": "downloaded", **result})
+    except Exception as e:
+        return _err(e)
 
-        save = Path(save_path)
-        if save.is_absolute():
-            msg = "Absolute paths are not allowed. Use a relative path from the working directory."
-            raise ValueError(msg)
-        if ".." in save.parts:
-            msg = f"Path traversal detected in save_path: {save_path}"
-            raise ValueError(msg)
-        resolved = (Path.cwd() / save).resolve()
-        if not resolved.is_relative_to(Path.cwd().resolve()):
-            msg = f"Path traversal detected in save_path: {save_path}"
-            raise ValueError(msg)
 
-        content = await _get_jira(ctx).download_attachment(content_url)
-        resolved.parent.mkdir(parents=True, exist_ok=True)
-        resolved.write_bytes(content)
-        return _ok({"status": "downloaded", "path": str(resolved), "size": len(content)})
+@mcp.tool(
+    tags={"jira", "attachments", "read"},
+    annotations={"readOnlyHint": True, "idempotentHint": True, "openWorldHint": True},
+)
+async def jira_preview_attachment(
+    ctx: Context,
+    content_url: Annotated[str, Field(description="Attachment content URL", min_length=1)],
+    max_bytes: Annotated[
+        int, Field(description="Bytes to read from the start of the file", ge=1, le=1048576)
+    ] = 4096,
+) -> str:
+    """Read the first bytes of a Jira attachment without downloading all of it.
+
+    Uses an HTTP Range request. Returns the bytes as text when they decode as
+    UTF-8, base64 otherwise, plus the file's total size when the server
+    reports it.
+    """
+    try:
+        data = await _get_jira(ctx).preview_attachment(content_url, max_bytes)
+        return _ok(data)
+    except Exception as e:
+        return _err(e)
+
+
+@mcp.tool(
+    tags={"jira", "attachments", "write"},
+    annotations={"readOnlyHint": False, "openWorldHint": True},
+)
+async def jira_download_attachments(
+    ctx: Context,
+    issue_keys: Annotated[
+        list[str], Field(description="Issue keys to download from", min_length=1, max_length=200)
+    ],
+    target_dir: Annotated[
+        str, Field(description="Relative directory to save into (one subfolder per issue)")
+    ] = "attachments",
+    filename_pattern: Annotated[
+        str | None, Field(description="Glob on the filename, e.g. '*.pdf' (case-insensitive)")
+    ] = None,
+    mime_types: Annotated[
+        list[str] | None,
+        Field(description="MIME types or prefixes to keep, e.g. ['image/', 'application/pdf']"),
+    ] = None,
+    max_concurrency: Annotated[
+        int, Field(description="Downloads in flight at once", ge=1, le=16)
+    ] = 4,
+) -> str:
+    """Download the attachments of several issues into a local directory.
+
+    Attachment metadata for all issues is read with one JQL search per 50
+    keys. Matching files are streamed concurrently to
+    target_dir/<ISSUE-KEY>/<filename> (working directory only) and listed in
+    a manifest with size and SHA-256. Files that fail are reported under
+    'failed' without stopping the others.
+    """
+    try:
+        _check_write(ctx)
+        root = _local_path(target_dir)
+        client = _get_jira(ctx)
+        by_issue = await client.get_attachments_bulk(issue_keys)
+
+        jobs = []
+        for issue_key, attachments in by_issue.items():
+            names = Counter(a.get("filename", "") for a in attachments)
+            for att in attachments:
+                name = att.get("filename", "")
+                mime = att.get("mimeType", "")
+                if filename_pattern and not fnmatch(name.lower(), filename_pattern.lower()):
+                    continue
+                if mime_types and not any(mime.startswith(m) for m in mime_types):
+                    continue
+                # Jira allows duplicate names on one issue; keep both files.
+                local = Path(name).name
+                if local in ("", ".."):
+                    local = str(att.get("id"))
+                if names[name] > 1:
+                    local = f"{att.get('id')}-{local}"
+                jobs.append((issue_key, att, root / issue_key / local))
+
+        # Each download holds a bulkhead slot until its body is read; more would only queue.
+        if client.bulkhead is not None:
+            max_concurrency = min(max_concurrency, client.bulkhead.max_concurrent)
+        semaphore = asyncio.Semaphore(max_concurrency)
+        done = 0
+
+        async def fetch(issue_key: str, att: dict, dest: Path) -> dict:
+            nonlocal done
+            entry = {
+                "issue_key": issue_key,
+                "attachment_id": att.get("id"),
+                "filename": att.get("filename"),
+                "mime_type": att.get("mimeType"),
+            }
+            try:
+                async with semaphore:
+                    entry.update(
+                        await client.download_attachment_to(
+                            att["content"], dest, size=att.get("size")
+                        )
+                    )
+            except Exception as e:
+                entry["error"] = str(e) or type(e).__name__
+            done += 1
+            await ctx.report_progress(done, len(jobs))
+            return entry
+
+        entries = await asyncio.gather(*(fetch(*job) for job in jobs))
+        files = [e for e in entries if "error" not in e]
+        requested = {k.strip().upper() for k in issue_keys if k.strip()}
+        return _ok(
+            {
+                "target_dir": str(root),
+                "count": len(files),
+                "total_bytes": sum(e["size"] for e in files),
+                "cache_hits": sum(1 for e in files if e["cache_hit"]),
+                "files": files,
+                "failed": [e for e in entries if "error" in e],
+                "missing_issues": sorted(requested - by_issue.keys()),
+            }
+        )
     except Exception as e:
         return _err(e)
 
@@ -109,7 +293,7 @@ async def jira_delete_attachment(
 async def jira_search_users(
     ctx: Context,
     query: Annotated[str, Field(description="Search by name, email, or username", min_length=1)],
-    max_results: Annotated[int, Field(description="Maximum results", ge=1, le=100)] = 10,
+    max_results: Annotated[int, Field(description="Maximum results", ge=1, le=1000)] = 10,
 ) -> str:
     """Search for Jira users."""
     try:
@@ -126,10 +310,13 @@ async def jira_search_users(
     tags={"jira", "metadata", "read"},
     annotations={"readOnlyHint": True, "idempotentHint": True, "openWorldHint": True},
 )
-async def jira_list_projects(ctx: Context) -> str:
+async def jira_list_projects(
+    ctx: Context,
+    refresh: Annotated[bool, Field(description="Bypass the metadata cache and refetch")] = False,
+) -> str:
     """List all accessible Jira projects."""
     try:
-        data = await _get_jira(ctx).list_projects()
+        data = await _get_jira(ctx).list_projects(refresh=refresh)
         return _paginated(data)
     except Exception as e:
         return _err(e)
@@ -143,10 +330,11 @@ async def jira_list_fields(
     ctx: Context,
     search: Annotated[str | None, Field(description="Filter fields by name")] = None,
     custom_only: Annotated[bool, Field(description="Only return custom fields")] = False,
+    refresh: Annotated[bool, Field(description="Bypass the metadata cache and refetch")] = False,
 ) -> str:
     """List Jira fields, optionally filtered."""
     try:
-        data = await _get_jira(ctx).list_fields()
+        data = await _get_jira(ctx).list_fields(refresh=refresh)
         if custom_only:
             data = [f for f in data if f.get("custom", False)]
         if search:
@@ -164,11 +352,27 @@ async def jira_list_fields(
 async def jira_backlog(
     ctx: Context,
     board_id: Annotated[int, Field(description="Board ID", ge=1)],
-    max_results: Annotated[int, Field(description="Maximum results", ge=1, le=100)] = 50,
+    max_results: Annotated[
+        int, Field(description="Maximum issues to return (fetched across pages)", ge=1, le=5000)
+    ] = 50,
+    fields: Annotated[
+        str,
+        Field(
+            description="Field profile: 'minimal' (summary, status, type, priority, assignee), "
+            "'planning' (adds labels, components, versions, parent, dates, story points), "
+            "'full' (every field), or a comma-separated list of field IDs"
+        ),
+    ] = "minimal",
 ) -> str:
-    """Get backlog issues for a board."""
+    """Get backlog issues for a board in rank order.
+
+    Reads the backlog size from the first page, then fetches the remaining
+    pages concurrently until max_results issues are collected. Only the
+    fields of the chosen profile are requested; API links and avatar URLs
+    are dropped unless the profile is 'full'.
+    """
     try:
-        data = await _get_jira(ctx).get_backlog(board_id, max_results)
+        data = await _get_jira(ctx).get_backlog(board_id, max_results, fields=fields)
         return _ok(data)
     except Exception as e:
         return _err(e)
@@ -184,10 +388,11 @@ async def jira_backlog(
 async def jira_get_project_versions(
     ctx: Context,
     project_key: Annotated[str, Field(description="Project key (e.g. PROJ)", min_length=1)],
+    refresh: Annotated[bool, Field(description="Bypass the metadata cache and refetch")] = False,
 ) -> str:
     """List all versions for a Jira project (REST API v2, supports Server/DC and Cloud)."""
     try:
-        data = await _get_jira(ctx).get_project_versions(project_key)
+        data = await _get_jira(ctx).get_project_versions(project_key, refresh=refresh)
         return _paginated(data)
     except Exception as e:
         return _err(e)
@@ -0,0 +1,89 @@
+"""Working-day math on day bitmaps.
+
+A date range is represented as a Python ``int`` where bit ``i`` stands for
+``start + i days``. Working days, per-person days off and their overlaps are
+then plain ``|``/``&`` operations and counts are ``int.bit_count()`` — no
+per-day loop and no date formatting.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import date, timedelta
+from itertools import groupby
+
+from .dates import to_date
+
+
+def weekmask(working_days_per_week: int) -> int:
+    """7-bit mask of working weekdays, bit 0 = Monday.
+
+    7 = every day, 6 = Monday to Saturday, 5 = Monday to Friday, and so on.
+    """
+    days = max(0, min(7, working_days_per_week))
+    return (1 << days) - 1
+
+
+class DayRange:
+    """Inclusive date range with a bitmap of its working days."""
+
+    def __init__(self, start: str | date, end: str | date, working_days_per_week: int = 5) -> None:
+        self.start = to_date(start)
+        self.end = to_date(end)
+        self.days = max(0, (self.end - self.start).days + 1)
+        self.working = self._working_bitmap(weekmask(working_days_per_week))
+
+    def _working_bitmap(self, mask: int) -> int:
+        if not self.days:
+            return 0
+        # Rotate the week so bit 0 is the range's first weekday, then tile it.
+        shift = self.start.weekday()
+        week = ((mask >> shift) | (mask << (7 - shift))) & 0x7F
+        bits, width = week, 7
+        while width < self.days:
+            bits |= bits << width
+            width *= 2
+        return bits & ((1 << self.days) - 1)
+
+    @property
+    def working_days(self) -> int:
+        return self.working.bit_count()
+
+    def span(self, start: str | date, end: str | date) -> int:
+        """Bitmap of the days from ``start`` to ``end`` clipped to this range."""
+        lo = max((to_date(start) - self.start).days, 0)
+        hi = min((to_date(end) - self.start).days, self.days - 1)
+        if hi < lo:
+            return 0
+        return ((1 << (hi - lo + 1)) - 1) << lo
+
+    def spans(self, ranges: Iterable[tuple[str | date, str | date]]) -> int:
+        bits = 0
+        for start, end in ranges:
+            bits |= self.span(start, end)
+        return bits
+
+    def off_days(self, ranges: Iterable[tuple[str | date, str | date]]) -> int:
+        """Working days covered by any of ``ranges`` (overlaps counted once)."""
+        return (self.spans(ranges) & self.working).bit_count()
+
+    def dates(self, bits: int) -> list[date]:
+        """Dates of the set bits, in order."""
+        result = []
+        while bits:
+            low = bits & -bits
+            result.append(self.start + timedelta(low.bit_length() - 1))
+            bits ^= low
+        return result
+
+    def grid(self, out: int) -> str:
+        """One character per day: ``.`` available, ``x`` out, ``-`` non-working day."""
+        return "".join(
+            "-" if not self.working >> i & 1 else "x" if out >> i & 1 else "."
+            for i in range(self.days)
+        )
+
+
+def run_length(grid: str) -> str:
+    """Run-length encode a day grid, e.g. ``".....--"`` -> ``"5.2-"``."""
+    return "".join(f"{len(list(run))}{char}" for char, run in groupby(grid))
@@ -0,0 +1,116 @@
+"""Tests for the content-addressed attachment cache."""
+
+from __future__ import annotations
+
+import hashlib
+
+import httpx
+import pytest
+import respx
+
+from mcp_atlassian_extended.clients.attachments import AttachmentCache
+from mcp_atlassian_extended.clients.jira import JiraExtendedClient
+from mcp_atlassian_extended.config import JiraConfig
+
+BASE = "https://jira.example.com"
+URL = "/secure/attachment/42/spec.pdf"
+
+
+def _blob(cache: AttachmentCache, data: bytes) -> str:
+    sha = hashlib.sha256(data).hexdigest()
+    path = cache.blob_path(sha)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return sha
+
+
+class TestIndex:
+    def test_lookup_and_size_check(self, tmp_path):
+        cache = AttachmentCache(tmp_path, 1024)
+        sha = _blob(cache, b"abc")
+        assert cache.record("1", sha, 3) == []
+        assert cache.lookup("1") == (cache.blob_path(sha), sha, 3)
+        assert cache.lookup("1", size=4) is None  # size mismatch drops the entry
+        assert cache.lookup("1") is None
+        assert cache.stats()["hits"] == 1
+
+    def test_keys_share_blob(self, tmp_path):
+        cache = AttachmentCache(tmp_path, 1024)
+        sha = _blob(cache, b"same")
+        cache.record("1", sha, 4)
+        cache.record("2", sha, 4)
+        stats = cache.stats()
+        assert (stats["blobs"], stats["keys"]) == (1, 2)
+        cache.forget("1")
+        cache.close()
+        # Totals are kept in memory; reading them needs no database.
+        stats = cache.stats()
+        assert (stats["blobs"], stats["keys"], stats["size_mb"]) == (1, 1, 0.0)
+
+    def test_lru_eviction(self, tmp_path):
+        cache = AttachmentCache(tmp_path, 10)
+        a, b = _blob(cache, b"aaaa"), _blob(cache, b"bbbb")
+        cache.record("a", a, 4)
+        cache.record("b", b, 4)
+        cache.lookup("a")  # "b" is now least recently used
+        c = _blob(cache, b"cccc")
+        assert cache.record("c", c, 4) == [cache.blob_path(b)]
+        assert cache.lookup("b") is None
+        assert cache.lookup("a") is not None
+
+    def test_index_persists(self, tmp_path):
+        cache = AttachmentCache(tmp_path, 1024)
+        sha = _blob(cache, b"abc")
+        cache.record("1", sha, 3)
+        cache.close()
+        assert AttachmentCache(tmp_path, 1024).lookup("1") is not None
+
+
+class TestClientCache:
+    def _client(self, cache_dir) -> JiraExtendedClient:
+        return JiraExtendedClient(
+            JiraConfig(url=BASE, token="t", attachment_cache_dir=str(cache_dir))
+        )
+
+    @pytest.mark.asyncio
+    async def test_repeat_download_served_locally(self, tmp_path):
+        client = self._client(tmp_path / "cache")
+        async with respx.mock(base_url=BASE) as router:
+            route = router.get(URL).mock(return_value=httpx.Response(200, content=b"spec"))
+            first = await client.download_attachment_to(URL, tmp_path / "a" / "spec.pdf")
+            second = await client.download_attachment_to(URL, tmp_path / "b" / "spec.pdf")
+        assert route.call_count == 1
+        assert (first["cache_hit"], second["cache_hit"]) == (False, True)
+        assert second["sha256"] == first["sha256"]
+        assert (tmp_path / "b" / "spec.pdf").read_bytes() == b"spec"
+        assert client.stats()["attachment_cache"]["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_downloads_are_independent_copies(self, tmp_path):
+        client = self._client(tmp_path / "cache")
+        first_dest = tmp_path / "a.pdf"
+        async with respx.mock(base_url=BASE) as router:
+            route = router.get(URL).mock(return_value=httpx.Response(200, content=b"spec"))
+            await client.download_attachment_to(URL, first_dest)
+            second = await client.download_attachment_to(URL, tmp_path / "b.pdf")
+            # Editing one download in place touches neither its sibling nor the cache.
+            with first_dest.open("r+b") as fh:
+                fh.write(b"SPEC")
+            third = await client.download_attachment_to(URL, tmp_path / "c.pdf")
+        assert route.call_count == 1
+        assert (second["cache_hit"], third["cache_hit"]) == (True, True)
+        assert (tmp_path / "b.pdf").read_bytes() == b"spec"
+        assert (tmp_path / "c.pdf").read_bytes() == b"spec"
+        assert first_dest.stat().st_ino != (tmp_path / "b.pdf").stat().st_ino
+
+    @pytest.mark.asyncio
+    async def test_damaged_blob_is_refetched(self, tmp_path):
+        client = self._client(tmp_path / "cache")
+        async with respx.mock(base_url=BASE) as router:
+            route = router.get(URL).mock(return_value=httpx.Response(200, content=b"spec"))
+            first = await client.download_attachment_to(URL, tmp_path / "a.pdf")
+            client.attachment_cache.blob_path(first["sha256"]).write_bytes(b"SPEC")
+            result = await client.download_attachment_to(URL, tmp_path / "b.pdf")
+        assert route.call_count == 2
+        assert result["cache_hit"] is False
+        assert (tmp_path / "b.pdf").read_bytes() == b"spec"
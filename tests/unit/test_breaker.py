@@ -0,0 +1,166 @@
+"""Tests for the per-endpoint-family circuit breakers."""
+
+from __future__ import annotations
+
+import json
+
+import httpx
+import pytest
+import respx
+
+from mcp_atlassian_extended.clients.breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    endpoint_family,
+)
+from mcp_atlassian_extended.clients.jira import JiraExtendedClient
+from mcp_atlassian_extended.config import JiraConfig
+from mcp_atlassian_extended.exceptions import AtlassianApiError, CircuitOpenError
+from mcp_atlassian_extended.servers._helpers import _err
+
+BASE = "https://jira.example.com"
+
+
+def _make_client(**overrides) -> JiraExtendedClient:
+    config = JiraConfig(
+        url=BASE, token="t", max_retries=0, breaker_min_calls=2, breaker_window=4, **overrides
+    )
+    return JiraExtendedClient(config)
+
+
+def _breaker(cooldown: float = 30) -> CircuitBreaker:
+    return CircuitBreaker("Jira", "api/2", threshold=0.5, window=4, min_calls=2, cooldown=cooldown)
+
+
+class TestEndpointFamily:
+    @pytest.mark.parametrize(
+        ("url", "family"),
+        [
+            ("/rest/api/2/field", "api/2"),
+            ("/rest/agile/1.0/board/1/backlog", "agile/1.0"),
+            ("/rest/calendar-services/1.0/calendar/events.json", "calendar-services/1.0"),
+            ("https://wiki.example.com/wiki/rest/calendar-services/1.0/x", "calendar-services/1.0"),
+            ("https://jira.example.com/secure/attachment/1/a.pdf", "web"),
+        ],
+    )
+    def test_families(self, url, family):
+        assert endpoint_family(url) == family
+
+
+class TestCircuitBreaker:
+    def test_opens_on_failure_rate(self):
+        breaker = _breaker()
+        breaker.record(True)
+        assert breaker.state == CLOSED
+        breaker.record(False)
+        assert breaker.state == OPEN
+        with pytest.raises(CircuitOpenError) as exc_info:
+            breaker.before_request()
+        assert exc_info.value.retry_after > 0
+        assert breaker.stats()["rejected"] == 1
+
+    def test_needs_min_calls(self):
+        breaker = _breaker()
+        breaker.record(False)
+        assert breaker.state == CLOSED
+
+    def test_half_open_probe_closes_on_success(self):
+        breaker = _breaker(cooldown=0)
+        breaker.record(False)
+        breaker.record(False)
+        assert breaker.state == HALF_OPEN
+        assert breaker.before_request() is True
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request()  # only one probe at a time
+        breaker.record(True, probe=True)
+        assert breaker.state == CLOSED
+        assert breaker.failure_rate == 0
+
+    def test_half_open_probe_failure_reopens(self):
+        breaker = _breaker(cooldown=0)
+        breaker.record(False)
+        breaker.record(False)
+        probe = breaker.before_request()
+        breaker.record(False, probe=probe)
+        assert breaker.stats()["opened"] == 2
+
+    def test_released_probe_allows_next(self):
+        breaker = _breaker(cooldown=0)
+        breaker.record(False)
+        breaker.record(False)
+        breaker.record(None, probe=breaker.before_request())
+        assert breaker.before_request() is True
+
+
+class TestClientBreaker:
+    @pytest.mark.asyncio
+    async def test_fails_fast_per_family(self):
+        client = _make_client()
+        async with respx.mock(base_url=BASE) as router:
+            fields = router.get("/rest/api/2/field").mock(return_value=httpx.Response(503))
+            board = router.get("/rest/agile/1.0/board/1").mock(
+                return_value=httpx.Response(200, json={"id": 1})
+            )
+            for _ in range(2):
+                with pytest.raises(AtlassianApiError):
+                    await client.list_fields()
+            with pytest.raises(CircuitOpenError):
+                await client.list_fields()
+            assert fields.call_count == 2
+            # Agile is a separate family and still reachable.
+            assert (await client.get_board(1))["id"] == 1
+            assert board.call_count == 1
+        stats = client.stats()["circuit_breakers"]
+        assert stats["api/2"]["state"] == OPEN
+        assert stats["agile/1.0"]["state"] == CLOSED
+
+    @pytest.mark.asyncio
+    async def test_transport_errors_count(self):
+        client = _make_client()
+        async with respx.mock(base_url=BASE) as router:
+            router.get("/rest/api/2/field").mock(side_effect=httpx.ConnectTimeout("slow"))
+            for _ in range(2):
+                with pytest.raises(httpx.ConnectTimeout):
+                    await client.list_fields()
+            with pytest.raises(CircuitOpenError):
+                await client.list_fields()
+
+    @pytest.mark.asyncio
+    async def test_client_errors_do_not_trip(self):
+        client = _make_client()
+        async with respx.mock(base_url=BASE) as router:
+            router.get("/rest/api/2/project/NOPE/versions").mock(return_value=httpx.Response(404))
+            for _ in range(4):
+                with pytest.raises(AtlassianApiError):
+                    await client.get_project_versions("NOPE")
+        assert client.stats()["circuit_breakers"]["api/2"]["state"] == CLOSED
+
+    @pytest.mark.asyncio
+    async def test_error_carries_circuit_state(self):
+        client = _make_client()
+        async with respx.mock(base_url=BASE) as router:
+            router.get("/rest/api/2/field").mock(return_value=httpx.Response(502))
+            with pytest.raises(AtlassianApiError):
+                await client.list_fields()
+            with pytest.raises(AtlassianApiError) as exc_info:
+                await client.list_fields()
+        parsed = json.loads(_err(exc_info.value))
+        assert parsed["circuit"]["state"] == OPEN
+        assert "fail fast" in parsed["hint"]
+
+    def test_disabled(self):
+        assert _make_client(breaker_threshold=0).breakers is None
+
+
+class TestCircuitOpenHint:
+    def test_hint(self):
+        parsed = json.loads(_err(CircuitOpenError("Jira", "agile/1.0", 0.8, 12.0)))
+        assert parsed["circuit"]["family"] == "agile/1.0"
+        assert parsed["circuit"]["retry_after_seconds"] == 12.0
+        assert "Do not retry" in parsed["hint"]
+
+    def test_timeout_hint(self):
+        parsed = json.loads(_err(httpx.ReadTimeout("timed out")))
+        assert "timed out" in parsed["hint"]
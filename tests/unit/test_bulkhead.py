@@ -0,0 +1,123 @@
+"""Tests for the per-upstream concurrency bulkhead."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import httpx
+import pytest
+import respx
+
+from mcp_atlassian_extended.clients.bulkhead import Bulkhead
+from mcp_atlassian_extended.clients.jira import JiraExtendedClient
+from mcp_atlassian_extended.config import JiraConfig
+from mcp_atlassian_extended.exceptions import BulkheadFullError
+from mcp_atlassian_extended.servers._helpers import _err
+
+BASE = "https://jira.example.com"
+
+
+class TestBulkhead:
+    @pytest.mark.asyncio
+    async def test_caps_concurrency(self):
+        bulkhead = Bulkhead("Jira", max_concurrent=2, max_queue=10, queue_timeout=5)
+        running = 0
+        peak = 0
+
+        async def work() -> None:
+            nonlocal running, peak
+            async with bulkhead.slot():
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+
+        await asyncio.gather(*(work() for _ in range(6)))
+        stats = bulkhead.stats()
+        assert peak == 2
+        assert stats["peak_active"] == 2
+        assert stats["acquired"] == 6
+        assert stats["peak_waiting"] >= 1
+        assert stats["active"] == 0
+        assert stats["waiting"] == 0
+        assert stats["max_wait_seconds"] > 0
+
+    @pytest.mark.asyncio
+    async def test_rejects_when_queue_full(self):
+        bulkhead = Bulkhead("Jira", max_concurrent=1, max_queue=1, queue_timeout=5)
+        release = asyncio.Event()
+
+        async def hold() -> None:
+            async with bulkhead.slot():
+                await release.wait()
+
+        holder = asyncio.create_task(hold())
+        queued = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        with pytest.raises(BulkheadFullError, match="queue full"):
+            async with bulkhead.slot():
+                pass
+        release.set()
+        await asyncio.gather(holder, queued)
+        assert bulkhead.stats()["rejected"] == 1
+
+    @pytest.mark.asyncio
+    async def test_queue_wait_timeout(self):
+        bulkhead = Bulkhead("Jira", max_concurrent=1, max_queue=5, queue_timeout=0.02)
+        release = asyncio.Event()
+
+        async def hold() -> None:
+            async with bulkhead.slot():
+                await release.wait()
+
+        holder = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        with pytest.raises(BulkheadFullError, match="no slot within") as exc_info:
+            async with bulkhead.slot():
+                pass
+        assert exc_info.value.active == 1
+        release.set()
+        await holder
+        stats = bulkhead.stats()
+        assert stats["timeouts"] == 1
+        assert stats["waiting"] == 0
+
+
+class TestClientBulkhead:
+    @pytest.mark.asyncio
+    async def test_client_requests_use_bulkhead(self):
+        client = JiraExtendedClient(JiraConfig(url=BASE, token="t", max_concurrency=3))
+        async with respx.mock(base_url=BASE) as router:
+            router.get(url__regex=r"/rest/agile/1\.0/board/\d+$").mock(
+                return_value=httpx.Response(200, json={"id": 1})
+            )
+            await asyncio.gather(*(client.get_board(i) for i in range(5)))
+        stats = client.stats()["bulkhead"]
+        assert stats["max_concurrent"] == 3
+        assert stats["acquired"] == 5
+
+    @pytest.mark.asyncio
+    async def test_streamed_response_holds_slot_until_closed(self):
+        client = JiraExtendedClient(JiraConfig(url=BASE, token="t", max_concurrency=2))
+        async with respx.mock(base_url=BASE) as router:
+            router.get("/file").mock(return_value=httpx.Response(200, content=b"body"))
+            resp = await client._send("GET", "/file", stream=True)
+            assert client.stats()["bulkhead"]["active"] == 1
+            assert await resp.aread() == b"body"
+            await resp.aclose()
+            assert client.stats()["bulkhead"]["active"] == 0
+            await resp.aclose()
+            assert client.stats()["bulkhead"]["active"] == 0
+        await client.close()
+
+    def test_disabled_with_zero_concurrency(self):
+        client = JiraExtendedClient(JiraConfig(url=BASE, token="t", max_concurrency=0))
+        assert client.bulkhead is None
+        assert "bulkhead" not in client.stats()
+
+    def test_error_hint(self):
+        parsed = json.loads(_err(BulkheadFullError("Jira", "queue full", 10, 100)))
+        assert parsed["active"] == 10
+        assert parsed["waiting"] == 100
+        assert "MAX_CONCURRENCY" in parsed["hint"]
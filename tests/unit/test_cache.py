@@ -0,0 +1,168 @@
+"""Tests for the TTL/LRU metadata cache."""
+
+from __future__ import annotations
+
+import time
+
+import httpx
+import pytest
+import respx
+
+from mcp_atlassian_extended.clients.cache import MISSING, TTLCache
+from mcp_atlassian_extended.clients.jira import JiraExtendedClient
+from mcp_atlassian_extended.config import JiraConfig
+from mcp_atlassian_extended.exceptions import AtlassianApiError
+
+BASE = "https://jira.example.com"
+
+
+def _make_client(**overrides) -> JiraExtendedClient:
+    return JiraExtendedClient(JiraConfig(url=BASE, token="t", **overrides))
+
+
+class TestTTLCache:
+    def test_hit_and_miss(self):
+        cache = TTLCache(1000)
+        assert cache.get("a") is MISSING
+        cache.set("a", [1], ttl=60, size=10)
+        assert cache.get("a") == [1]
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["bytes"] == 10
+
+    def test_expiry(self, monkeypatch):
+        cache = TTLCache(1000)
+        cache.set("a", 1, ttl=5, size=1)
+        later = time.monotonic() + 10
+        monkeypatch.setattr(time, "monotonic", lambda: later)
+        assert cache.get("a") is MISSING
+        assert cache.stats()["expirations"] == 1
+        assert cache.stats()["bytes"] == 0
+
+    def test_lru_eviction_under_byte_budget(self):
+        cache = TTLCache(100)
+        cache.set("a", "a", ttl=60, size=40)
+        cache.set("b", "b", ttl=60, size=40)
+        cache.get("a")  # "b" becomes least recently used
+        cache.set("c", "c", ttl=60, size=40)
+        assert cache.get("b") is MISSING
+        assert cache.get("a") == "a"
+        assert cache.get("c") == "c"
+        assert cache.stats()["evictions"] == 1
+
+    def test_oversized_entry_not_stored(self):
+        cache = TTLCache(10)
+        cache.set("big", "x", ttl=60, size=11)
+        assert cache.get("big") is MISSING
+
+    def test_invalidate_prefix(self):
+        cache = TTLCache(100)
+        cache.set("versions:A", 1, ttl=60, size=1)
+        cache.set("versions:B", 2, ttl=60, size=1)
+        cache.set("fields", 3, ttl=60, size=1)
+        cache.invalidate_prefix("versions:")
+        assert cache.get("versions:A") is MISSING
+        assert cache.get("fields") == 3
+
+
+class TestClientMetadataCache:
+    @pytest.mark.asyncio
+    async def test_fields_served_from_cache(self):
+        client = _make_client()
+        async with respx.mock(base_url=BASE) as router:
+            route = router.get("/rest/api/2/field").mock(
+                return_value=httpx.Response(200, json=[{"id": "summary"}])
+            )
+            first = await client.list_fields()
+            second = await client.list_fields()
+            assert route.call_count == 1
+            assert first == second
+            await client.list_fields(refresh=True)
+            assert route.call_count == 2
+        assert client.stats()["cache"]["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_board_config_cached_per_board(self):
+        client = _make_client()
+        async with respx.mock(base_url=BASE) as router:
+            one = router.get("/rest/agile/1.0/board/1/configuration").mock(
+                return_value=httpx.Response(200, json={"id": 1})
+            )
+            two = router.get("/rest/agile/1.0/board/2/configuration").mock(
+                return_value=httpx.Response(200, json={"id": 2})
+            )
+            assert (await client.get_board_config(1))["id"] == 1
+            assert (await client.get_board_config(2))["id"] == 2
+            assert (await client.get_board_config(1))["id"] == 1
+            assert one.call_count == 1
+            assert two.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_create_version_invalidates_project_versions(self):
+        client = _make_client()
+        async with respx.mock(base_url=BASE) as router:
+            versions = router.get("/rest/api/2/project/PROJ/versions").mock(
+                return_value=httpx.Response(200, json=[])
+            )
+            router.post("/rest/api/2/version").mock(
+                return_value=httpx.Response(201, json={"id": "1", "name": "v1"})
+            )
+            await client.get_project_versions("PROJ")
+            await client.get_project_versions("PROJ")
+            assert versions.call_count == 1
+            await client.create_version("PROJ", "v1")
+            await client.get_project_versions("PROJ")
+            assert versions.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_create_version_invalidates_list_fetched_by_project_id(self):
+        client = _make_client()
+        async with respx.mock(base_url=BASE) as router:
+            by_id = router.get("/rest/api/2/project/10000/versions").mock(
+                return_value=httpx.Response(200, json=[])
+            )
+            router.post("/rest/api/2/version").mock(
+                return_value=httpx.Response(201, json={"id": "1", "name": "v1"})
+            )
+            await client.get_project_versions("10000")
+            await client.create_version("PROJ", "v1")
+            await client.get_project_versions("10000")
+            assert by_id.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_update_version_invalidates_version_lists(self):
+        client = _make_client()
+        async with respx.mock(base_url=BASE) as router:
+            versions = router.get("/rest/api/2/project/PROJ/versions").mock(
+                return_value=httpx.Response(200, json=[])
+            )
+            router.put("/rest/api/2/version/7").mock(
+                return_value=httpx.Response(200, json={"id": "7", "released": True})
+            )
+            await client.get_project_versions("PROJ")
+            await client.update_version("7", released=True)
+            await client.get_project_versions("PROJ")
+            assert versions.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_errors_not_cached(self):
+        client = _make_client(max_retries=0)
+        async with respx.mock(base_url=BASE) as router:
+            route = router.get("/rest/api/2/project").mock(
+                side_effect=[httpx.Response(404), httpx.Response(200, json=[])]
+            )
+            with pytest.raises(AtlassianApiError):
+                await client.list_projects()
+            assert await client.list_projects() == []
+            assert route.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_disabled(self):
+        client = _make_client(cache_max_mb=0)
+        assert client.cache is None
+        async with respx.mock(base_url=BASE) as router:
+            route = router.get("/rest/api/2/field").mock(return_value=httpx.Response(200, json=[]))
+            await client.list_fields()
+            await client.list_fields()
+            assert route.call_count == 2
@@ -0,0 +1,115 @@
+"""Tests for ETag / Last-Modified conditional GETs."""
+
+from __future__ import annotations
+
+import httpx
+import pytest
+import respx
+
+from mcp_atlassian_extended.clients.confluence import ConfluenceExtendedClient
+from mcp_atlassian_extended.clients.jira import JiraExtendedClient
+from mcp_atlassian_extended.config import ConfluenceConfig, JiraConfig
+
+BASE = "https://jira.example.com"
+CONF = "https://confluence.example.com"
+
+
+def _make_client(**overrides) -> JiraExtendedClient:
+    # Metadata TTL cache off so every call reaches the transport.
+    return JiraExtendedClient(JiraConfig(url=BASE, token="t", cache_max_mb=0, **overrides))
+
+
+def _etag_route(body, etag='"v1"'):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304, headers={"ETag": etag})
+        return httpx.Response(200, json=body, headers={"ETag": etag})
+
+    return handler
+
+
+class TestConditionalGet:
+    @pytest.mark.asyncio
+    async def test_304_served_from_stored_body(self):
+        client = _make_client()
+        async with respx.mock(base_url=BASE) as router:
+            route = router.get("/rest/api/2/field").mock(
+                side_effect=_etag_route([{"id": "summary"}])
+            )
+            first = await client.list_fields()
+            second = await client.list_fields()
+        assert first == second == [{"id": "summary"}]
+        assert route.call_count == 2
+        assert "If-None-Match" not in route.calls[0].request.headers
+        assert route.calls[1].request.headers["If-None-Match"] == '"v1"'
+        stats = client.stats()["conditional"]
+        assert stats["not_modified"] == 1
+        assert stats["entries"] == 1
+
+    @pytest.mark.asyncio
+    async def test_changed_body_replaces_stored_entry(self):
+        client = _make_client()
+        async with respx.mock(base_url=BASE) as router:
+            router.get("/rest/api/2/project").mock(
+                side_effect=[
+                    httpx.Response(200, json=[{"key": "A"}], headers={"ETag": '"1"'}),
+                    httpx.Response(200, json=[{"key": "B"}], headers={"ETag": '"2"'}),
+                    httpx.Response(304, headers={"ETag": '"2"'}),
+                ]
+            )
+            assert await client.list_projects() == [{"key": "A"}]
+            assert await client.list_projects() == [{"key": "B"}]
+            assert await client.list_projects() == [{"key": "B"}]
+        assert client.stats()["conditional"]["modified"] == 1
+
+    @pytest.mark.asyncio
+    async def test_last_modified_validator(self):
+        client = _make_client()
+        stamp = "Wed, 01 Jan 2025 00:00:00 GMT"
+        async with respx.mock(base_url=BASE) as router:
+            route = router.get("/rest/agile/1.0/board/1").mock(
+                side_effect=[
+                    httpx.Response(200, json={"id": 1}, headers={"Last-Modified": stamp}),
+                    httpx.Response(304),
+                ]
+            )
+            await client.get_board(1)
+            assert await client.get_board(1) == {"id": 1}
+        assert route.calls[1].request.headers["If-Modified-Since"] == stamp
+
+    @pytest.mark.asyncio
+    async def test_keyed_by_query_params(self):
+        client = _make_client()
+        async with respx.mock(base_url=BASE) as router:
+            route = router.get("/rest/api/2/user/search").mock(
+                return_value=httpx.Response(200, json=[], headers={"ETag": '"x"'})
+            )
+            await client.search_users("alice")
+            await client.search_users("bob")
+        assert "If-None-Match" not in route.calls[1].request.headers
+
+    @pytest.mark.asyncio
+    async def test_responses_without_validators_not_stored(self):
+        client = _make_client()
+        async with respx.mock(base_url=BASE) as router:
+            router.get("/rest/api/2/field").mock(return_value=httpx.Response(200, json=[]))
+            await client.list_fields()
+        assert client.stats()["conditional"]["entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_confluence_calendars_revalidated(self):
+        client = ConfluenceExtendedClient(ConfluenceConfig(url=CONF, token="t"))
+        payload = {"payload": [{"subCalendar": {"id": "c1", "name": "Team"}}]}
+        async with respx.mock(base_url=CONF) as router:
+            route = router.get("/rest/calendar-services/1.0/calendar/subcalendars.json").mock(
+                side_effect=_etag_route(payload)
+            )
+            await client.list_calendars()
+            calendars = await client.list_calendars()
+        assert calendars[0]["subCalendar"]["id"] == "c1"
+        assert route.calls[1].request.headers["If-None-Match"] == '"v1"'
+
+    def test_disabled(self):
+        client = _make_client(etag_cache_mb=0)
+        assert client.conditional is None
+        assert "conditional" not in client.stats()
@@ -5,7 +5,7 @@ from __future__ import annotations
 import os
 from unittest.mock import patch
 
-from mcp_atlassian_extended.config import ConfluenceConfig, JiraConfig
+from mcp_atlassian_extended.config import ConfluenceConfig, JiraConfig, RateLimitConfig
 
 
 def test_jira_config_from_env():
@@ -44,3 +44,71 @@ def test_url_strips_trailing_slash():
     with patch.dict(os.environ, env, clear=False):
         config = JiraConfig.from_env()
     assert config.url == "https://jira.example.com"
+
+
+def test_retry_settings_from_env():
+    env = {
+        "JIRA_URL": "https://jira.example.com",
+        "JIRA_PAT": "x",
+        "JIRA_MAX_RETRIES": "5",
+        "JIRA_RETRY_BACKOFF": "0.25",
+        "JIRA_RETRY_MAX_WAIT": "10",
+    }
+    with patch.dict(os.environ, env, clear=False):
+        config = JiraConfig.from_env()
+    assert config.max_retries == 5
+    assert config.retry_backoff == 0.25
+    assert config.retry_max_wait == 10.0
+
+
+def test_rate_limit_config_from_env():
+    env = {"ATLASSIAN_RATE_LIMIT": "2.5", "ATLASSIAN_RATE_BURST": "4"}
+    with patch.dict(os.environ, env, clear=False):
+        config = RateLimitConfig.from_env()
+    assert config.rate == 2.5
+    assert config.burst == 4
+    assert config.enabled is True
+    assert RateLimitConfig(rate=0).enabled is False
+
+
+def test_cache_budget_from_env():
+    env = {"JIRA_URL": "https://jira.example.com", "JIRA_PAT": "x", "JIRA_CACHE_MAX_MB": "8"}
+    with patch.dict(os.environ, env, clear=False):
+        config = JiraConfig.from_env()
+    assert config.cache_max_mb == 8.0
+
+
+def test_page_parallelism_from_env():
+    env = {"JIRA_URL": "https://jira.example.com", "JIRA_PAT": "x", "JIRA_PAGE_PARALLELISM": "2"}
+    with patch.dict(os.environ, env, clear=False):
+        config = JiraConfig.from_env()
+    assert config.page_parallelism == 2
+    assert config.max_attachment_mb == 100.0
+    assert config.attachment_cache_dir == ""
+
+
+def test_etag_cache_from_env():
+    env = {
+        "CONFLUENCE_URL": "https://confluence.example.com",
+        "CONFLUENCE_PAT": "x",
+        "CONFLUENCE_ETAG_CACHE_MB": "0",
+    }
+    with patch.dict(os.environ, env, clear=False):
+        config = ConfluenceConfig.from_env()
+    assert config.etag_cache_mb == 0.0
+
+
+def test_calendar_parallelism_from_env():
+    env = {
+        "CONFLUENCE_URL": "https://confluence.example.com",
+        "CONFLUENCE_PAT": "x",
+        "CONFLUENCE_CALENDAR_PARALLELISM": "4",
+        "CONFLUENCE_EVENT_WINDOW_DAYS": "7",
+    }
+    with patch.dict(os.environ, env, clear=False):
+        config = ConfluenceConfig.from_env()
+    assert config.calendar_parallelism == 4
+    assert config.event_window_days == 7
+    assert config.calendar_index_ttl == 300.0
+    assert config.time_off_ttl == 300.0
+    assert config.time_off_db == ":memory:"
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
+
 import httpx
 import pytest
 import respx
 
+from mcp_atlassian_extended.clients.calendars import CalendarIndex
 from mcp_atlassian_extended.clients.confluence import ConfluenceExtendedClient
 from mcp_atlassian_extended.config import ConfluenceConfig
+from mcp_atlassian_extended.exceptions import AtlassianApiError
 
 BASE = "https://confluence.example.com"
 
@@ -98,3 +102,226 @@ class TestConfluenceClient:
             result = await client.get_events(["cal-1"], "2026-03-01", "2026-03-31")
             assert len(result) == 1
             assert result[0]["title"] == "PTO"
+
+
+def _window_events(request: httpx.Request) -> httpx.Response:
+    """One event per window, plus one spanning March/April."""
+    start = request.url.params["start"]
+    events = [{"id": f"e-{start}", "start": start}]
+    if start <= "2026-03-31" <= request.url.params["end"]:
+        events.append({"id": "span", "start": "2026-03-30"})
+    return httpx.Response(200, json={"events": events})
+
+
+class TestEventWindows:
+    @pytest.mark.asyncio
+    async def test_long_range_split_and_deduplicated(self):
+        async with respx.mock(base_url=BASE) as router:
+            route = router.get("/rest/calendar-services/1.0/calendar/events.json").mock(
+                side_effect=_window_events
+            )
+            client = ConfluenceExtendedClient(
+                ConfluenceConfig(url=BASE, token="t", event_window_days=31)
+            )
+            result = await client.get_events(["cal-1"], "2026-03-01", "2026-05-15")
+            windows = sorted(
+                (c.request.url.params["start"], c.request.url.params["end"]) for c in route.calls
+            )
+            assert windows == [
+                ("2026-03-01", "2026-04-01"),
+                ("2026-04-01", "2026-05-02"),
+                ("2026-05-02", "2026-05-15"),
+            ]
+            ids = [e["id"] for e in result]
+            assert ids == ["e-2026-03-01", "span", "e-2026-04-01", "e-2026-05-02"]
+
+    @pytest.mark.asyncio
+    async def test_short_range_single_request(self):
+        async with respx.mock(base_url=BASE) as router:
+            route = router.get("/rest/calendar-services/1.0/calendar/events.json").mock(
+                side_effect=_window_events
+            )
+            client = ConfluenceExtendedClient(
+                ConfluenceConfig(url=BASE, token="t", event_window_days=0)
+            )
+            await client.get_events(["cal-1"], "2026-01-01", "2026-12-31")
+            assert route.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_boundary_events_without_id_deduplicated(self):
+        def boundary(request: httpx.Request) -> httpx.Response:
+            event = {"title": "Offsite", "start": "2026-04-01", "end": "2026-04-02"}
+            return httpx.Response(200, json={"events": [{**event, "subCalendarId": "cal-1"}]})
+
+        async with respx.mock(base_url=BASE) as router:
+            router.get("/rest/calendar-services/1.0/calendar/events.json").mock(
+                side_effect=boundary
+            )
+            client = ConfluenceExtendedClient(
+                ConfluenceConfig(url=BASE, token="t", event_window_days=31)
+            )
+            result = await client.get_events(["cal-1"], "2026-03-01", "2026-05-15")
+            assert len(result) == 1
+
+
+def _leave_calendars(count: int) -> dict:
+    return {
+        "payload": [
+            {
+                "subCalendar": {"id": f"cal-{i}", "name": f"Team {i} Leaves", "typeKey": "leaves"},
+                "childSubCalendars": [],
+            }
+            for i in range(count)
+        ]
+    }
+
+
+def _leave_event(cal_id: str) -> dict:
+    return {
+        "id": f"ev-{cal_id}",
+        "title": f"Out {cal_id}",
+        "start": "2024-03-04",
+        "end": "2024-03-05",
+        "eventType": "leaves",
+        "subCalendarId": cal_id,
+        "invitees": [{"displayName": f"Person {cal_id}"}],
+    }
+
+
+class TestTimeOffFanOut:
+    @pytest.mark.asyncio
+    async def test_fetches_concurrently_up_to_cap(self):
+        in_flight = 0
+        peak = 0
+
+        async def events(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            cal_id = request.url.params["subCalendarId"]
+            return httpx.Response(200, json={"events": [_leave_event(cal_id)]})
+
+        client = ConfluenceExtendedClient(
+            ConfluenceConfig(url=BASE, token="t", calendar_parallelism=3)
+        )
+        async with respx.mock(base_url=BASE) as router:
+            router.get("/rest/calendar-services/1.0/calendar/subcalendars.json").mock(
+                return_value=httpx.Response(200, json=_leave_calendars(8))
+            )
+            router.get("/rest/calendar-services/1.0/calendar/events.json").mock(side_effect=events)
+            result = await client.get_time_off_events("2024-03-01", "2024-03-10")
+        assert peak == 3
+        # Merged in calendar order regardless of completion order.
+        assert [e["calendar_id"] for e in result] == [f"cal-{i}" for i in range(8)]
+
+    @pytest.mark.asyncio
+    async def test_partial_failure_reported(self):
+        def events(request: httpx.Request) -> httpx.Response:
+            cal_id = request.url.params["subCalendarId"]
+            if cal_id == "cal-1":
+                return httpx.Response(404, text="gone")
+            return httpx.Response(200, json={"events": [_leave_event(cal_id)]})
+
+        client = ConfluenceExtendedClient(ConfluenceConfig(url=BASE, token="t", max_retries=0))
+        async with respx.mock(base_url=BASE) as router:
+            router.get("/rest/calendar-services/1.0/calendar/subcalendars.json").mock(
+                return_value=httpx.Response(200, json=_leave_calendars(3))
+            )
+            router.get("/rest/calendar-services/1.0/calendar/events.json").mock(side_effect=events)
+            result, failures = await client.collect_time_off_events("2024-03-01", "2024-03-10")
+        assert [e["calendar_id"] for e in result] == ["cal-0", "cal-2"]
+        assert failures == [
+            {
+                "calendar_id": "cal-1",
+                "calendar_name": "Team 1 Leaves",
+                "error": "Atlassian API Error 404: Not Found",
+                "status_code": 404,
+            }
+        ]
+
+    @pytest.mark.asyncio
+    async def test_all_calendars_failing_raises(self):
+        client = ConfluenceExtendedClient(ConfluenceConfig(url=BASE, token="t", max_retries=0))
+        async with respx.mock(base_url=BASE) as router:
+            router.get("/rest/calendar-services/1.0/calendar/subcalendars.json").mock(
+                return_value=httpx.Response(200, json=_leave_calendars(2))
+            )
+            router.get("/rest/calendar-services/1.0/calendar/events.json").mock(
+                return_value=httpx.Response(403, text="denied")
+            )
+            with pytest.raises(AtlassianApiError):
+                await client.get_time_off_events("2024-03-01", "2024-03-10")
+
+
+_MIXED_CALENDARS = [
+    {
+        "subCalendar": {
+            "id": "team",
+            "name": "Team Calendar",
+            "typeKey": "parent",
+            "spaceKey": "ENG",
+            "spaceName": "Engineering",
+        },
+        "childSubCalendars": [
+            {"subCalendar": {"id": "team-pto", "name": "PTO"}},
+            {"subCalendar": {"id": "team-events", "name": "Events"}},
+        ],
+    },
+    {
+        "subCalendar": {"id": "ops", "name": "Ops Vacation", "typeKey": "leaves"},
+        "childSubCalendars": [],
+    },
+    {
+        "subCalendar": {"id": "rel", "name": "Releases", "typeKey": "events", "spaceKey": "REL"},
+        "childSubCalendars": [],
+    },
+]
+
+
+class TestCalendarIndex:
+    def test_leave_calendars_and_ids(self):
+        index = CalendarIndex(_MIXED_CALENDARS)
+        assert [e.id for e in index.leave] == ["team", "ops"]
+        assert index.by_id["team"].leave_ids == ("team-pto",)
+        assert index.by_id["ops"].leave_ids == ("ops",)
+        assert index.by_id["team-events"].id == "team"
+        assert index.by_id["rel"].leave_ids == ()
+
+    def test_lookups(self):
+        index = CalendarIndex(_MIXED_CALENDARS)
+        assert [e.id for e in index.search("eng")] == ["team"]
+        assert [e.id for e in index.search("rel")] == ["rel"]
+        assert [e.id for e in index.filter_type("leaves")] == ["ops"]
+        assert [e.id for e in index.leave_calendars("ops")] == ["ops"]
+        assert index.by_id["team"].summary()["child_ids"] == ["team-pto", "team-events"]
+
+    @pytest.mark.asyncio
+    async def test_index_reused_within_ttl(self):
+        client = _make_client()
+        async with respx.mock(base_url=BASE) as router:
+            route = router.get("/rest/calendar-services/1.0/calendar/subcalendars.json").mock(
+                return_value=httpx.Response(200, json={"payload": _MIXED_CALENDARS})
+            )
+            router.get("/rest/calendar-services/1.0/calendar/events.json").mock(
+                return_value=httpx.Response(200, json={"events": []})
+            )
+            await client.get_all_leave_calendars()
+            await client.get_time_off_events("2024-03-01", "2024-03-10")
+            await client.calendar_index()
+        assert route.call_count == 1
+        assert client.stats()["calendar_index"]["leave_calendars"] == 2
+
+    @pytest.mark.asyncio
+    async def test_index_rebuilt_after_ttl(self):
+        client = ConfluenceExtendedClient(
+            ConfluenceConfig(url=BASE, token="t", calendar_index_ttl=0, etag_cache_mb=0)
+        )
+        async with respx.mock(base_url=BASE) as router:
+            route = router.get("/rest/calendar-services/1.0/calendar/subcalendars.json").mock(
+                return_value=httpx.Response(200, json={"payload": _MIXED_CALENDARS})
+            )
+            await client.calendar_index()
+            await client.calendar_index()
+        assert route.call_count == 2
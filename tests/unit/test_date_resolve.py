@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 
+import pytest
+
+from mcp_atlassian_extended.dates import _resolve, resolve_date
 from mcp_atlassian_extended.servers.confluence_extended import _resolve_date
 
 
@@ -39,3 +42,30 @@ def test_resolve_next_week():
     result = _resolve_date("next week")
     d = datetime.strptime(result, "%Y-%m-%d")
     assert d.weekday() == 0  # Monday
+
+
+def test_resolve_relative_expressions():
+    today = date(2025, 1, 29)  # Wednesday
+    assert resolve_date("+2w", today) == "2025-02-12"
+    assert resolve_date("+1m", today) == "2025-02-28"
+    assert resolve_date("-1m", today) == "2024-12-29"
+    assert resolve_date("end of month", today) == "2025-01-31"
+    assert resolve_date("Next Sprint", today) == "2025-02-03"
+    assert resolve_date("start of week", today) == "2025-01-27"
+
+
+def test_resolve_non_iso_and_invalid():
+    assert resolve_date("March 4, 2024") == "2024-03-04"
+    with pytest.raises(ValueError):
+        resolve_date("2024-13-01")
+    with pytest.raises(ValueError):
+        resolve_date("whenever")
+
+
+def test_relative_dates_memoized_per_day():
+    _resolve.cache_clear()
+    resolve_date("+3d", date(2025, 1, 1))
+    resolve_date("+3d", date(2025, 1, 1))
+    assert resolve_date("+3d", date(2025, 1, 2)) == "2025-01-05"
+    info = _resolve.cache_info()
+    assert (info.hits, info.misses) == (1, 2)
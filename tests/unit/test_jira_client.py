@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
+import base64
+import hashlib
+import json
+
 import httpx
 import pytest
 import respx
 
-from mcp_atlassian_extended.clients.jira import JiraExtendedClient
+from mcp_atlassian_extended.clients.jira import JiraExtendedClient, _as_text
 from mcp_atlassian_extended.config import JiraConfig
-from mcp_atlassian_extended.exceptions import AtlassianAuthError
+from mcp_atlassian_extended.exceptions import AtlassianApiError, AtlassianAuthError
 
 BASE = "https://jira.example.com"
 
@@ -35,9 +40,10 @@ class TestJiraClient:
     async def test_search_users(self):
         async with respx.mock(base_url=BASE) as router:
             router.get("/rest/api/2/user/search").mock(
-                return_value=httpx.Response(
-                    200, json=[{"displayName": "John Doe", "accountId": "abc123"}]
-                )
+                side_effect=[
+                    httpx.Response(200, json=[{"displayName": "John Doe", "accountId": "abc123"}]),
+                    httpx.Response(200, json=[]),
+                ]
             )
             client = _make_client()
             result = await client.search_users("john")
@@ -145,6 +151,246 @@ class TestDownloadUrlValidation:
         assert result == "/rest/api/2/attachment/content/123"
 
 
+class TestStreamingDownload:
+    URL = "/secure/attachment/1/big.bin"
+
+    def _client(self, max_mb: float = 100.0) -> JiraExtendedClient:
+        return JiraExtendedClient(
+            JiraConfig(url=BASE, token="t", max_attachment_mb=max_mb, max_retries=0)
+        )
+
+    def _part(self, directory, data: bytes, url: str = URL, **meta) -> None:
+        """Leave a part file and sidecar as an interrupted download of ``url`` would."""
+        tag = url.split("/")[-2]
+        (directory / f".a.bin.{tag}.part").write_bytes(data)
+        (directory / f".a.bin.{tag}.part.json").write_text(json.dumps({"url": url, **meta}))
+
+    @pytest.mark.asyncio
+    async def test_streams_with_hash(self, tmp_path):
+        body = b"x" * (3 * 1024 * 1024 + 7)
+        async with respx.mock(base_url=BASE) as router:
+            router.get(self.URL).mock(return_value=httpx.Response(200, content=body))
+            result = await self._client().download_attachment_to(self.URL, tmp_path / "a.bin")
+        assert result["size"] == len(body)
+        assert result["sha256"] == hashlib.sha256(body).hexdigest()
+        assert (tmp_path / "a.bin").read_bytes() == body
+        assert list(tmp_path.iterdir()) == [tmp_path / "a.bin"]
+
+    @pytest.mark.asyncio
+    async def test_size_limit_keeps_existing_file(self, tmp_path):
+        dest = tmp_path / "a.bin"
+        dest.write_bytes(b"old")
+
+        async def chunks():
+            for _ in range(4):
+                yield b"y" * 1024
+
+        async with respx.mock(base_url=BASE) as router:
+            # No Content-Length: the limit is enforced while streaming.
+            router.get(self.URL).mock(return_value=httpx.Response(200, content=chunks()))
+            with pytest.raises(ValueError, match="too large"):
+                await self._client(max_mb=2048 / 1048576).download_attachment_to(self.URL, dest)
+        assert dest.read_bytes() == b"old"
+        assert list(tmp_path.iterdir()) == [dest]
+
+    @pytest.mark.asyncio
+    async def test_resumes_partial_file(self, tmp_path):
+        body = b"0123456789"
+        self._part(tmp_path, body[:4], size=10, etag='"v1"')
+        async with respx.mock(base_url=BASE) as router:
+            route = router.get(self.URL).mock(
+                return_value=httpx.Response(
+                    206, content=body[4:], headers={"Content-Range": "bytes 4-9/10"}
+                )
+            )
+            result = await self._client().download_attachment_to(self.URL, tmp_path / "a.bin")
+        assert route.calls[0].request.headers["range"] == "bytes=4-"
+        assert route.calls[0].request.headers["if-range"] == '"v1"'
+        assert result["sha256"] == hashlib.sha256(body).hexdigest()
+        assert (tmp_path / "a.bin").read_bytes() == body
+        assert list(tmp_path.iterdir()) == [tmp_path / "a.bin"]
+
+    @pytest.mark.asyncio
+    async def test_range_ignored_restarts(self, tmp_path):
+        self._part(tmp_path, b"stale", size=5)
+        async with respx.mock(base_url=BASE) as router:
+            router.get(self.URL).mock(return_value=httpx.Response(200, content=b"fresh"))
+            await self._client().download_attachment_to(self.URL, tmp_path / "a.bin")
+        assert (tmp_path / "a.bin").read_bytes() == b"fresh"
+        assert list(tmp_path.iterdir()) == [tmp_path / "a.bin"]
+
+    @pytest.mark.asyncio
+    async def test_part_of_other_attachment_not_spliced(self, tmp_path):
+        other = "/secure/attachment/2/big.bin"
+        self._part(tmp_path, b"OLDOLD", url=other, size=20)
+        (tmp_path / ".a.bin.1.part").write_bytes(b"OLD")  # no sidecar: provenance unknown
+
+        def respond(request: httpx.Request) -> httpx.Response:
+            if "range" in request.headers:
+                return httpx.Response(
+                    206, content=b"TACHMENT", headers={"Content-Range": "bytes 6-13/14"}
+                )
+            return httpx.Response(200, content=b"ATTACHMENT-NEW")
+
+        async with respx.mock(base_url=BASE) as router:
+            route = router.get(self.URL).mock(side_effect=respond)
+            result = await self._client().download_attachment_to(self.URL, tmp_path / "a.bin")
+        assert "range" not in route.calls[0].request.headers
+        assert (tmp_path / "a.bin").read_bytes() == b"ATTACHMENT-NEW"
+        assert result["sha256"] == hashlib.sha256(b"ATTACHMENT-NEW").hexdigest()
+
+    @pytest.mark.asyncio
+    async def test_mismatched_content_range_restarts(self, tmp_path):
+        self._part(tmp_path, b"0123", size=10)
+
+        def respond(request: httpx.Request) -> httpx.Response:
+            if "range" in request.headers:
+                # Starts at the wrong offset: appending would corrupt the file.
+                return httpx.Response(
+                    206, content=b"23456789", headers={"Content-Range": "bytes 2-9/10"}
+                )
+            return httpx.Response(200, content=b"0123456789")
+
+        async with respx.mock(base_url=BASE) as router:
+            route = router.get(self.URL).mock(side_effect=respond)
+            result = await self._client().download_attachment_to(self.URL, tmp_path / "a.bin")
+        assert route.call_count == 2
+        assert (tmp_path / "a.bin").read_bytes() == b"0123456789"
+        assert result["size"] == 10
+        assert list(tmp_path.iterdir()) == [tmp_path / "a.bin"]
+
+    @pytest.mark.asyncio
+    async def test_same_destination_never_downloads_twice_at_once(self, tmp_path):
+        active = peak = 0
+
+        async def body():
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            for _ in range(3):
+                await asyncio.sleep(0)
+                yield b"x"
+            active -= 1
+
+        client = self._client()
+        async with respx.mock(base_url=BASE) as router:
+            router.get(self.URL).mock(side_effect=lambda _: httpx.Response(200, content=body()))
+            await asyncio.gather(
+                *(client.download_attachment_to(self.URL, tmp_path / "a.bin") for _ in range(3))
+            )
+        assert peak == 1
+        assert client._download_locks == {}
+        assert client._download_users == {}
+
+    @pytest.mark.asyncio
+    async def test_interrupted_body_resumed_in_call(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("mcp_atlassian_extended.clients.jira.DOWNLOAD_CHUNK", 3)
+        body = b"abcdefgh"
+
+        async def dropped():
+            yield body[:3]
+            msg = "connection reset"
+            raise httpx.ReadError(msg)
+
+        def respond(request: httpx.Request) -> httpx.Response:
+            if "range" in request.headers:
+                assert request.headers["range"] == "bytes=3-"
+                return httpx.Response(
+                    206, content=body[3:], headers={"Content-Range": "bytes 3-7/8"}
+                )
+            return httpx.Response(200, content=dropped())
+
+        client = JiraExtendedClient(JiraConfig(url=BASE, token="t", max_retries=1))
+        async with respx.mock(base_url=BASE) as router:
+            route = router.get(self.URL).mock(side_effect=respond)
+            result = await client.download_attachment_to(self.URL, tmp_path / "a.bin")
+        assert route.call_count == 2
+        assert result["sha256"] == hashlib.sha256(body).hexdigest()
+        assert client.stats()["retry"]["resumed_downloads"] == 1
+
+    @pytest.mark.asyncio
+    async def test_error_status_raises(self, tmp_path):
+        async with respx.mock(base_url=BASE) as router:
+            router.get(self.URL).mock(return_value=httpx.Response(404, text="gone"))
+            with pytest.raises(AtlassianApiError):
+                await self._client().download_attachment_to(self.URL, tmp_path / "a.bin")
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestPreview:
+    URL = "/secure/attachment/7/notes.txt"
+
+    @pytest.mark.asyncio
+    async def test_text_preview_with_range(self):
+        async with respx.mock(base_url=BASE) as router:
+            route = router.get(self.URL).mock(
+                return_value=httpx.Response(
+                    206,
+                    content="héllo".encode()[:6],
+                    headers={"Content-Range": "bytes 0-4/100", "Content-Type": "text/plain"},
+                )
+            )
+            result = await _make_client().preview_attachment(self.URL, 6)
+        assert route.calls[0].request.headers["range"] == "bytes=0-5"
+        assert result["content"] == "héllo"
+        assert result["encoding"] == "utf-8"
+        assert (result["total_size"], result["truncated"]) == (100, True)
+
+    @pytest.mark.asyncio
+    async def test_binary_preview_when_range_ignored(self):
+        png = b"\x89PNG\r\n\x1a\n\x00\x00" + b"x" * 100
+        async with respx.mock(base_url=BASE) as router:
+            router.get(self.URL).mock(return_value=httpx.Response(200, content=png))
+            result = await _make_client().preview_attachment(self.URL, 8)
+        assert result["encoding"] == "base64"
+        assert base64.b64decode(result["content"]) == png[:8]
+        assert result["total_size"] == len(png)
+
+
+def test_preview_text_cut_mid_character():
+    data = "hé".encode()[:2]  # "h" plus the first byte of "é"
+    assert _as_text(data) == "h"
+    assert _as_text(b"\xff\xfe binary") is None
+
+
+class TestStreamingUpload:
+    @pytest.mark.asyncio
+    async def test_multipart_body_and_progress(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("mcp_atlassian_extended.clients.jira.UPLOAD_CHUNK", 4)
+        upload = tmp_path / 'notes "v1".txt'
+        upload.write_bytes(b"0123456789")
+        seen: list[tuple[int, int]] = []
+
+        async def progress(sent: int, total: int) -> None:
+            seen.append((sent, total))
+
+        async with respx.mock(base_url=BASE) as router:
+            route = router.post("/rest/api/2/issue/PROJ-1/attachments").mock(
+                return_value=httpx.Response(200, json=[{"id": "1"}])
+            )
+            client = _make_client()
+            result = await client.upload_attachment("PROJ-1", str(upload), progress=progress)
+
+        assert result == [{"id": "1"}]
+        request = route.calls[0].request
+        boundary = request.headers["content-type"].split("boundary=")[1]
+        body = request.content
+        assert int(request.headers["content-length"]) == len(body)
+        assert body.startswith(f"--{boundary}\r\n".encode())
+        assert b'filename="notes %22v1%22.txt"' in body
+        assert b"Content-Type: text/plain\r\n\r\n0123456789\r\n" in body
+        assert body.endswith(f"--{boundary}--\r\n".encode())
+        assert seen == [(4, 10), (8, 10), (10, 10)]
+
+    @pytest.mark.asyncio
+    async def test_size_limit_from_config(self, tmp_path):
+        upload = tmp_path / "big.bin"
+        upload.write_bytes(b"x" * 2048)
+        client = JiraExtendedClient(JiraConfig(url=BASE, token="t", max_attachment_mb=0.001))
+        with pytest.raises(ValueError, match="too large"):
+            await client.upload_attachment("PROJ-1", str(upload))
+
+
 class TestVersions:
     @pytest.mark.asyncio
     async def test_get_project_versions(self):
@@ -197,3 +443,40 @@ class TestVersions:
             client = _make_client()
             result = await client.update_version("200", released=True)
             assert result["released"] is True
+
+
+def _backlog_page(request: httpx.Request) -> httpx.Response:
+    """Agile-style backlog of five issues that reports ``isLast`` but no ``total``."""
+    start = int(request.url.params.get("startAt", 0))
+    size = min(int(request.url.params["maxResults"]), 2)
+    issues = [
+        {"key": f"PROJ-{i}", "self": f"{BASE}/rest/api/2/issue/{i}", "fields": {}}
+        for i in range(start, min(start + size, 5))
+    ]
+    return httpx.Response(
+        200,
+        json={"startAt": start, "maxResults": size, "isLast": start + size >= 5, "issues": issues},
+    )
+
+
+class TestBacklog:
+    @pytest.mark.asyncio
+    async def test_iter_backlog_pages_in_rank_order(self):
+        async with respx.mock(base_url=BASE) as router:
+            route = router.get("/rest/agile/1.0/board/42/backlog").mock(side_effect=_backlog_page)
+            client = _make_client()
+            issues = [issue async for issue in client.iter_backlog(42, page_size=2, limit=4)]
+            assert [i["key"] for i in issues] == ["PROJ-0", "PROJ-1", "PROJ-2", "PROJ-3"]
+            assert all("self" not in i for i in issues)
+            assert route.call_count == 2
+            assert route.calls[0].request.url.params["fields"].startswith("summary,status")
+
+    @pytest.mark.asyncio
+    async def test_get_backlog_without_total_walks_pages(self):
+        async with respx.mock(base_url=BASE) as router:
+            router.get("/rest/agile/1.0/board/42/backlog").mock(side_effect=_backlog_page)
+            client = _make_client()
+            data = await client.get_backlog(42, 50)
+            assert [i["key"] for i in data["issues"]] == [f"PROJ-{i}" for i in range(5)]
+            assert data["total"] is None
+            assert all("self" not in i for i in data["issues"])
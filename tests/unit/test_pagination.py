@@ -0,0 +1,141 @@
+"""Tests for Jira pagination helpers."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from mcp_atlassian_extended.clients.pagination import fetch_offset_pages, iter_pages
+
+
+def _pages(total: int, cap: int, calls: list[tuple[int, int]], delays: bool = False):
+    async def fetch(start_at: int, size: int) -> dict:
+        calls.append((start_at, size))
+        if delays:
+            # Later pages finish first; the merge must still be in offset order.
+            await asyncio.sleep(0.001 * (total - start_at) / max(cap, 1))
+        size = min(size, cap)
+        items = list(range(start_at, min(start_at + size, total)))
+        return {"startAt": start_at, "maxResults": size, "total": total, "issues": items}
+
+    return fetch
+
+
+@pytest.mark.asyncio
+async def test_all_pages_in_order():
+    calls: list[tuple[int, int]] = []
+    items, total = await fetch_offset_pages(
+        _pages(230, 50, calls, delays=True), items_key="issues", page_size=100
+    )
+    assert total == 230
+    assert items == list(range(230))
+    # Server capped the page at 50; later offsets follow the applied size.
+    assert sorted(s for s, _ in calls) == [0, 50, 100, 150, 200]
+
+
+@pytest.mark.asyncio
+async def test_limit_stops_early():
+    calls: list[tuple[int, int]] = []
+    items, total = await fetch_offset_pages(
+        _pages(1000, 50, calls), items_key="issues", limit=120, page_size=50
+    )
+    assert total == 1000
+    assert items == list(range(120))
+    assert sorted(calls) == [(0, 50), (50, 50), (100, 20)]
+
+
+@pytest.mark.asyncio
+async def test_parallelism_bounded():
+    in_flight = peak = 0
+
+    async def fetch(start_at: int, size: int) -> dict:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.001)
+        in_flight -= 1
+        return {"maxResults": 10, "total": 200, "issues": list(range(start_at, start_at + 10))}
+
+    items, _ = await fetch_offset_pages(fetch, items_key="issues", page_size=10, parallelism=3)
+    assert len(items) == 200
+    assert peak <= 3
+
+
+@pytest.mark.asyncio
+async def test_without_total_reads_first_page_only():
+    async def fetch(start_at: int, size: int) -> dict:
+        return {"issues": [1, 2, 3]}
+
+    assert await fetch_offset_pages(fetch, items_key="issues") == ([1, 2, 3], None)
+
+
+def _style_fetcher(style: str, total: int, calls: list[dict]):
+    async def fetch(params: dict) -> object:
+        calls.append(dict(params))
+        size = params["maxResults"]
+        if style == "token":
+            start = int(params.get("nextPageToken", 0))
+        else:
+            start = params.get("startAt", 0)
+        items = list(range(start, min(start + size, total)))
+        end = start + len(items)
+        if style == "agile":
+            return {"startAt": start, "maxResults": size, "isLast": end >= total, "values": items}
+        if style == "offset":
+            return {"startAt": start, "maxResults": size, "total": total, "values": items}
+        if style == "token":
+            return {"values": items, "nextPageToken": str(end) if end < total else None}
+        return items
+
+    return fetch
+
+
+async def _collect(pages) -> list:
+    return [item async for item in pages]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("style", ["agile", "offset", "token", "list"])
+async def test_iter_pages_styles(style):
+    calls: list[dict] = []
+    key = None if style == "list" else "values"
+    items = await _collect(
+        iter_pages(_style_fetcher(style, 25, calls), items_key=key, page_size=10)
+    )
+    assert items == list(range(25))
+    # A bare list has no end marker; it ends on the first empty page.
+    assert len(calls) == (4 if style == "list" else 3)
+
+
+@pytest.mark.asyncio
+async def test_iter_pages_bare_list_continues_past_short_page():
+    pages = [[1, 2, 3], [4, 5], []]
+    calls: list[dict] = []
+
+    async def fetch(params: dict) -> list:
+        calls.append(dict(params))
+        return pages[len(calls) - 1]
+
+    assert await _collect(iter_pages(fetch, page_size=5)) == [1, 2, 3, 4, 5]
+    assert [c.get("startAt", 0) for c in calls] == [0, 3, 5]
+
+
+@pytest.mark.asyncio
+async def test_iter_pages_limit_skips_later_pages():
+    calls: list[dict] = []
+    fetch = _style_fetcher("offset", 100, calls)
+    pages = iter_pages(fetch, items_key="values", page_size=10, limit=15)
+    assert await _collect(pages) == list(range(15))
+    assert [c.get("startAt", 0) for c in calls] == [0, 10]
+
+
+@pytest.mark.asyncio
+async def test_iter_pages_prefetches_next_page():
+    calls: list[dict] = []
+    pages = iter_pages(_style_fetcher("agile", 30, calls), items_key="values", page_size=10)
+    assert await pages.__anext__() == 0
+    await asyncio.sleep(0)
+    # The second page was requested while the first is still being consumed.
+    assert len(calls) == 2
+    await pages.aclose()
@@ -0,0 +1,91 @@
+"""Tests for the person index used by time-off and capacity tools."""
+
+from __future__ import annotations
+
+from mcp_atlassian_extended.people import PersonIndex, group_by_person
+
+
+def _event(name: str, email: str | None = None, person_id: str | None = None, day: int = 1):
+    return {
+        "person_name": name,
+        "person_email": email,
+        "person_id": person_id,
+        "start_date": f"2024-03-{day:02d}",
+        "end_date": f"2024-03-{day:02d}",
+    }
+
+
+EVENTS = [
+    _event("Alice Smith", "alice@example.com", "acc-1", day=1),
+    _event("Al Jones", "al@example.com", "acc-2", day=2),
+    _event("Bob Alison", "bob@example.com", "acc-3", day=3),
+    _event("alice smith", "Alice@Example.com", "acc-1", day=4),
+]
+
+
+def _days(events):
+    return [e["start_date"][-2:] for e in events]
+
+
+def test_full_name_and_single_token():
+    index = PersonIndex(EVENTS)
+    assert _days(index.match("Alice Smith")) == ["01", "04"]
+    assert _days(index.match("smith")) == ["01", "04"]
+
+
+def test_short_name_does_not_match_inside_words():
+    index = PersonIndex(EVENTS)
+    # Substring matching used to return Alice Smith and Bob Alison as well.
+    assert _days(index.match("Al")) == ["02"]
+
+
+def test_short_name_without_events_matches_nobody():
+    # No "Al" event: the roster member must not pick up Alice Smith's days.
+    index = PersonIndex(EVENTS[:1] + EVENTS[2:])
+    assert index.match("Al") == []
+    assert index.match("Al Smith") == []
+    assert index.match("Al", prefix=True) == []
+
+
+def test_prefix_fallback_is_opt_in():
+    index = PersonIndex(EVENTS)
+    assert index.match("Alic") == []
+    assert _days(index.match("Alic", prefix=True)) == ["01", "04"]
+    assert _days(index.match("Alis", prefix=True)) == ["03"]
+    assert _days(index.match("Alic Smit", prefix=True)) == ["01", "04"]
+    # Tokens under MIN_PREFIX characters still have to match whole.
+    assert index.match("Ali", prefix=True) == []
+
+
+def test_email_and_account_id():
+    index = PersonIndex(EVENTS)
+    assert _days(index.match("ALICE@example.com")) == ["01", "04"]
+    assert _days(index.match("acc-3")) == ["03"]
+
+
+def test_exact_email_mode_ignores_names():
+    index = PersonIndex(EVENTS)
+    assert index.match("Alice Smith", exact_email=True) == []
+    assert _days(index.match("bob@example.com", exact_email=True)) == ["03"]
+
+
+def test_no_match():
+    index = PersonIndex(EVENTS)
+    assert index.match("Charlie") == []
+    assert index.match("  ") == []
+
+
+def test_group_by_person_keeps_similar_names_apart():
+    events = [
+        _event("John Smith", "john@example.com", "acc-1", day=1),
+        _event("John Smith Jr", "jr@example.com", "acc-2", day=2),
+        _event("John Smith", None, "acc-1", day=3),
+        _event("Pat Lee", "pat@example.com", day=4),
+        _event("Pat Lee", "pat.lee@example.com", day=5),
+    ]
+    groups = group_by_person(events)
+    assert _days(groups["John Smith"]) == ["01", "03"]
+    assert _days(groups["John Smith Jr"]) == ["02"]
+    # Same display name, different people: disambiguated by email.
+    assert _days(groups["Pat Lee (pat@example.com)"]) == ["04"]
+    assert _days(groups["Pat Lee (pat.lee@example.com)"]) == ["05"]
@@ -0,0 +1,111 @@
+"""Tests for the per-host token-bucket rate limiter."""
+
+from __future__ import annotations
+
+import time
+
+import httpx
+import pytest
+import respx
+
+from mcp_atlassian_extended.clients.jira import JiraExtendedClient
+from mcp_atlassian_extended.clients.ratelimit import MIN_RATE, RateLimiterRegistry, TokenBucket
+from mcp_atlassian_extended.config import JiraConfig, RateLimitConfig
+
+BASE = "https://jira.example.com"
+
+
+def _response(status: int = 200, **headers: str) -> httpx.Response:
+    return httpx.Response(status, headers={k.replace("_", "-"): v for k, v in headers.items()})
+
+
+class TestTokenBucket:
+    @pytest.mark.asyncio
+    async def test_burst_passes_then_smooths(self):
+        bucket = TokenBucket(rate=50, burst=2)
+        assert await bucket.acquire() == 0
+        assert await bucket.acquire() == 0
+        start = time.monotonic()
+        waited = await bucket.acquire()
+        assert waited > 0
+        assert time.monotonic() - start >= 0.015
+        assert bucket.stats()["throttled"] == 1
+
+    def test_adapts_to_data_center_bucket_headers(self):
+        bucket = TokenBucket(rate=10, burst=20)
+        bucket.observe(
+            _response(
+                X_RateLimit_Limit="5",
+                X_RateLimit_Remaining="3",
+                X_RateLimit_FillRate="2",
+                X_RateLimit_Interval_Seconds="1",
+            )
+        )
+        assert bucket.rate == 2
+        assert bucket.burst == 5
+        assert bucket.stats()["tokens"] <= 3
+
+    def test_never_exceeds_configured_rate(self):
+        bucket = TokenBucket(rate=1, burst=5)
+        bucket.observe(_response(X_RateLimit_FillRate="100", X_RateLimit_Interval_Seconds="1"))
+        assert bucket.rate == 1
+
+    def test_429_halves_rate_and_success_recovers(self):
+        bucket = TokenBucket(rate=10, burst=5)
+        bucket.observe(_response(429))
+        assert bucket.rate == 5
+        bucket.observe(_response(200))
+        assert 5 < bucket.rate <= 10
+
+    def test_rate_has_floor(self):
+        bucket = TokenBucket(rate=1, burst=1)
+        for _ in range(20):
+            bucket.observe(_response(429))
+        assert bucket.rate == MIN_RATE
+
+    def test_near_limit_slows_down(self):
+        bucket = TokenBucket(rate=10, burst=5)
+        bucket.observe(_response(X_RateLimit_NearLimit="true"))
+        assert bucket.rate == 7.5
+
+    @pytest.mark.asyncio
+    async def test_exhausted_remaining_blocks_until_reset(self):
+        bucket = TokenBucket(rate=100, burst=10)
+        bucket.observe(_response(X_RateLimit_Remaining="0", Retry_After="0.05"))
+        start = time.monotonic()
+        await bucket.acquire()
+        assert time.monotonic() - start >= 0.04
+
+
+class TestRegistry:
+    def test_shares_bucket_per_host(self):
+        registry = RateLimiterRegistry(RateLimitConfig(rate=5, burst=5))
+        jira = registry.for_url("https://acme.atlassian.net")
+        confluence = registry.for_url("https://acme.atlassian.net/wiki")
+        other = registry.for_url("https://jira.internal.example.com")
+        assert jira is confluence
+        assert jira is not other
+        assert set(registry.stats()) == {"acme.atlassian.net", "jira.internal.example.com"}
+
+    def test_disabled(self):
+        registry = RateLimiterRegistry(RateLimitConfig(rate=0))
+        assert registry.for_url(BASE) is None
+
+
+class TestClientIntegration:
+    @pytest.mark.asyncio
+    async def test_client_draws_from_bucket(self):
+        bucket = TokenBucket(rate=100, burst=10)
+        client = JiraExtendedClient(JiraConfig(url=BASE, token="t"), rate_limiter=bucket)
+        async with respx.mock(base_url=BASE) as router:
+            router.get("/rest/api/2/project").mock(
+                return_value=httpx.Response(
+                    200,
+                    json=[],
+                    headers={"X-RateLimit-FillRate": "4", "X-RateLimit-Interval-Seconds": "1"},
+                )
+            )
+            await client.list_projects()
+        stats = client.stats()["rate_limiter"]
+        assert stats["acquired"] == 1
+        assert stats["rate"] == 4
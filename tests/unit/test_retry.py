@@ -0,0 +1,162 @@
+"""Tests for the retry policy and the client retry loop."""
+
+from __future__ import annotations
+
+import time
+from email.utils import formatdate
+
+import httpx
+import pytest
+import respx
+
+from mcp_atlassian_extended.clients import base
+from mcp_atlassian_extended.clients.jira import JiraExtendedClient
+from mcp_atlassian_extended.clients.retry import RetryPolicy, parse_retry_after
+from mcp_atlassian_extended.config import JiraConfig
+from mcp_atlassian_extended.exceptions import AtlassianApiError
+
+BASE = "https://jira.example.com"
+
+
+def _make_client(**overrides) -> JiraExtendedClient:
+    return JiraExtendedClient(JiraConfig(url=BASE, token="test-token", **overrides))
+
+
+@pytest.fixture
+def sleeps(monkeypatch) -> list[float]:
+    """Record backoff sleeps instead of actually sleeping."""
+    recorded: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        recorded.append(delay)
+
+    monkeypatch.setattr(base, "_sleep", fake_sleep)
+    return recorded
+
+
+class TestParseRetryAfter:
+    def test_delta_seconds(self):
+        assert parse_retry_after(httpx.Headers({"Retry-After": "7"})) == 7.0
+
+    def test_http_date(self):
+        future = formatdate(time.time() + 30, usegmt=True)
+        delay = parse_retry_after(httpx.Headers({"Retry-After": future}))
+        assert delay is not None
+        assert 25 <= delay <= 31
+
+    def test_ratelimit_reset_iso(self):
+        from datetime import datetime, timedelta, timezone
+
+        reset = (datetime.now(timezone.utc) + timedelta(seconds=20)).isoformat()
+        delay = parse_retry_after(httpx.Headers({"X-RateLimit-Reset": reset}))
+        assert delay is not None
+        assert 15 <= delay <= 21
+
+    def test_ratelimit_reset_epoch(self):
+        reset = str(int(time.time()) + 10)
+        delay = parse_retry_after(httpx.Headers({"X-RateLimit-Reset": reset}))
+        assert delay is not None
+        assert 8 <= delay <= 11
+
+    def test_past_reset_is_zero(self):
+        reset = str(int(time.time()) - 100)
+        assert parse_retry_after(httpx.Headers({"X-RateLimit-Reset": reset})) == 0.0
+
+    def test_no_hint(self):
+        assert parse_retry_after(httpx.Headers({})) is None
+        assert parse_retry_after(httpx.Headers({"Retry-After": "soon"})) is None
+
+
+class TestRetryPolicy:
+    def test_idempotent_methods_only_by_default(self):
+        policy = RetryPolicy()
+        assert policy.allows("GET")
+        assert policy.allows("put")
+        assert not policy.allows("POST")
+        assert policy.allows("POST", idempotent=True)
+        assert not policy.allows("GET", idempotent=False)
+
+    def test_disabled_when_no_retries(self):
+        assert not RetryPolicy(max_retries=0).allows("GET")
+
+    def test_backoff_is_capped(self):
+        policy = RetryPolicy(backoff_base=1.0, backoff_max=4.0)
+        assert all(0 <= policy.backoff(10) <= 4.0 for _ in range(50))
+
+
+class TestClientRetries:
+    @pytest.mark.asyncio
+    async def test_retries_then_succeeds(self, sleeps):
+        async with respx.mock(base_url=BASE) as router:
+            router.get("/rest/api/2/project").mock(
+                side_effect=[
+                    httpx.Response(429, headers={"Retry-After": "2"}),
+                    httpx.Response(503),
+                    httpx.Response(200, json=[{"key": "PROJ"}]),
+                ]
+            )
+            client = _make_client()
+            result = await client.list_projects()
+        assert result[0]["key"] == "PROJ"
+        assert sleeps[0] == 2.0
+        assert len(sleeps) == 2
+        stats = client.stats()["retry"]
+        assert stats["retries"] == 2
+        assert stats["retried_requests"] == 1
+        assert stats["retries_exhausted"] == 0
+
+    @pytest.mark.asyncio
+    async def test_exhausted_error_reports_retries(self, sleeps):
+        async with respx.mock(base_url=BASE) as router:
+            router.get("/rest/api/2/project").mock(return_value=httpx.Response(429))
+            client = _make_client(max_retries=2)
+            with pytest.raises(AtlassianApiError) as exc_info:
+                await client.list_projects()
+        assert exc_info.value.status_code == 429
+        assert exc_info.value.retries == 2
+        assert client.stats()["retry"]["retries_exhausted"] == 1
+
+    @pytest.mark.asyncio
+    async def test_post_not_retried(self, sleeps):
+        async with respx.mock(base_url=BASE) as router:
+            route = router.post("/rest/api/2/issue").mock(return_value=httpx.Response(503))
+            client = _make_client()
+            with pytest.raises(AtlassianApiError):
+                await client.create_issue("PROJ", "Summary")
+        assert route.call_count == 1
+        assert sleeps == []
+
+    @pytest.mark.asyncio
+    async def test_client_errors_not_retried(self, sleeps):
+        async with respx.mock(base_url=BASE) as router:
+            route = router.get("/rest/api/2/project").mock(return_value=httpx.Response(404))
+            client = _make_client()
+            with pytest.raises(AtlassianApiError):
+                await client.list_projects()
+        assert route.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_retry_after_over_budget_gives_up(self, sleeps):
+        async with respx.mock(base_url=BASE) as router:
+            route = router.get("/rest/api/2/project").mock(
+                return_value=httpx.Response(429, headers={"Retry-After": "600"})
+            )
+            client = _make_client(retry_max_wait=60)
+            with pytest.raises(AtlassianApiError) as exc_info:
+                await client.list_projects()
+        assert route.call_count == 1
+        assert sleeps == []
+        assert exc_info.value.retries == 0
+
+    @pytest.mark.asyncio
+    async def test_transport_error_retried(self, sleeps):
+        async with respx.mock(base_url=BASE) as router:
+            router.get("/rest/api/2/project").mock(
+                side_effect=[
+                    httpx.ConnectError("boom"),
+                    httpx.Response(200, json=[]),
+                ]
+            )
+            client = _make_client()
+            assert await client.list_projects() == []
+        assert len(sleeps) == 1
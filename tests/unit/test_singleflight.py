@@ -0,0 +1,150 @@
+"""Tests for single-flight coalescing of concurrent identical GETs."""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+import respx
+
+from mcp_atlassian_extended.clients.confluence import ConfluenceExtendedClient
+from mcp_atlassian_extended.clients.jira import JiraExtendedClient
+from mcp_atlassian_extended.clients.singleflight import SingleFlight
+from mcp_atlassian_extended.config import ConfluenceConfig, JiraConfig
+from mcp_atlassian_extended.exceptions import AtlassianApiError
+
+BASE = "https://jira.example.com"
+CONF = "https://confluence.example.com"
+
+
+def _slow(response: httpx.Response):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.01)
+        return response
+
+    return handler
+
+
+class TestSingleFlight:
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_result(self):
+        flight = SingleFlight()
+        calls = 0
+
+        async def work() -> int:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return 42
+
+        results = await asyncio.gather(*(flight.do("k", work) for _ in range(4)))
+        assert results == [42] * 4
+        assert calls == 1
+        assert flight.stats() == {"in_flight": 0, "calls": 4, "coalesced": 3}
+
+    @pytest.mark.asyncio
+    async def test_sequential_calls_not_coalesced(self):
+        flight = SingleFlight()
+
+        async def work() -> int:
+            return 1
+
+        await flight.do("k", work)
+        await flight.do("k", work)
+        assert flight.stats()["coalesced"] == 0
+
+    @pytest.mark.asyncio
+    async def test_exception_reaches_every_caller(self):
+        flight = SingleFlight()
+
+        async def fail() -> None:
+            await asyncio.sleep(0.01)
+            msg = "boom"
+            raise RuntimeError(msg)
+
+        results = await asyncio.gather(
+            flight.do("k", fail), flight.do("k", fail), return_exceptions=True
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        flight = SingleFlight()
+
+        async def work() -> str:
+            await asyncio.sleep(0.02)
+            return "done"
+
+        first = asyncio.create_task(flight.do("k", work))
+        second = asyncio.create_task(flight.do("k", work))
+        await asyncio.sleep(0)
+        first.cancel()
+        assert await second == "done"
+
+
+class TestClientCoalescing:
+    @pytest.mark.asyncio
+    async def test_identical_jira_gets_share_one_request(self):
+        client = JiraExtendedClient(JiraConfig(url=BASE, token="t"))
+        async with respx.mock(base_url=BASE) as router:
+            route = router.get("/rest/agile/1.0/board/1").mock(
+                side_effect=_slow(httpx.Response(200, json={"id": 1}))
+            )
+            results = await asyncio.gather(*(client.get_board(1) for _ in range(3)))
+        assert route.call_count == 1
+        assert results == [{"id": 1}] * 3
+        assert client.stats()["single_flight"]["coalesced"] == 2
+
+    @pytest.mark.asyncio
+    async def test_different_params_not_coalesced(self):
+        client = JiraExtendedClient(JiraConfig(url=BASE, token="t"))
+        async with respx.mock(base_url=BASE) as router:
+            route = router.get("/rest/api/2/user/search").mock(
+                side_effect=_slow(httpx.Response(200, json=[]))
+            )
+            await asyncio.gather(client.search_users("alice"), client.search_users("bob"))
+        assert route.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cached_metadata_fetch_coalesced(self):
+        client = JiraExtendedClient(JiraConfig(url=BASE, token="t"))
+        async with respx.mock(base_url=BASE) as router:
+            route = router.get("/rest/api/2/field").mock(
+                side_effect=_slow(httpx.Response(200, json=[{"id": "summary"}]))
+            )
+            await asyncio.gather(*(client.list_fields() for _ in range(3)))
+        assert route.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_posts_never_coalesced(self):
+        client = JiraExtendedClient(JiraConfig(url=BASE, token="t"))
+        async with respx.mock(base_url=BASE) as router:
+            route = router.post("/rest/api/2/version").mock(
+                side_effect=_slow(httpx.Response(201, json={"id": "1"}))
+            )
+            await asyncio.gather(*(client.create_version("P", "v1") for _ in range(2)))
+        assert route.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_error_shared_by_coalesced_callers(self):
+        client = JiraExtendedClient(JiraConfig(url=BASE, token="t"))
+        async with respx.mock(base_url=BASE) as router:
+            route = router.get("/rest/agile/1.0/board/9").mock(
+                side_effect=_slow(httpx.Response(404, text="missing"))
+            )
+            results = await asyncio.gather(
+                client.get_board(9), client.get_board(9), return_exceptions=True
+            )
+        assert route.call_count == 1
+        assert all(isinstance(r, AtlassianApiError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_confluence_calendar_list_coalesced(self):
+        client = ConfluenceExtendedClient(ConfluenceConfig(url=CONF, token="t"))
+        async with respx.mock(base_url=CONF) as router:
+            route = router.get("/rest/calendar-services/1.0/calendar/subcalendars.json").mock(
+                side_effect=_slow(httpx.Response(200, json={"payload": []}))
+            )
+            await asyncio.gather(client.list_calendars(), client.list_calendars())
+        assert route.call_count == 1
@@ -0,0 +1,163 @@
+"""Tests for the local time-off interval store and incremental calendar sync."""
+
+from __future__ import annotations
+
+import time
+
+import httpx
+import pytest
+import respx
+
+from mcp_atlassian_extended.clients.confluence import ConfluenceExtendedClient
+from mcp_atlassian_extended.clients.timeoff import TimeOffStore
+from mcp_atlassian_extended.config import ConfluenceConfig
+
+BASE = "https://confluence.example.com"
+
+
+def _entry(event_id: str, start: str, end: str, person: str = "Alice") -> dict:
+    return {
+        "id": event_id,
+        "person_name": person,
+        "person_email": None,
+        "person_id": None,
+        "description": f"{person} out",
+        "start_date": start,
+        "end_date": end,
+        "calendar_name": "Team Leaves",
+        "calendar_id": "child-1",
+        "all_day": True,
+    }
+
+
+class TestTimeOffStore:
+    def test_missing_whole_range_when_empty(self):
+        store = TimeOffStore(ttl=60)
+        assert store.missing("cal", "2024-03-01", "2024-03-10") == [("2024-03-01", "2024-03-10")]
+
+    def test_missing_only_uncovered_windows(self):
+        store = TimeOffStore(ttl=60)
+        store.save("cal", "2024-03-05", "2024-03-10", [])
+        store.save("cal", "2024-03-15", "2024-03-20", [])
+        assert store.missing("cal", "2024-03-01", "2024-03-31") == [
+            ("2024-03-01", "2024-03-04"),
+            ("2024-03-11", "2024-03-14"),
+            ("2024-03-21", "2024-03-31"),
+        ]
+        assert store.missing("cal", "2024-03-06", "2024-03-09") == []
+        assert store.missing("other", "2024-03-06", "2024-03-09") == [("2024-03-06", "2024-03-09")]
+
+    def test_windows_expire(self, monkeypatch):
+        store = TimeOffStore(ttl=60)
+        store.save("cal", "2024-03-01", "2024-03-10", [])
+        later = time.time() + 120
+        monkeypatch.setattr(time, "time", lambda: later)
+        assert store.missing("cal", "2024-03-01", "2024-03-10") == [("2024-03-01", "2024-03-10")]
+
+    def test_missing_commits_only_when_windows_expire(self, tmp_path, monkeypatch):
+        store = TimeOffStore(ttl=60, path=str(tmp_path / "timeoff.db"))
+        store.save("cal", "2024-03-01", "2024-03-10", [])
+        statements: list[str] = []
+        store._db.set_trace_callback(statements.append)
+        store.missing("cal", "2024-03-01", "2024-03-10")
+        assert "COMMIT" not in statements
+        later = time.time() + 120
+        monkeypatch.setattr(time, "time", lambda: later)
+        store.missing("cal", "2024-03-01", "2024-03-10")
+        assert "COMMIT" in statements
+        store.close()
+
+    def test_overlap_query(self):
+        store = TimeOffStore(ttl=60)
+        store.save(
+            "cal",
+            "2024-03-01",
+            "2024-03-31",
+            [
+                _entry("b", "2024-03-10", "2024-03-12", "Bob"),
+                _entry("a", "2024-03-01", "2024-03-05"),
+                _entry("c", "2024-03-20", "2024-03-21", "Carol"),
+            ],
+        )
+        events = store.events(["cal"], "2024-03-04", "2024-03-10")
+        assert [e["id"] for e in events] == ["a", "b"]
+        assert events[0] == _entry("a", "2024-03-01", "2024-03-05")
+
+    def test_refetch_replaces_deleted_events(self):
+        store = TimeOffStore(ttl=60)
+        store.save("cal", "2024-03-01", "2024-03-10", [_entry("a", "2024-03-02", "2024-03-03")])
+        store.save("cal", "2024-03-01", "2024-03-10", [])
+        assert store.events(["cal"], "2024-03-01", "2024-03-10") == []
+
+
+_CALENDARS = {
+    "payload": [
+        {
+            "subCalendar": {"id": "cal-1", "name": "Team Leaves", "typeKey": "leaves"},
+            "childSubCalendars": [],
+        }
+    ]
+}
+
+
+def _events_handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(
+        200,
+        json={
+            "events": [
+                {
+                    "id": "ev-1",
+                    "title": "Alice PTO",
+                    "eventType": "leaves",
+                    "start": "2024-03-08T00:00:00",
+                    "end": "2024-03-12T00:00:00",
+                    "subCalendarId": "cal-1",
+                    "invitees": [{"displayName": "Alice"}],
+                }
+            ]
+        },
+    )
+
+
+class TestIncrementalSync:
+    @pytest.mark.asyncio
+    async def test_fetches_only_missing_windows(self):
+        client = ConfluenceExtendedClient(ConfluenceConfig(url=BASE, token="t"))
+        async with respx.mock(base_url=BASE) as router:
+            router.get("/rest/calendar-services/1.0/calendar/subcalendars.json").mock(
+                return_value=httpx.Response(200, json=_CALENDARS)
+            )
+            route = router.get("/rest/calendar-services/1.0/calendar/events.json").mock(
+                side_effect=_events_handler
+            )
+            first = await client.get_time_off_events("2024-03-01", "2024-03-10")
+            second = await client.get_time_off_events("2024-03-05", "2024-03-15")
+            third = await client.get_time_off_events("2024-03-09", "2024-03-09")
+
+        params = [c.request.url.params for c in route.calls]
+        windows = [(p["start"], p["end"]) for p in params]
+        assert windows == [("2024-03-01", "2024-03-10"), ("2024-03-11", "2024-03-15")]
+        # The event spans both windows but is stored once.
+        assert [e["id"] for e in first] == ["ev-1"]
+        assert [e["id"] for e in second] == ["ev-1"]
+        assert [e["person_name"] for e in third] == ["Alice"]
+        stats = client.stats()["time_off_store"]
+        assert stats["events"] == 1
+        assert stats["windows_fetched"] == 2
+
+    @pytest.mark.asyncio
+    async def test_disabled_fetches_every_time(self):
+        client = ConfluenceExtendedClient(
+            ConfluenceConfig(url=BASE, token="t", time_off_ttl=0, etag_cache_mb=0)
+        )
+        assert client.time_off is None
+        async with respx.mock(base_url=BASE) as router:
+            router.get("/rest/calendar-services/1.0/calendar/subcalendars.json").mock(
+                return_value=httpx.Response(200, json=_CALENDARS)
+            )
+            route = router.get("/rest/calendar-services/1.0/calendar/events.json").mock(
+                side_effect=_events_handler
+            )
+            await client.get_time_off_events("2024-03-01", "2024-03-10")
+            await client.get_time_off_events("2024-03-01", "2024-03-10")
+        assert route.call_count == 2
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
@@ -305,14 +306,12 @@ class TestMoveToSprint:
 class TestSearchUsers:
     async def test_happy_path(self, tool_client):
         client, router = tool_client
+        users = [
+            {"displayName": "Alice", "accountId": "abc123"},
+            {"displayName": "Bob", "accountId": "def456"},
+        ]
         router.get("/rest/api/2/user/search").mock(
-            return_value=Response(
-                200,
-                json=[
-                    {"displayName": "Alice", "accountId": "abc123"},
-                    {"displayName": "Bob", "accountId": "def456"},
-                ],
-            )
+            side_effect=[Response(200, json=users), Response(200, json=[])]
         )
         result = await client.call_tool("jira_search_users", {"query": "ali"})
         parsed = _parse(result)
@@ -377,6 +376,23 @@ class TestErrorHints:
         assert "hint" in parsed
         assert "rate" in parsed["hint"].lower() or "wait" in parsed["hint"].lower()
 
+    async def test_rate_limit_hint_reports_retries(self, tool_client, monkeypatch):
+        from mcp_atlassian_extended.clients import base
+
+        async def no_sleep(delay: float) -> None:
+            return None
+
+        monkeypatch.setattr(base, "_sleep", no_sleep)
+        client, router = tool_client
+        route = router.get("/rest/api/2/issue/PROJ-123").mock(
+            return_value=Response(429, headers={"Retry-After": "1"}, text="Too Many Requests")
+        )
+        result = await client.call_tool("jira_get_attachments", {"issue_key": "PROJ-123"})
+        parsed = _parse(result)
+        assert route.call_count == 4
+        assert parsed["retries"] == 3
+        assert "3 automatic retries" in parsed["hint"]
+
     async def test_conflict_hint(self, tool_client):
         client, router = tool_client
         router.post("/rest/api/2/issue").mock(return_value=Response(409, text="Conflict"))
@@ -495,6 +511,116 @@ class TestUploadAttachmentHappy:
         assert isinstance(parsed, list)
         assert parsed[0]["filename"] == "test-upload.txt"
 
+    async def test_reports_progress(self, tool_client, tmp_path):
+        client, router = tool_client
+        upload_file = tmp_path / "test-upload.txt"
+        upload_file.write_text("hello world")
+        router.post("/rest/api/2/issue/PROJ-123/attachments").mock(
+            return_value=Response(200, json=[{"id": "1"}])
+        )
+        updates: list[tuple[float, float | None]] = []
+
+        async def on_progress(progress, total, message):
+            updates.append((progress, total))
+
+        await client.call_tool(
+            "jira_upload_attachment",
+            {"issue_key": "PROJ-123", "file_path": str(upload_file)},
+            progress_handler=on_progress,
+        )
+        assert updates == [(11, 11)]
+
+
+class TestUploadAttachments:
+    async def test_skips_existing_and_duplicates(self, tool_client, tmp_path, monkeypatch):
+        client, router = tool_client
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "build").mkdir()
+        (tmp_path / "build" / "app.log").write_text("log")
+        (tmp_path / "build" / "report.txt").write_text("report")
+        (tmp_path / "other").mkdir()
+        (tmp_path / "other" / "app.log").write_text("LOG")
+        router.get("/rest/api/2/issue/PROJ-1").mock(
+            return_value=Response(
+                200,
+                json={"fields": {"attachment": [{"id": "9", "filename": "report.txt", "size": 6}]}},
+            )
+        )
+        post = router.post("/rest/api/2/issue/PROJ-1/attachments").mock(
+            return_value=Response(200, json=[{"id": "10"}])
+        )
+        updates: list[tuple[float, float | None]] = []
+
+        async def on_progress(progress, total, message):
+            updates.append((progress, total))
+
+        result = await client.call_tool(
+            "jira_upload_attachments",
+            {
+                "issue_key": "PROJ-1",
+                "file_paths": ["other/app.log", "missing.bin", "build/report.txt"],
+                "pattern": "build/*",
+            },
+            progress_handler=on_progress,
+        )
+        parsed = _parse(result)
+        assert post.call_count == 1
+        assert [u["file"] for u in parsed["uploaded"]] == ["other/app.log"]
+        assert parsed["uploaded"][0]["attachment_id"] == "10"
+        assert sorted((s["file"], s["reason"]) for s in parsed["skipped"]) == [
+            ("build/app.log", "duplicate"),
+            ("build/report.txt", "duplicate"),
+            ("build/report.txt", "exists"),
+        ]
+        assert [f["file"] for f in parsed["failed"]] == ["missing.bin"]
+        assert parsed["total_bytes"] == 3
+        assert updates[-1] == (3, 3)
+
+    async def test_failed_upload_does_not_stop_others(self, tool_client, tmp_path, monkeypatch):
+        client, router = tool_client
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "a.txt").write_text("a")
+        (tmp_path / "b.txt").write_text("bb")
+        router.get("/rest/api/2/issue/PROJ-1").mock(
+            return_value=Response(200, json={"fields": {"attachment": []}})
+        )
+
+        def respond(request):
+            if b'filename="a.txt"' in request.content:
+                return Response(413, json={"errorMessages": ["too big"]})
+            return Response(200, json=[{"id": "11"}])
+
+        router.post("/rest/api/2/issue/PROJ-1/attachments").mock(side_effect=respond)
+        result = await client.call_tool(
+            "jira_upload_attachments", {"issue_key": "PROJ-1", "pattern": "*.txt"}
+        )
+        parsed = _parse(result)
+        assert [u["filename"] for u in parsed["uploaded"]] == ["b.txt"]
+        assert [f["filename"] for f in parsed["failed"]] == ["a.txt"]
+
+    async def test_glob_stops_past_the_cap(self, tool_client, tmp_path, monkeypatch):
+        client, _ = tool_client
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr("mcp_atlassian_extended.servers.jira_extended.MAX_BULK_UPLOADS", 2)
+        for name in "abcd":
+            (tmp_path / f"{name}.txt").write_text(name)
+        result = await client.call_tool(
+            "jira_upload_attachments", {"issue_key": "PROJ-1", "pattern": "*.txt"}
+        )
+        assert "More than 2 files selected" in _parse(result)["error"]
+
+    async def test_requires_files(self, tool_client):
+        client, _ = tool_client
+        result = await client.call_tool("jira_upload_attachments", {"issue_key": "PROJ-1"})
+        assert "file_paths" in _parse(result)["error"]
+
+    async def test_read_only_blocked(self, readonly_client):
+        client, _ = readonly_client
+        result = await client.call_tool(
+            "jira_upload_attachments", {"issue_key": "PROJ-1", "pattern": "*"}
+        )
+        assert "error" in _parse(result)
+
 
 class TestDownloadAttachment:
     async def test_happy_path(self, tool_client, tmp_path, monkeypatch):
@@ -516,6 +642,7 @@ class TestDownloadAttachment:
         parsed = _parse(result)
         assert parsed["status"] == "downloaded"
         assert parsed["size"] == len(file_content)
+        assert parsed["sha256"] == hashlib.sha256(file_content).hexdigest()
         assert (tmp_path / "doc.pdf").read_bytes() == file_content
 
     async def test_read_only_blocked(self, readonly_client):
@@ -531,6 +658,152 @@ class TestDownloadAttachment:
         assert "error" in parsed
 
 
+class TestDownloadAttachments:
+    async def test_bulk_manifest(self, tool_client, tmp_path, monkeypatch):
+        client, router = tool_client
+        monkeypatch.chdir(tmp_path)
+
+        def att(att_id, name, mime):
+            return {
+                "id": att_id,
+                "filename": name,
+                "mimeType": mime,
+                "content": f"{TEST_JIRA_URL}/secure/attachment/{att_id}/{name}",
+            }
+
+        search = router.get("/rest/api/2/search").mock(
+            return_value=Response(
+                200,
+                json={
+                    "startAt": 0,
+                    "maxResults": 3,
+                    "total": 2,
+                    "issues": [
+                        {
+                            "key": "PROJ-1",
+                            "fields": {
+                                "attachment": [
+                                    att("10", "spec.pdf", "application/pdf"),
+                                    att("11", "shot.png", "image/png"),
+                                ]
+                            },
+                        },
+                        {
+                            "key": "PROJ-2",
+                            "fields": {"attachment": [att("12", "broken.pdf", "application/pdf")]},
+                        },
+                    ],
+                },
+            )
+        )
+        router.get("/secure/attachment/10/spec.pdf").mock(
+            return_value=Response(200, content=b"spec")
+        )
+        router.get("/secure/attachment/12/broken.pdf").mock(return_value=Response(500))
+
+        result = await client.call_tool(
+            "jira_download_attachments",
+            {
+                "issue_keys": ["PROJ-1", "proj-2", "PROJ-3"],
+                "filename_pattern": "*.PDF",
+                "target_dir": "out",
+            },
+        )
+        parsed = _parse(result)
+        assert search.call_count == 1
+        assert "key in (PROJ-1,PROJ-2,PROJ-3)" in search.calls[0].request.url.params["jql"]
+        assert parsed["count"] == 1
+        assert parsed["files"][0]["sha256"] == hashlib.sha256(b"spec").hexdigest()
+        assert (tmp_path / "out" / "PROJ-1" / "spec.pdf").read_bytes() == b"spec"
+        assert [f["attachment_id"] for f in parsed["failed"]] == ["12"]
+        assert parsed["missing_issues"] == ["PROJ-3"]
+
+    async def test_cloud_search_jql_fallback(self, tool_client, tmp_path, monkeypatch):
+        client, router = tool_client
+        monkeypatch.chdir(tmp_path)
+        legacy = router.get("/rest/api/2/search").mock(return_value=Response(410))
+
+        def page(request):
+            n = int(request.url.params.get("nextPageToken", 1))
+            issue = {
+                "key": f"PROJ-{n}",
+                "fields": {
+                    "attachment": [
+                        {
+                            "id": str(n),
+                            "filename": f"{n}.txt",
+                            "content": f"{TEST_JIRA_URL}/secure/attachment/{n}/{n}.txt",
+                        }
+                    ]
+                },
+            }
+            body = {"issues": [issue], "isLast": n == 2}
+            if n == 1:
+                body["nextPageToken"] = "2"
+            return Response(200, json=body)
+
+        search = router.get("/rest/api/2/search/jql").mock(side_effect=page)
+        router.get(url__regex=r".*/secure/attachment/\d+/.*").mock(
+            return_value=Response(200, content=b"x")
+        )
+
+        args = {"issue_keys": ["PROJ-1", "PROJ-2"], "target_dir": "out"}
+        parsed = _parse(await client.call_tool("jira_download_attachments", args))
+        assert parsed["count"] == 2
+        assert parsed["missing_issues"] == []
+        assert search.call_count == 2
+        assert search.calls[1].request.url.params["nextPageToken"] == "2"
+        assert "key in (PROJ-1,PROJ-2)" in search.calls[0].request.url.params["jql"]
+
+        # The client remembers the classic endpoint is gone.
+        await client.call_tool("jira_download_attachments", args)
+        assert legacy.call_count == 1
+
+    async def test_moved_issue_kept_under_requested_key(self, tool_client, tmp_path, monkeypatch):
+        client, router = tool_client
+        monkeypatch.chdir(tmp_path)
+        att = {
+            "id": "20",
+            "filename": "plan.txt",
+            "content": f"{TEST_JIRA_URL}/secure/attachment/20/plan.txt",
+        }
+        router.get("/rest/api/2/search").mock(
+            return_value=Response(
+                200,
+                json={"total": 1, "issues": [{"key": "NEW-5", "fields": {"attachment": [att]}}]},
+            )
+        )
+        router.get("/rest/api/2/issue/OLD-1").mock(
+            return_value=Response(200, json={"key": "NEW-5", "fields": {"attachment": [att]}})
+        )
+        router.get("/rest/api/2/issue/OLD-2").mock(return_value=Response(404))
+        router.get("/secure/attachment/20/plan.txt").mock(
+            return_value=Response(200, content=b"plan")
+        )
+
+        result = await client.call_tool(
+            "jira_download_attachments", {"issue_keys": ["OLD-1", "OLD-2"], "target_dir": "out"}
+        )
+        parsed = _parse(result)
+        assert parsed["files"][0]["issue_key"] == "OLD-1"
+        assert (tmp_path / "out" / "OLD-1" / "plan.txt").read_bytes() == b"plan"
+        assert parsed["missing_issues"] == ["OLD-2"]
+
+    async def test_rejects_escaping_target(self, tool_client):
+        client, _ = tool_client
+        result = await client.call_tool(
+            "jira_download_attachments", {"issue_keys": ["PROJ-1"], "target_dir": "../x"}
+        )
+        assert "traversal" in _parse(result)["error"]
+
+    async def test_rejects_invalid_keys(self, tool_client):
+        client, _ = tool_client
+        result = await client.call_tool(
+            "jira_download_attachments", {"issue_keys": ["PROJ-1) OR (1=1"]}
+        )
+        assert "Invalid issue keys" in _parse(result)["error"]
+
+
 class TestDeleteAttachment:
     async def test_happy_path(self, tool_client):
         client, router = tool_client
@@ -621,6 +894,68 @@ class TestBacklog:
         parsed = _parse(result)
         assert parsed["issues"][0]["key"] == "PROJ-10"
 
+    async def test_fetches_remaining_pages(self, tool_client):
+        client, router = tool_client
+
+        def page(request):
+            start = int(request.url.params["startAt"])
+            issues = [{"key": f"PROJ-{i}"} for i in range(start, min(start + 50, 120))]
+            return Response(200, json={"maxResults": 50, "total": 120, "issues": issues})
+
+        route = router.get("/rest/agile/1.0/board/42/backlog").mock(side_effect=page)
+        result = await client.call_tool("jira_backlog", {"board_id": 42, "max_results": 500})
+        parsed = _parse(result)
+        assert route.call_count == 3
+        assert parsed["total"] == 120
+        assert [i["key"] for i in parsed["issues"]][:2] == ["PROJ-0", "PROJ-1"]
+        assert parsed["issues"][-1]["key"] == "PROJ-119"
+
+    async def test_field_profiles(self, tool_client):
+        client, router = tool_client
+        route = router.get("/rest/agile/1.0/board/42/backlog").mock(
+            return_value=Response(
+                200,
+                json={
+                    "total": 1,
+                    "issues": [
+                        {
+                            "key": "PROJ-10",
+                            "self": "https://jira.example.com/rest/api/2/issue/10",
+                            "fields": {
+                                "summary": "Backlog item",
+                                "assignee": {"name": "alice", "avatarUrls": {"48x48": "x"}},
+                            },
+                        }
+                    ],
+                },
+            )
+        )
+        router.get("/rest/agile/1.0/board/42/configuration").mock(
+            return_value=Response(
+                200, json={"estimation": {"field": {"fieldId": "customfield_10004"}}}
+            )
+        )
+        parsed = _parse(await client.call_tool("jira_backlog", {"board_id": 42}))
+        assert route.calls[-1].request.url.params["fields"].startswith("summary,status")
+        assert parsed["issues"][0] == {
+            "key": "PROJ-10",
+            "fields": {"summary": "Backlog item", "assignee": {"name": "alice"}},
+        }
+
+        await client.call_tool("jira_backlog", {"board_id": 42, "fields": "planning"})
+        assert route.calls[-1].request.url.params["fields"].endswith(",customfield_10004")
+
+        parsed = _parse(await client.call_tool("jira_backlog", {"board_id": 42, "fields": "full"}))
+        assert route.calls[-1].request.url.params["fields"] == "*all"
+        assert "self" in parsed["issues"][0]
+
+        parsed = _parse(await client.call_tool("jira_backlog", {"board_id": 42, "fields": " Full"}))
+        assert route.calls[-1].request.url.params["fields"] == "*all"
+        assert "avatarUrls" in parsed["issues"][0]["fields"]["assignee"]
+
+        await client.call_tool("jira_backlog", {"board_id": 42, "fields": "summary, labels"})
+        assert route.calls[-1].request.url.params["fields"] == "summary,labels"
+
 
 # ═══════════════════════════════════════════════════════
 # Agile: Board Config
@@ -856,6 +1191,28 @@ class TestConfluenceGetTimeOff:
         assert "Alice Smith" in parsed["people"]
         assert "Bob Jones" in parsed["people"]
 
+    async def test_group_by_person_keeps_namesakes_apart(self, confluence_client):
+        client, router = confluence_client
+        namesake = {
+            **_SAMPLE_EVENTS["events"][1],
+            "id": "ev-3",
+            "invitees": [{"displayName": "Alice Smith", "email": "alice.smith@example.com"}],
+        }
+        router.get("/rest/calendar-services/1.0/calendar/subcalendars.json").mock(
+            return_value=Response(200, json=_SAMPLE_CALENDARS)
+        )
+        router.get("/rest/calendar-services/1.0/calendar/events.json").mock(
+            return_value=Response(200, json={"events": [_SAMPLE_EVENTS["events"][0], namesake]})
+        )
+        result = await client.call_tool(
+            "confluence_get_time_off",
+            {"start_date": "2024-03-01", "end_date": "2024-03-10", "group_by_person": True},
+        )
+        assert sorted(_parse(result)["people"]) == [
+            "Alice Smith (alice.smith@example.com)",
+            "Alice Smith (alice@example.com)",
+        ]
+
 
 class TestConfluenceWhoIsOut:
     async def test_happy_path(self, confluence_client):
@@ -867,6 +1224,33 @@ class TestConfluenceWhoIsOut:
         assert parsed["count"] == 2
         assert "Alice Smith" in parsed["people_out"]
         assert "Bob Jones" in parsed["people_out"]
+        assert "failed_calendars" not in parsed
+
+    async def test_reports_unreadable_calendar(self, confluence_client):
+        client, router = confluence_client
+        calendars = {
+            "payload": [
+                *_SAMPLE_CALENDARS["payload"],
+                {
+                    "subCalendar": {"id": "cal-3", "name": "Ops PTO", "typeKey": "leaves"},
+                    "childSubCalendars": [],
+                },
+            ]
+        }
+        router.get("/rest/calendar-services/1.0/calendar/subcalendars.json").mock(
+            return_value=Response(200, json=calendars)
+        )
+        router.get(
+            "/rest/calendar-services/1.0/calendar/events.json", params={"subCalendarId": "cal-3"}
+        ).mock(return_value=Response(403, text="denied"))
+        router.get("/rest/calendar-services/1.0/calendar/events.json").mock(
+            return_value=Response(200, json=_SAMPLE_EVENTS)
+        )
+        result = await client.call_tool("confluence_who_is_out", {"date": "2024-03-03"})
+        parsed = _parse(result)
+        assert parsed["count"] == 2
+        assert parsed["failed_calendars"][0]["calendar_name"] == "Ops PTO"
+        assert parsed["failed_calendars"][0]["status_code"] == 403
 
 
 class TestConfluenceGetPersonTimeOff:
@@ -925,6 +1309,23 @@ class TestConfluenceSprintCapacity:
         alice = next(m for m in parsed["member_breakdown"] if m["member"] == "Alice Smith")
         assert alice["days_off"] >= 1
 
+    async def test_match_by_exact_email(self, confluence_client):
+        client, router = confluence_client
+        _mock_confluence_calendars_and_events(router)
+        result = await client.call_tool(
+            "confluence_sprint_capacity",
+            {
+                "team_members": ["alice@example.com", "Bob Jones"],
+                "sprint_start": "2024-03-04",
+                "sprint_end": "2024-03-15",
+                "exact_email": True,
+            },
+        )
+        parsed = _parse(result)
+        alice, bob = parsed["member_breakdown"]
+        assert alice["days_off"] >= 1
+        assert bob["days_off"] == 0
+
     async def test_no_time_off(self, confluence_client):
         client, router = confluence_client
         router.get("/rest/calendar-services/1.0/calendar/subcalendars.json").mock(
@@ -947,6 +1348,111 @@ class TestConfluenceSprintCapacity:
         assert parsed["team"]["capacity_percentage"] == 100.0
 
 
+class TestConfluenceCapacityForecast:
+    async def test_cadence_fetches_leave_once(self, confluence_client):
+        client, router = confluence_client
+        router.get("/rest/calendar-services/1.0/calendar/subcalendars.json").mock(
+            return_value=Response(200, json=_SAMPLE_CALENDARS)
+        )
+        events = router.get("/rest/calendar-services/1.0/calendar/events.json").mock(
+            return_value=Response(200, json=_SAMPLE_EVENTS)
+        )
+        result = await client.call_tool(
+            "confluence_capacity_forecast",
+            {
+                "team_members": ["Alice Smith", "Bob Jones"],
+                "first_sprint_start": "2024-02-26",
+                "sprint_length_days": 7,
+                "sprint_count": 3,
+            },
+        )
+        parsed = _parse(result)
+        assert events.call_count == 1
+        assert events.calls[0].request.url.params["start"] == "2024-02-26"
+        assert events.calls[0].request.url.params["end"] == "2024-03-17"
+        assert [s["start"] for s in parsed["sprints"]] == ["2024-02-26", "2024-03-04", "2024-03-11"]
+        assert all(s["working_days"] == 5 for s in parsed["sprints"])
+        assert parsed["totals"]["working_days"] == 15
+        assert parsed["totals"]["max_capacity_days"] == 30
+        alice = parsed["sprints"][0]["members"][0]
+        assert alice["member"] == "Alice Smith"
+        assert alice["days_off"] >= 1
+
+    async def test_explicit_windows(self, confluence_client):
+        client, router = confluence_client
+        _mock_confluence_calendars_and_events(router)
+        result = await client.call_tool(
+            "confluence_capacity_forecast",
+            {
+                "team_members": ["Alice Smith"],
+                "sprints": ["2024-03-04/2024-03-08", "2024-03-11/2024-03-15"],
+            },
+        )
+        parsed = _parse(result)
+        assert parsed["range"] == {"start": "2024-03-04", "end": "2024-03-15"}
+        assert len(parsed["sprints"]) == 2
+
+    async def test_requires_windows(self, confluence_client):
+        client, _ = confluence_client
+        result = await client.call_tool(
+            "confluence_capacity_forecast", {"team_members": ["Alice Smith"]}
+        )
+        parsed = _parse(result)
+        assert "sprint_count" in parsed["error"]
+
+    async def test_rejects_inverted_or_mixed_windows(self, confluence_client):
+        client, _ = confluence_client
+        result = await client.call_tool(
+            "confluence_capacity_forecast",
+            {"team_members": ["Alice Smith"], "sprints": ["2024-03-15/2024-03-04"]},
+        )
+        assert "ends before it starts" in _parse(result)["error"]
+        result = await client.call_tool(
+            "confluence_capacity_forecast",
+            {
+                "team_members": ["Alice Smith"],
+                "sprints": ["2024-03-04/2024-03-15"],
+                "sprint_count": 2,
+            },
+        )
+        assert "not both" in _parse(result)["error"]
+
+
+class TestConfluenceTeamAvailability:
+    async def test_grid_per_member(self, confluence_client):
+        client, router = confluence_client
+        _mock_confluence_calendars_and_events(router)
+        result = await client.call_tool(
+            "confluence_team_availability",
+            {"start_date": "2024-03-01", "end_date": "2024-03-07"},
+        )
+        parsed = _parse(result)
+        # 2024-03-01 is a Friday.
+        assert parsed["members"]["Alice Smith"]["days"] == "x--xx.."
+        assert parsed["members"]["Bob Jones"]["days"] == ".--x..."
+        assert parsed["members"]["Alice Smith"]["available_days"] == 2
+        assert parsed["available_per_day"] == [1, 0, 0, 0, 1, 2, 2]
+
+    async def test_rle_and_limit(self, confluence_client):
+        client, router = confluence_client
+        _mock_confluence_calendars_and_events(router)
+        result = await client.call_tool(
+            "confluence_team_availability",
+            {
+                "start_date": "2024-03-01",
+                "end_date": "2024-03-07",
+                "team_members": ["bob"],
+                "encoding": "rle",
+            },
+        )
+        assert _parse(result)["members"]["bob"]["days"] == "1.2-1x3."
+        result = await client.call_tool(
+            "confluence_team_availability",
+            {"start_date": "2024-01-01", "end_date": "2025-06-01"},
+        )
+        assert "limit is 366" in _parse(result)["error"]
+
+
 # ═══════════════════════════════════════════════════════
 # Versions
 # ═══════════════════════════════════════════════════════
@@ -1027,3 +1533,19 @@ class TestUpdateVersion:
         )
         parsed = _parse(result)
         assert "error" in parsed
+
+
+# ═══════════════════════════════════════════════════════
+# Diagnostics
+# ═══════════════════════════════════════════════════════
+
+
+class TestClientStats:
+    async def test_reports_both_clients(self, tool_client):
+        client, router = tool_client
+        router.get("/rest/api/2/project").mock(return_value=Response(200, json=[]))
+        await client.call_tool("jira_list_projects", {})
+        result = await client.call_tool("atlassian_client_stats", {})
+        parsed = _parse(result)
+        assert parsed["jira"]["retry"]["requests"] == 1
+        assert parsed["confluence"]["retry"]["requests"] == 0
@@ -0,0 +1,91 @@
+"""Tests for bitmap working-day math."""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+import pytest
+
+from mcp_atlassian_extended.workdays import DayRange, run_length, to_date, weekmask
+
+
+def _reference(start: date, end: date, working_days_per_week: int, events) -> tuple[int, int]:
+    """The original day-by-day walk used by confluence_sprint_capacity."""
+    weekend_days = set(range(working_days_per_week, 7))
+    total = 0
+    d = start
+    while d <= end:
+        if d.weekday() not in weekend_days:
+            total += 1
+        d += timedelta(days=1)
+    off: set[date] = set()
+    for ev_start, ev_end in events:
+        d = max(ev_start, start)
+        while d <= min(ev_end, end):
+            if d.weekday() not in weekend_days:
+                off.add(d)
+            d += timedelta(days=1)
+    return total, len(off)
+
+
+def test_weekmask():
+    assert weekmask(5) == 0b0011111
+    assert weekmask(7) == 0b1111111
+    assert weekmask(1) == 0b0000001
+
+
+def test_to_date_formats():
+    assert to_date("2024-03-04") == date(2024, 3, 4)
+    assert to_date("2024-03-04T10:00:00") == date(2024, 3, 4)
+    assert to_date("March 4, 2024") == date(2024, 3, 4)
+
+
+def test_sprint_working_days():
+    sprint = DayRange("2024-03-04", "2024-03-15")  # two Mon-Fri weeks
+    assert sprint.working_days == 10
+    assert sprint.off_days([("2024-03-08", "2024-03-11")]) == 2  # Fri + Mon
+
+
+def test_overlapping_events_counted_once():
+    sprint = DayRange("2024-03-04", "2024-03-08")
+    assert sprint.off_days([("2024-03-04", "2024-03-06"), ("2024-03-05", "2024-03-07")]) == 4
+
+
+def test_events_outside_range_ignored():
+    sprint = DayRange("2024-03-04", "2024-03-08")
+    assert sprint.off_days([("2024-02-01", "2024-02-10"), ("2024-04-01", "2024-04-02")]) == 0
+
+
+def test_empty_and_inverted_ranges():
+    assert DayRange("2024-03-08", "2024-03-04").working_days == 0
+    assert DayRange("2024-03-09", "2024-03-09").working_days == 0  # Saturday
+
+
+def test_dates_from_bitmap():
+    sprint = DayRange("2024-03-04", "2024-03-10")
+    assert sprint.dates(sprint.working)[-1] == date(2024, 3, 8)
+
+
+@pytest.mark.parametrize("working_days_per_week", range(1, 8))
+def test_matches_day_by_day_walk(working_days_per_week):
+    base = date(2024, 1, 1)
+    for offset in range(0, 14, 3):
+        for length in (0, 1, 6, 13, 45, 100):
+            start = base + timedelta(offset)
+            end = start + timedelta(length)
+            events = [
+                (start - timedelta(2), start + timedelta(1)),
+                (start + timedelta(length // 2), start + timedelta(length // 2 + 4)),
+                (end - timedelta(1), end + timedelta(5)),
+            ]
+            sprint = DayRange(start, end, working_days_per_week)
+            expected = _reference(start, end, working_days_per_week, events)
+            assert (sprint.working_days, sprint.off_days(events)) == expected
+
+
+def test_grid_and_run_length():
+    week = DayRange("2024-03-04", "2024-03-10")  # Mon-Sun
+    out = week.span("2024-03-06", "2024-03-07") & week.working
+    assert week.grid(out) == "..xx.--"
+    assert run_length(week.grid(out)) == "2.2x1.2-"
+    assert run_length("") == ""